@@ -5,20 +5,54 @@
 """
 
 from __future__ import absolute_import
+import sys
 
 from ._error import TypeConversionError
 
 from ._align import Align
 from ._align_getter import align_getter
 from ._container import MinMaxContainer
+from ._container import MultisetMinMaxContainer
+from ._container import MomentContainer
+from ._sketch import HyperLogLog
 from ._typecode import Typecode
 
 from .converter import convert_value
 
 from ._data_property import ColumnDataProperty
 from ._data_property import DataProperty
+from ._data_property import get_typecode_and_str_len
 
+from ._serialize import dumps_column_property_list
+from ._serialize import loads_column_property_list
+
+from ._cache import ColumnPropertyCache
+from ._cache import fingerprint_file
+from ._cache import fingerprint_matrix
+
+from ._intern import StringInternTable
+
+from ._parallel import ExecutionProfile
+from ._parallel import ExecutorType
+from ._parallel import ShardType
+from ._parallel import SharedMatrix
+
+from ._base_extractor import BasePropertyExtractor
 from ._property_extractor import PropertyExtractor
+from ._property_extractor import IncrementalPropertyExtractor
+from ._matrix_view import DataPropertyMatrixView
+from ._batch import BatchPropertyExtractor
+from ._csv_extractor import CsvPropertyExtractor
+from ._multi_file_extractor import FileFormat
+from ._multi_file_extractor import MultiFilePropertyExtractor
+from ._columnar_extractor import ColumnarPropertyExtractor
+from ._record_extractor import RecordPropertyExtractor
+from ._sparse_extractor import SparsePropertyExtractor
+from ._sqlite_extractor import SqlitePropertyExtractor
+from ._tail_extractor import TailPropertyExtractor
+
+if sys.version_info >= (3, 5):
+    from ._async_extractor import AsyncPropertyExtractor
 
 from ._function import is_integer
 from ._function import is_hex
@@ -11,6 +11,12 @@ from ._typecode import Typecode
 
 
 class AlignGetter(object):
+    """
+    Typecode to align mapping that shared by the property classes.
+
+    The table is replaced as a whole by the setter, never modified in place,
+    so lookups from other threads always see either the old or the new table.
+    """
 
     @property
     def typecode_align_table(self):
@@ -18,7 +24,7 @@ class AlignGetter(object):
 
     @typecode_align_table.setter
     def typecode_align_table(self, x):
-        self.__typecode_align_table = x
+        self.__typecode_align_table = dict(x)
 
     def get_align_from_typecode(self, typecode):
         return self.__typecode_align_table.get(typecode, self.default_align)
@@ -0,0 +1,73 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import asyncio
+import time
+
+from ._property_extractor import IncrementalPropertyExtractor
+
+
+class AsyncPropertyExtractor(IncrementalPropertyExtractor):
+    """
+    :py:class:`~.IncrementalPropertyExtractor` that consumes rows from
+    an async iterator without blocking the event loop.
+
+    Without an ``executor``, rows are extracted in the event loop thread,
+    and control is returned to the loop when the extraction has run for
+    ``time_slice`` seconds. The check is done per row, so a slice can
+    exceed ``time_slice`` by the cost of a row.
+
+    With an ``executor`` (a ``concurrent.futures.ThreadPoolExecutor``),
+    rows are gathered into batches of ``batch_size`` rows and extracted
+    in the executor, so the costly conversions (e.g. datetime parsing)
+    never run in the event loop thread.
+    """
+
+    def __init__(self):
+        super(AsyncPropertyExtractor, self).__init__()
+
+        self.time_slice = 0.005
+        self.batch_size = 256
+        self.executor = None
+
+    async def append_rows_async(self, async_row_iter):
+        """
+        :param async_row_iter: Async iterable of rows to append.
+        :return: Updated column properties.
+        :rtype: list of :py:class:`~.ColumnDataProperty`
+        """
+
+        if self.executor is None:
+            await self.__append_rows_inline(async_row_iter)
+        else:
+            await self.__append_rows_by_executor(async_row_iter)
+
+        return self.column_property_list
+
+    async def __append_rows_inline(self, async_row_iter):
+        slice_start = time.monotonic()
+
+        async for row in async_row_iter:
+            self.append_rows((row,))
+
+            if time.monotonic() - slice_start >= self.time_slice:
+                await asyncio.sleep(0)
+                slice_start = time.monotonic()
+
+    async def __append_rows_by_executor(self, async_row_iter):
+        loop = asyncio.get_event_loop()
+        batch = []
+
+        async for row in async_row_iter:
+            batch.append(row)
+
+            if len(batch) >= self.batch_size:
+                await loop.run_in_executor(
+                    self.executor, self.append_rows, batch)
+                batch = []
+
+        if batch:
+            await loop.run_in_executor(self.executor, self.append_rows, batch)
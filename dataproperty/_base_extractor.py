@@ -0,0 +1,182 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+import abc
+import math
+
+import six
+from six.moves import range
+
+from ._cache import fingerprint_file
+from ._data_property import DataProperty
+from ._data_property import ColumnDataProperty
+from ._data_property import get_typecode_and_str_len
+from ._function import is_empty_list_or_tuple
+from ._parallel import ExecutorType
+from ._parallel import pad_column_property_list
+
+
+@six.add_metaclass(abc.ABCMeta)
+class BasePropertyExtractor(object):
+    """
+    Base class of the column property extractors: the extraction options,
+    the cache, and the creation of the column properties that shared by
+    the extractors of the various inputs.
+
+    If ``cache`` is a :py:class:`~.ColumnPropertyCache` instance,
+    the results of :py:meth:`.extract_column_property_list` are cached with
+    a key that derived from the extraction options and a fingerprint of
+    the input: the file of ``source_path`` if it is set, otherwise
+    the input of the extractor.
+
+    With ``is_width_only``, only the type and the width of each cell are
+    computed (:py:func:`~.get_typecode_and_str_len`) for the column
+    properties: ``typecode``, ``align`` and ``padding_len`` are the same as
+    the full extraction, while the digits and the value statistics of
+    the body are not collected.
+
+    The results of the last extraction, such as how it is executed, are
+    stored in ``execution_profile`` (:py:class:`~.ExecutionProfile`).
+    """
+
+    def __init__(self):
+        self.header_list = []
+        self.min_padding_len = 0
+        self.none_value = None
+        self.is_convert = True
+        self.is_width_only = False
+        self.is_removable = False
+        self.distinct_precision = None
+        self.cache = None
+        self.source_path = None
+        self.executor_type = ExecutorType.SERIAL
+        self.max_workers = None
+        self.chunk_size = None
+        self.execution_profile = None
+
+    def extract_column_property_list(self):
+        if self.cache is None:
+            return self._extract_column_property_list()
+
+        cache_key = self.__get_cache_key()
+        column_prop_list = self.cache.get(cache_key)
+        if column_prop_list is not None:
+            return column_prop_list
+
+        column_prop_list = self._extract_column_property_list()
+        self.cache.set(cache_key, column_prop_list)
+
+        return column_prop_list
+
+    @abc.abstractmethod
+    def _extract_column_property_list(self):   # pragma: no cover
+        pass
+
+    def _get_option_list(self):
+        return [
+            self.header_list,
+            self.min_padding_len,
+            self.none_value,
+            self.is_convert,
+            self.is_removable,
+            self.distinct_precision,
+            self.is_width_only,
+        ]
+
+    def _get_worker_option_table(self):
+        return {
+            "min_padding_len": self.min_padding_len,
+            "none_value": self.none_value,
+            "is_convert": self.is_convert,
+            "is_removable": self.is_removable,
+            "distinct_precision": self.distinct_precision,
+            "is_width_only": self.is_width_only,
+        }
+
+    def _get_source_fingerprint(self):
+        if not self.source_path:
+            raise ValueError("cache requires source_path")
+
+        return fingerprint_file(self.source_path)
+
+    def _get_chunk_size(self, item_count, max_workers):
+        if self.chunk_size:
+            return self.chunk_size
+
+        # a few chunks per worker to balance the load
+        return max(1, int(math.ceil(float(item_count) / (max_workers * 4))))
+
+    def _extract_column_property_list_from_columns(self, column_matrix):
+        column_prop_list = []
+
+        for data_list in column_matrix:
+            column_prop = ColumnDataProperty(
+                min_padding_len=self.min_padding_len,
+                is_removable=self.is_removable,
+                distinct_precision=self.distinct_precision)
+
+            cell_count = 0
+            for data in data_list:
+                if data is not None:
+                    self._update_column_body(column_prop, data)
+                cell_count += 1
+
+            pad_column_property_list(
+                [column_prop], cell_count, self.none_value)
+            column_prop_list.append(column_prop)
+
+        return column_prop_list
+
+    def _create_column_property_list(self, column_count, header_list=None):
+        if header_list is None:
+            header_list = self.header_list
+
+        header_prop_list = self._extract_data_property_list(header_list)
+        column_prop_list = []
+
+        for col_idx in range(column_count):
+            column_prop = ColumnDataProperty(
+                min_padding_len=self.min_padding_len,
+                is_removable=self.is_removable,
+                distinct_precision=self.distinct_precision)
+
+            if col_idx < len(header_prop_list):
+                # columns beyond the header have no header
+                column_prop.update_header(header_prop_list[col_idx])
+
+            column_prop_list.append(column_prop)
+
+        return column_prop_list
+
+    def _extract_data_property_list(
+            self, data_list, is_retain_data=True, string_intern_table=None):
+        if is_empty_list_or_tuple(data_list):
+            return []
+
+        return [
+            DataProperty(
+                data, self.none_value, self.is_convert,
+                is_retain_data=is_retain_data,
+                string_intern_table=string_intern_table)
+            for data in data_list
+        ]
+
+    def _update_column_body(self, column_prop, data, count=1, is_convert=None):
+        if is_convert is None:
+            is_convert = self.is_convert
+
+        if self.is_width_only:
+            typecode, str_len = get_typecode_and_str_len(
+                data, self.none_value, is_convert)
+            column_prop.update_body_width(typecode, str_len, count)
+        else:
+            column_prop.update_body(
+                DataProperty(data, self.none_value, is_convert), count)
+
+    def __get_cache_key(self):
+        return self.cache.make_key(
+            self._get_source_fingerprint(), self._get_option_list())
@@ -0,0 +1,185 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+import threading
+
+from ._parallel import ExecutorType
+from ._parallel import call_encoded
+from ._parallel import extract_table
+from ._parallel import get_cpu_count
+from ._parallel import warm_up_worker
+from ._serialize import loads_column_property_list
+
+
+class BatchPropertyExtractor(object):
+    """
+    Extract column properties of many tables on a long-lived worker pool.
+
+    The pool is created by the first extraction (or :py:meth:`.start`) and
+    kept until :py:meth:`.close`, and the workers are warmed up when they
+    start: the datetime parsing modules are imported, and the converter
+    caches (parse results and timezones) are shared by all of the tables
+    extracted by a worker.
+
+    Extraction options are shared by all of the tables.
+
+    .. code:: python
+
+        with BatchPropertyExtractor() as batch_extractor:
+            for idx, column_prop_list in batch_extractor.extract_iter(
+                    table_list):
+                ...
+    """
+
+    @property
+    def executor_type(self):
+        return self.__executor_type
+
+    @property
+    def max_workers(self):
+        return self.__max_workers
+
+    def __init__(self, executor_type=ExecutorType.PROCESS, max_workers=None):
+        if executor_type not in (ExecutorType.THREAD, ExecutorType.PROCESS):
+            raise ValueError("invalid executor type: %s" % (executor_type))
+
+        self.min_padding_len = 0
+        self.none_value = None
+        self.is_convert = True
+        self.is_removable = False
+        self.distinct_precision = None
+        self.is_width_only = False
+
+        #: maximum number of tables submitted to the pool at a time
+        self.max_pending = None
+
+        self.__executor_type = executor_type
+        self.__max_workers = max_workers or get_cpu_count()
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """
+        Create the worker pool if not created yet.
+        """
+
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = self.__create_executor()
+
+            return self.__executor
+
+    def close(self):
+        """
+        Shut down the worker pool.
+        """
+
+        with self.__lock:
+            if self.__executor is None:
+                return
+
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+
+    def extract_iter(self, table_iter):
+        """
+        :param table_iter:
+            Iterable of ``(header_list, data_matrix)`` pairs.
+        :return:
+            Generator of ``(index of the table, column properties)`` pairs
+            in completion order.
+        """
+
+        from concurrent.futures import FIRST_COMPLETED
+        from concurrent.futures import wait
+
+        executor = self.start()
+        option_table = self.__get_option_table()
+        max_pending = self.max_pending or self.__max_workers * 4
+        pending_table = {}
+
+        for idx, (header_list, data_matrix) in enumerate(table_iter):
+            future = self.__submit(
+                executor, header_list, list(data_matrix), option_table)
+            pending_table[future] = idx
+
+            while len(pending_table) >= max_pending:
+                done_set, _not_done_set = wait(
+                    pending_table, return_when=FIRST_COMPLETED)
+                for future in done_set:
+                    yield (
+                        pending_table.pop(future), self.__get_result(future))
+
+        while pending_table:
+            done_set, _not_done_set = wait(
+                pending_table, return_when=FIRST_COMPLETED)
+            for future in done_set:
+                yield (pending_table.pop(future), self.__get_result(future))
+
+    def extract(self, table_list):
+        """
+        :param table_list: List of ``(header_list, data_matrix)`` pairs.
+        :return: Column properties of each table in the order of the input.
+        :rtype: list of list of :py:class:`~.ColumnDataProperty`
+        """
+
+        result_list = [None] * len(table_list)
+        for idx, column_prop_list in self.extract_iter(table_list):
+            result_list[idx] = column_prop_list
+
+        return result_list
+
+    def __create_executor(self):
+        if self.__executor_type == ExecutorType.THREAD:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # threads share the caches of the calling process
+            warm_up_worker()
+
+            return ThreadPoolExecutor(self.__max_workers)
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        try:
+            return ProcessPoolExecutor(
+                self.__max_workers, initializer=warm_up_worker)
+        except TypeError:
+            # initializer is not supported by older versions
+            return ProcessPoolExecutor(self.__max_workers)
+
+    def __get_option_table(self):
+        return {
+            "min_padding_len": self.min_padding_len,
+            "none_value": self.none_value,
+            "is_convert": self.is_convert,
+            "is_removable": self.is_removable,
+            "distinct_precision": self.distinct_precision,
+            "is_width_only": self.is_width_only,
+        }
+
+    def __submit(self, executor, header_list, data_matrix, option_table):
+        if self.__executor_type == ExecutorType.THREAD:
+            return executor.submit(
+                extract_table, header_list, data_matrix, option_table)
+
+        return executor.submit(
+            call_encoded, extract_table, header_list, data_matrix,
+            option_table)
+
+    def __get_result(self, future):
+        if self.__executor_type == ExecutorType.THREAD:
+            return future.result()
+
+        return loads_column_property_list(future.result())
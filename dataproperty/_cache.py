@@ -0,0 +1,184 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+import errno
+import hashlib
+import os
+import tempfile
+
+from ._serialize import dumps_column_property_list
+from ._serialize import loads_column_property_list
+
+
+def fingerprint_file(file_path):
+    """
+    :return:
+        Fingerprint of a file from the absolute path, the modification time
+        and the size of the file. The file content is not read.
+    :rtype: str
+    """
+
+    stat = os.stat(file_path)
+    mtime = getattr(stat, "st_mtime_ns", stat.st_mtime)
+
+    return "file:%s:%s:%d" % (os.path.abspath(file_path), mtime, stat.st_size)
+
+
+def fingerprint_matrix(data_matrix):
+    """
+    :return: Hash of the ``repr`` of each row of the ``data_matrix``.
+    :rtype: str
+    """
+
+    hash_obj = hashlib.sha1()
+    for data_list in data_matrix:
+        hash_obj.update(repr(data_list).encode("utf-8"))
+        hash_obj.update(b"\n")
+
+    return "matrix:" + hash_obj.hexdigest()
+
+
+class ColumnPropertyCache(object):
+    """
+    Size-bounded on-disk cache of the results of
+    :py:meth:`~.PropertyExtractor.extract_column_property_list`.
+
+    Each entry is stored in a file of the ``cache_dir``.
+    If the total size of the entries exceeds ``max_size`` bytes,
+    the least recently used entries are removed.
+    """
+
+    FORMAT_VERSION = 2
+    __FILE_EXTENSION = ".colprop"
+
+    @property
+    def cache_dir(self):
+        return self.__cache_dir
+
+    @property
+    def max_size(self):
+        return self.__max_size
+
+    def __init__(self, cache_dir, max_size=64 * 1024 ** 2):
+        self.__cache_dir = cache_dir
+        self.__max_size = max_size
+
+        try:
+            os.makedirs(cache_dir)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def make_key(self, source_fingerprint, option_list):
+        """
+        :param str source_fingerprint:
+            Fingerprint of the input data.
+            e.g. the return value of :py:func:`.fingerprint_file`.
+        :param list option_list: Extraction options that affect the results.
+        :return: Cache key.
+        :rtype: str
+        """
+
+        hash_obj = hashlib.sha1()
+        hash_obj.update(repr([
+            self.FORMAT_VERSION, source_fingerprint, option_list,
+        ]).encode("utf-8"))
+
+        return hash_obj.hexdigest()
+
+    def get(self, key):
+        """
+        :return:
+            Cached column properties of the ``key``.
+            Returns ``None`` if the ``key`` is not cached.
+        :rtype: list of :py:class:`~.ColumnDataProperty`
+        """
+
+        file_path = self.__get_file_path(key)
+
+        try:
+            with open(file_path, "rb") as f:
+                column_prop_list = self._loads(f.read())
+        except (IOError, OSError):
+            return None
+        except Exception:
+            # broken entry
+            self.__remove(file_path)
+            return None
+
+        try:
+            # mark as recently used
+            os.utime(file_path, None)
+        except OSError:
+            pass
+
+        return column_prop_list
+
+    def set(self, key, column_prop_list):
+        fd, temp_path = tempfile.mkstemp(
+            suffix=".tmp", dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._dumps(column_prop_list))
+
+            getattr(os, "replace", os.rename)(
+                temp_path, self.__get_file_path(key))
+        except Exception:
+            self.__remove(temp_path)
+            raise
+
+        self.__evict()
+
+    def clear(self):
+        for file_path, _stat in self.__get_entry_list():
+            self.__remove(file_path)
+
+    @staticmethod
+    def _dumps(column_prop_list):
+        return dumps_column_property_list(column_prop_list)
+
+    @staticmethod
+    def _loads(data):
+        return loads_column_property_list(data)
+
+    def __get_file_path(self, key):
+        return os.path.join(self.cache_dir, key + self.__FILE_EXTENSION)
+
+    def __get_entry_list(self):
+        entry_list = []
+
+        for file_name in os.listdir(self.cache_dir):
+            if not file_name.endswith(self.__FILE_EXTENSION):
+                continue
+
+            file_path = os.path.join(self.cache_dir, file_name)
+            try:
+                entry_list.append((file_path, os.stat(file_path)))
+            except OSError:
+                # removed by another process
+                continue
+
+        return entry_list
+
+    def __evict(self):
+        entry_list = self.__get_entry_list()
+        total_size = sum(stat.st_size for _file_path, stat in entry_list)
+
+        for file_path, stat in sorted(
+                entry_list, key=lambda entry: entry[1].st_mtime):
+            if total_size <= self.max_size:
+                break
+
+            self.__remove(file_path)
+            total_size -= stat.st_size
+
+    @staticmethod
+    def __remove(file_path):
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
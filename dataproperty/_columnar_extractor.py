@@ -0,0 +1,141 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+from timeit import default_timer
+
+from ._base_extractor import BasePropertyExtractor
+from ._cache import fingerprint_matrix
+from ._function import is_list_or_tuple
+from ._parallel import ExecutionProfile
+from ._parallel import ExecutorType
+from ._parallel import ShardType
+from ._parallel import call_encoded
+from ._parallel import concat_column_property_list
+from ._parallel import extract_column_chunk
+from ._parallel import get_cpu_count
+from ._parallel import get_row_count
+from ._parallel import merge_column_property_list
+from ._parallel import pad_column_property_list
+from ._parallel import split_range
+from ._serialize import loads_column_property_list
+
+
+class ColumnarPropertyExtractor(BasePropertyExtractor):
+    """
+    Extract column properties from ``column_matrix``, a sequence of
+    columns (lists, arrays, generators, etc.), without transposing it
+    into rows: each :py:class:`~.ColumnDataProperty` is built directly
+    from its column.
+
+    Columns that are shorter than the longest column are padded
+    with ``None``.
+
+    With ``executor_type``, the columns are split into chunks of
+    ``chunk_size`` columns and extracted by ``max_workers`` worker
+    threads/processes. Columns are materialized as lists to send them to
+    worker processes. ``ExecutorType.AUTO`` uses a process pool if there
+    are multiple columns and CPUs, and at least ``100000`` cells.
+    """
+
+    __AUTO_PROCESS_MIN_CELL_COUNT = 100000
+
+    def __init__(self):
+        super(ColumnarPropertyExtractor, self).__init__()
+
+        self.column_matrix = []
+
+    def _get_source_fingerprint(self):
+        if self.source_path:
+            return super(
+                ColumnarPropertyExtractor, self)._get_source_fingerprint()
+
+        if not is_list_or_tuple(self.column_matrix):
+            self.column_matrix = list(self.column_matrix)
+
+        return fingerprint_matrix(self.column_matrix)
+
+    def _extract_column_property_list(self):
+        start_time = default_timer()
+        profile = ExecutionProfile()
+        profile.shard_type = ShardType.COLUMN
+        profile.max_workers = self.max_workers or get_cpu_count()
+
+        column_list = list(self.column_matrix)
+        profile.executor_type = self.__get_executor_type(
+            column_list, profile.max_workers)
+
+        if profile.executor_type == ExecutorType.SERIAL:
+            body_prop_list = self._extract_column_property_list_from_columns(
+                column_list)
+        else:
+            body_prop_list = self.__extract_by_executor(profile, column_list)
+
+        pad_column_property_list(
+            body_prop_list, get_row_count(body_prop_list), self.none_value)
+
+        column_prop_list = merge_column_property_list(
+            self._create_column_property_list(len(body_prop_list)),
+            [body_prop_list])
+
+        profile.actual_time = default_timer() - start_time
+        self.execution_profile = profile
+
+        return column_prop_list
+
+    def __get_executor_type(self, column_list, max_workers):
+        if self.executor_type != ExecutorType.AUTO:
+            return self.executor_type
+
+        if len(column_list) < 2 or max_workers < 2:
+            return ExecutorType.SERIAL
+
+        try:
+            cell_count = sum([len(column) for column in column_list])
+        except TypeError:
+            # generators: the size is unknown
+            return ExecutorType.SERIAL
+
+        if cell_count >= self.__AUTO_PROCESS_MIN_CELL_COUNT:
+            return ExecutorType.PROCESS
+
+        return ExecutorType.SERIAL
+
+    def __extract_by_executor(self, profile, column_list):
+        option_table = self._get_worker_option_table()
+        profile.chunk_size = self._get_chunk_size(
+            len(column_list), profile.max_workers)
+        chunk_list = [
+            [list(column) for column in column_list[start:end]]
+            for start, end in split_range(
+                len(column_list), profile.chunk_size)
+        ]
+
+        if profile.executor_type == ExecutorType.THREAD:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(profile.max_workers) as executor:
+                future_list = [
+                    executor.submit(extract_column_chunk, chunk, option_table)
+                    for chunk in chunk_list
+                ]
+                result_list = [future.result() for future in future_list]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(profile.max_workers) as executor:
+                future_list = [
+                    executor.submit(
+                        call_encoded, extract_column_chunk, chunk,
+                        option_table)
+                    for chunk in chunk_list
+                ]
+                result_list = [
+                    loads_column_property_list(future.result())
+                    for future in future_list
+                ]
+
+        return concat_column_property_list(result_list)
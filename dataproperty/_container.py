@@ -4,6 +4,11 @@
 .. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
 """
 
+from __future__ import absolute_import
+import bisect
+
+from ._function import is_nan
+
 
 class MinMaxContainer(object):
     __slots__ = ("__min_value", "__max_value")
@@ -56,7 +61,13 @@ class MinMaxContainer(object):
         except TypeError:
             return float("nan")
 
-    def update(self, value):
+    def update(self, value, count=1):
+        """
+        :param int count:
+            Number of occurrences of the ``value``. Not used by this class
+            since only the min/max values are kept.
+        """
+
         if value is None:
             return
 
@@ -69,3 +80,239 @@ class MinMaxContainer(object):
             self.__max_value = value
         else:
             self.__max_value = max(self.__max_value, value)
+
+    def merge(self, other):
+        """
+        Merge the values of another container into the container.
+        """
+
+        self.update(other.min_value)
+        self.update(other.max_value)
+
+    def _write_state(self, writer):
+        writer.write_value(self.__min_value)
+        writer.write_value(self.__max_value)
+
+    def _read_state(self, reader):
+        self.__min_value = reader.read_value()
+        self.__max_value = reader.read_value()
+
+
+class MultisetMinMaxContainer(MinMaxContainer):
+    """
+    A :py:class:`.MinMaxContainer` that keeps the number of occurrences
+    for each value, so values can be removed as well as added.
+
+    The distinct values are kept in a sorted list, and ``None``/``NaN``
+    values are ignored since those are not orderable.
+    """
+
+    __slots__ = ("__count_table", "__sorted_value_list")
+
+    @property
+    def min_value(self):
+        if not self.__sorted_value_list:
+            return None
+
+        return self.__sorted_value_list[0]
+
+    @property
+    def max_value(self):
+        if not self.__sorted_value_list:
+            return None
+
+        return self.__sorted_value_list[-1]
+
+    @property
+    def count_table(self):
+        """
+        :return: Number of occurrences for each value.
+        :rtype: dict
+        """
+
+        return dict(self.__count_table)
+
+    def __init__(self, value_list=[]):
+        self.__count_table = {}
+        self.__sorted_value_list = []
+
+        super(MultisetMinMaxContainer, self).__init__(value_list)
+
+    def update(self, value, count=1):
+        if value is None or is_nan(value):
+            return
+
+        current_count = self.__count_table.get(value, 0)
+        if current_count == 0:
+            bisect.insort(self.__sorted_value_list, value)
+
+        self.__count_table[value] = current_count + count
+
+    def count(self, value):
+        """
+        :return: Number of occurrences of the ``value``.
+        :rtype: int
+        """
+
+        return self.__count_table.get(value, 0)
+
+    def remove(self, value):
+        """
+        Remove an occurrence of the ``value``.
+
+        :raises ValueError: If the ``value`` is not in the container.
+        """
+
+        if value is None or is_nan(value):
+            return
+
+        count = self.__count_table.get(value, 0)
+        if count == 0:
+            raise ValueError("value not found: %s" % (value))
+
+        if count > 1:
+            self.__count_table[value] = count - 1
+            return
+
+        del self.__count_table[value]
+        del self.__sorted_value_list[
+            bisect.bisect_left(self.__sorted_value_list, value)]
+
+    def merge(self, other):
+        try:
+            count_table = other.count_table
+        except AttributeError:
+            # other is a MinMaxContainer: only min/max are available
+            count_table = dict(
+                (value, 1) for value in (other.min_value, other.max_value)
+                if value is not None)
+
+        for value, count in count_table.items():
+            if count <= 0:
+                continue
+
+            current_count = self.__count_table.get(value, 0)
+            if current_count == 0:
+                bisect.insort(self.__sorted_value_list, value)
+
+            self.__count_table[value] = current_count + count
+
+    def _write_state(self, writer):
+        writer.write_uint(len(self.__sorted_value_list))
+        for value in self.__sorted_value_list:
+            writer.write_value(value)
+            writer.write_uint(self.__count_table[value])
+
+    def _read_state(self, reader):
+        self.__count_table = {}
+        self.__sorted_value_list = []
+
+        for _i in range(reader.read_uint()):
+            value = reader.read_value()
+            self.__count_table[value] = reader.read_uint()
+            self.__sorted_value_list.append(value)
+
+
+class MomentContainer(object):
+    """
+    Streaming count/mean/variance of numeric values by
+    the Welford's algorithm. ``None``/``NaN`` values are ignored.
+    """
+
+    __slots__ = ("__count", "__mean", "__m2")
+
+    @property
+    def count(self):
+        return self.__count
+
+    def __init__(self, value_list=[]):
+        self.__count = 0
+        self.__mean = 0.0
+        self.__m2 = 0.0
+
+        for value in value_list:
+            self.update(value)
+
+    def __repr__(self):
+        return ", ".join([
+            "count=" + str(self.count),
+            "mean=" + str(self.mean()),
+            "variance=" + str(self.variance()),
+        ])
+
+    def mean(self):
+        if self.__count == 0:
+            return float("nan")
+
+        return self.__mean
+
+    def variance(self):
+        """
+        :return: Population variance of the values.
+        :rtype: float
+        """
+
+        if self.__count == 0:
+            return float("nan")
+
+        return self.__m2 / self.__count
+
+    def update(self, value, count=1):
+        """
+        :param int count: Number of occurrences of the ``value``.
+        """
+
+        if value is None or is_nan(value):
+            return
+
+        self.__count += count
+        delta = value - self.__mean
+        self.__mean += delta * count / self.__count
+        self.__m2 += delta * (value - self.__mean) * count
+
+    def remove(self, value):
+        if value is None or is_nan(value):
+            return
+
+        if self.__count <= 1:
+            self.__init__()
+            return
+
+        old_mean = self.__mean
+        self.__count -= 1
+        self.__mean = (old_mean * (self.__count + 1) - value) / self.__count
+        self.__m2 = max(
+            0.0, self.__m2 - (value - old_mean) * (value - self.__mean))
+
+    def merge(self, other):
+        """
+        Merge the values of another container into the container
+        by the Chan's parallel algorithm.
+        """
+
+        if other.count == 0:
+            return
+
+        if self.__count == 0:
+            self.__count = other.count
+            self.__mean = other.mean()
+            self.__m2 = other.variance() * other.count
+            return
+
+        count = self.__count + other.count
+        delta = other.mean() - self.__mean
+        self.__mean += delta * other.count / count
+        self.__m2 += (
+            other.variance() * other.count +
+            delta ** 2 * self.__count * other.count / count)
+        self.__count = count
+
+    def _write_state(self, writer):
+        writer.write_uint(self.__count)
+        writer.write_float(self.__mean)
+        writer.write_float(self.__m2)
+
+    def _read_state(self, reader):
+        self.__count = reader.read_uint()
+        self.__mean = reader.read_float()
+        self.__m2 = reader.read_float()
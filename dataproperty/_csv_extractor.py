@@ -0,0 +1,308 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+import csv
+import io
+import mmap
+import os
+from timeit import default_timer
+
+import six
+
+from ._base_extractor import BasePropertyExtractor
+from ._parallel import ExecutionProfile
+from ._parallel import ExecutorType
+from ._parallel import _create_worker_extractor
+from ._parallel import call_encoded
+from ._parallel import get_cpu_count
+from ._parallel import merge_column_property_list
+from ._serialize import loads_column_property_list
+
+
+def _find_record_end(buf, start, pos, quotechar, delimiter):
+    """
+    Find the end of a record as the ``csv`` module reads it: a quote
+    starts a quoted field only at the start of a field, and a doubled
+    quote (``""``) inside a quoted field is an escaped quote. Other quotes
+    (e.g. ``5"inch``) are a part of the field.
+
+    :param int start: Start of a record.
+    :param int pos: Position to start searching for the line break.
+    :return:
+        Position next to the first line break at or after ``pos`` that is
+        not inside a quoted field, where ``start`` is the start of
+        a record. ``-1`` if there is no such line break.
+    :rtype: int
+    """
+
+    field_start_list = (delimiter, b"\n", b"\r")
+    is_quoted = False
+    search_pos = start
+
+    while True:
+        quote_pos = buf.find(quotechar, search_pos)
+
+        if not is_quoted:
+            newline_pos = buf.find(b"\n", max(search_pos, pos))
+            if newline_pos != -1 and (
+                    quote_pos == -1 or newline_pos < quote_pos):
+                return newline_pos + 1
+
+        if quote_pos == -1:
+            return -1
+
+        search_pos = quote_pos + 1
+
+        if is_quoted:
+            if buf[search_pos:search_pos + 1] == quotechar:
+                # escaped quote
+                search_pos += 1
+            else:
+                is_quoted = False
+        elif quote_pos == start or (
+                buf[quote_pos - 1:quote_pos] in field_start_list):
+            is_quoted = True
+
+
+def split_csv_range(buf, chunk_byte_size, quotechar, start=0, delimiter=b","):
+    """
+    Split ``buf[start:]`` into ranges of about ``chunk_byte_size`` bytes
+    at line breaks outside of quoted fields, where ``start`` is the start
+    of a record.
+
+    :return: List of ``(start, end)`` byte ranges.
+    :rtype: list of tuple
+    """
+
+    size = len(buf)
+    range_list = []
+
+    while start < size:
+        end = start + chunk_byte_size
+        if end < size:
+            end = _find_record_end(buf, start, end, quotechar, delimiter)
+
+        if end == -1 or end > size:
+            end = size
+
+        range_list.append((start, end))
+        start = end
+
+    return range_list
+
+
+def _read_csv_row_list(buf, start, end, csv_option_table):
+    encoding = csv_option_table["encoding"]
+
+    if six.PY2:
+        reader = csv.reader(
+            io.BytesIO(buf[start:end]),
+            delimiter=csv_option_table["delimiter"].encode(encoding),
+            quotechar=csv_option_table["quotechar"].encode(encoding))
+
+        return [
+            [cell.decode(encoding) for cell in row]
+            for row in reader if row
+        ]
+
+    reader = csv.reader(
+        io.StringIO(buf[start:end].decode(encoding), newline=""),
+        delimiter=csv_option_table["delimiter"],
+        quotechar=csv_option_table["quotechar"])
+
+    # blank lines are skipped as with csv.DictReader
+    return [row for row in reader if row]
+
+
+def extract_csv_chunk(file_path, start, end, csv_option_table, option_table):
+    """
+    Worker function: extract column properties of the rows in the byte
+    range ``[start, end)`` of a CSV file, without the header.
+
+    :return: Column properties. Empty if the range has no rows.
+    """
+
+    with open(file_path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            row_list = _read_csv_row_list(buf, start, end, csv_option_table)
+        finally:
+            buf.close()
+
+    extractor = _create_worker_extractor(option_table)
+    extractor.data_matrix = row_list
+
+    return extractor._extract_column_property_list_serial()
+
+
+class CsvPropertyExtractor(BasePropertyExtractor):
+    """
+    Extract column properties from the CSV file of ``source_path``
+    without loading the whole file.
+
+    The file is memory-mapped and split into chunks of about
+    ``chunk_byte_size`` bytes at line breaks outside of quoted fields,
+    each chunk is parsed and extracted independently, and the chunk
+    results are merged. Peak memory is bounded by the chunk size
+    (times the number of workers), not by the file size.
+
+    If ``header_list`` is empty, the first record of the file is used as
+    the header. Otherwise every record is a data row.
+
+    ``executor_type`` works as with :py:class:`~.PropertyExtractor`,
+    with chunks of the file as the unit of work: workers map the file
+    by themselves, so no rows are sent to them. ``ExecutorType.AUTO``
+    uses a process pool if the file has multiple chunks and there are
+    multiple CPUs.
+
+    ``encoding`` must be ASCII compatible (e.g. ``utf-8``),
+    since the file is split on raw bytes.
+    """
+
+    def __init__(self):
+        super(CsvPropertyExtractor, self).__init__()
+
+        self.encoding = "utf-8"
+        self.delimiter = ","
+        self.quotechar = '"'
+        self.chunk_byte_size = 4 * 1024 ** 2
+
+    def _get_option_list(self):
+        return super(CsvPropertyExtractor, self)._get_option_list() + [
+            self.encoding,
+            self.delimiter,
+            self.quotechar,
+        ]
+
+    def _extract_column_property_list(self):
+        start_time = default_timer()
+        profile = ExecutionProfile()
+
+        header_list, body_prop_list = self._extract_header_and_body(profile)
+        column_prop_list = merge_column_property_list(
+            self._create_column_property_list(
+                len(body_prop_list), header_list),
+            [body_prop_list])
+
+        profile.actual_time = default_timer() - start_time
+        self.execution_profile = profile
+
+        return column_prop_list
+
+    def _extract_header_and_body(self, profile):
+        """
+        :return:
+            The header of the file, and the column properties of
+            the data rows without the header.
+        :rtype: tuple
+        """
+
+        profile.chunk_size = self.chunk_byte_size
+
+        if os.path.getsize(self.source_path) == 0:
+            profile.executor_type = ExecutorType.SERIAL
+            return (self.header_list, [])
+
+        csv_option_table = self.__get_csv_option_table()
+        quotechar = self.quotechar.encode(self.encoding)
+        delimiter = self.delimiter.encode(self.encoding)
+
+        with open(self.source_path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                header_list = self.header_list
+                data_start = 0
+                if not header_list:
+                    data_start = _find_record_end(
+                        buf, 0, 0, quotechar, delimiter)
+                    if data_start == -1:
+                        data_start = len(buf)
+                    row_list = _read_csv_row_list(
+                        buf, 0, data_start, csv_option_table)
+                    header_list = row_list[0] if row_list else []
+
+                range_list = split_csv_range(
+                    buf, self.chunk_byte_size, quotechar, data_start,
+                    delimiter)
+            finally:
+                buf.close()
+
+        profile.max_workers = self.max_workers or get_cpu_count()
+        profile.executor_type = self.__get_executor_type(
+            len(range_list), profile.max_workers)
+        chunk_result_list = self.__extract_chunk_list(
+            profile, range_list, csv_option_table)
+
+        # chunks without rows (e.g. only blank lines) are not counted
+        chunk_result_list = [
+            chunk_result for chunk_result in chunk_result_list
+            if chunk_result
+        ]
+        if not chunk_result_list:
+            return (header_list, [])
+
+        return (
+            header_list,
+            merge_column_property_list(
+                chunk_result_list[0], chunk_result_list[1:],
+                self.none_value),
+        )
+
+    def __get_executor_type(self, chunk_count, max_workers):
+        if self.executor_type != ExecutorType.AUTO:
+            return self.executor_type
+
+        if chunk_count > 1 and max_workers > 1:
+            return ExecutorType.PROCESS
+
+        return ExecutorType.SERIAL
+
+    def __extract_chunk_list(self, profile, range_list, csv_option_table):
+        option_table = self._get_worker_option_table()
+
+        if profile.executor_type == ExecutorType.SERIAL:
+            return [
+                extract_csv_chunk(
+                    self.source_path, start, end, csv_option_table,
+                    option_table)
+                for start, end in range_list
+            ]
+
+        if profile.executor_type == ExecutorType.THREAD:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(profile.max_workers) as executor:
+                future_list = [
+                    executor.submit(
+                        extract_csv_chunk, self.source_path, start, end,
+                        csv_option_table, option_table)
+                    for start, end in range_list
+                ]
+
+                return [future.result() for future in future_list]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(profile.max_workers) as executor:
+            future_list = [
+                executor.submit(
+                    call_encoded, extract_csv_chunk, self.source_path,
+                    start, end, csv_option_table, option_table)
+                for start, end in range_list
+            ]
+
+            return [
+                loads_column_property_list(future.result())
+                for future in future_list
+            ]
+
+    def __get_csv_option_table(self):
+        return {
+            "encoding": self.encoding,
+            "delimiter": self.delimiter,
+            "quotechar": self.quotechar,
+        }
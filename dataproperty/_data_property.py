@@ -7,9 +7,14 @@
 from __future__ import absolute_import
 import math
 
+from ._align import Align
 from ._align_getter import align_getter
 from ._container import MinMaxContainer
+from ._container import MultisetMinMaxContainer
+from ._container import MomentContainer
 from ._interface import DataPeropertyInterface
+from ._serialize import read_object
+from ._sketch import HyperLogLog
 from ._typecode import Typecode
 from ._type_checker import FloatTypeChecker
 from ._type_checker_creator import IntegerTypeCheckerCreator
@@ -18,8 +23,109 @@ from ._type_checker_creator import DateTimeTypeCheckerCreator
 
 from .converter import convert_value
 from ._function import is_nan
+from ._function import get_integer_digit
 from ._function import get_number_of_digit
 from ._function import get_text_len
+from ._function import _get_significant_digits
+
+
+def _replace_tabs(data, tab_length):
+    try:
+        return data.replace("\t", " " * tab_length)
+    except (TypeError, AttributeError):
+        return data
+
+
+def _get_str_len(
+        typecode, data, integer_digits, decimal_places, additional_format_len):
+    if typecode == Typecode.INT:
+        return integer_digits + additional_format_len
+
+    if typecode == Typecode.FLOAT:
+        if any([integer_digits < 0, decimal_places < 0]):
+            raise ValueError()
+
+        float_len = integer_digits + decimal_places
+        if decimal_places > 0:
+            # for dot
+            float_len += 1
+
+        return float_len + additional_format_len
+
+    return get_text_len(data)
+
+
+def get_typecode_and_str_len(
+        data, none_value=None, is_convert=True,
+        replace_tabs_with_spaces=True, tab_length=2):
+    """
+    Width-only counterpart of :py:class:`.DataProperty`: the type is
+    determined with a single conversion, and the digits are counted only
+    for the types that require them (decimal places only for ``FLOAT``).
+
+    :return:
+        ``(typecode, str_len)`` that equal to those of
+        ``DataProperty(data, none_value, is_convert)``.
+    :rtype: tuple
+    """
+
+    if data is None:
+        typecode = Typecode.NONE
+        converted_data = none_value
+    else:
+        typecode = Typecode.STRING
+        converted_data = data
+
+        for checker_creator in _CHECKER_CREATOR_LIST:
+            checker = checker_creator.create(data, is_convert)
+            if checker.is_type():
+                typecode = checker.typecode
+                if checker._converted_value is not None:
+                    converted_data = checker._converted_value
+                break
+
+    if typecode == Typecode.INT:
+        try:
+            integer_digits = get_integer_digit(data)
+        except (ValueError, TypeError):
+            integer_digits = float("nan")
+
+        return (typecode, _get_str_len(
+            typecode, None, integer_digits, None,
+            _get_additional_format_len(converted_data)))
+
+    if typecode == Typecode.FLOAT:
+        integer_digits, decimal_places = get_number_of_digit(data)
+
+        return (typecode, _get_str_len(
+            typecode, None, integer_digits, decimal_places,
+            _get_additional_format_len(converted_data)))
+
+    if replace_tabs_with_spaces:
+        converted_data = _replace_tabs(converted_data, tab_length)
+
+    return (typecode, get_text_len(converted_data))
+
+
+def _get_additional_format_len(data):
+    if not FloatTypeChecker(data).is_type():
+        return 0
+
+    format_len = 0
+
+    if float(data) < 0:
+        # for minus character
+        format_len += 1
+
+    return format_len
+
+
+# shared by all of the instances/threads: creators are stateless
+_CHECKER_CREATOR_LIST = (
+    IntegerTypeCheckerCreator(),
+    FloatTypeCheckerCreator(),
+    DateTimeTypeCheckerCreator(),
+)
 
 
 class DataProperty(DataPeropertyInterface):
@@ -33,11 +139,9 @@ class DataProperty(DataPeropertyInterface):
         "__str_len",
     )
 
-    __CHECKER_CREATOR_LIST = [
-        IntegerTypeCheckerCreator(),
-        FloatTypeCheckerCreator(),
-        DateTimeTypeCheckerCreator()
-    ]
+    __ALIGN_TABLE = dict(
+        (align.align_code, align)
+        for align in (Align.AUTO, Align.LEFT, Align.RIGHT, Align.CENTER))
 
     @property
     def align(self):
@@ -82,7 +186,10 @@ class DataProperty(DataPeropertyInterface):
     @property
     def data(self):
         """
-        :return: Original data.
+        :return:
+            Original data.
+            Returns ``None`` if the instance created with
+            ``is_retain_data=False``.
         :rtype: Original data type.
         """
 
@@ -114,11 +221,15 @@ class DataProperty(DataPeropertyInterface):
 
     def __init__(
             self, data, none_value=None, is_convert=True,
-            replace_tabs_with_spaces=True, tab_length=2):
+            replace_tabs_with_spaces=True, tab_length=2,
+            is_retain_data=True, string_intern_table=None):
         super(DataProperty, self).__init__()
 
         self.__set_data(
             data, none_value, is_convert, replace_tabs_with_spaces, tab_length)
+        if string_intern_table is not None:
+            # share the converted string with the equal data of other cells
+            self.__data = string_intern_table.intern(self.__data)
         self.__typecode = self.__get_typecode_from_data(data, is_convert)
         self.__align = align_getter.get_align_from_typecode(self.typecode)
 
@@ -128,9 +239,18 @@ class DataProperty(DataPeropertyInterface):
         self.__additional_format_len = self.__get_additional_format_len()
         self.__str_len = self.__get_str_len()
 
+        if not is_retain_data:
+            # keep only the attributes: release the converted data
+            self.__data = None
+
     def __repr__(self):
+        if self.data is None:
+            data_format = "data=%s"
+        else:
+            data_format = "data=%" + self.format_str
+
         return ", ".join([
-            ("data=%" + self.format_str) % (self.data),
+            data_format % (self.data),
             "typename=" + Typecode.get_typename(self.typecode),
             "align=" + str(self.align),
             "str_len=" + str(self.str_len),
@@ -139,43 +259,61 @@ class DataProperty(DataPeropertyInterface):
             "additional_format_len=" + str(self.additional_format_len),
         ])
 
-    def __get_additional_format_len(self):
-        if not FloatTypeChecker(self.data).is_type():
-            return 0
-
-        format_len = 0
-
-        if float(self.data) < 0:
-            # for minus character
-            format_len += 1
-
-        return format_len
-
-    def __get_base_float_len(self):
-        if any([self.integer_digits < 0, self.decimal_places < 0]):
-            raise ValueError()
+    def __getstate__(self):
+        # the align is restored as the shared instance of Align
+        return (
+            self.__data,
+            self.__typecode,
+            self.__align.align_code,
+            self.__integer_digits,
+            self.__decimal_places,
+            self.__additional_format_len,
+            self.__str_len,
+        )
+
+    def __setstate__(self, state):
+        (
+            self.__data,
+            self.__typecode,
+            align_code,
+            self.__integer_digits,
+            self.__decimal_places,
+            self.__additional_format_len,
+            self.__str_len,
+        ) = state
+        self.__align = self.__ALIGN_TABLE[align_code]
+
+    def _write_state(self, writer):
+        writer.write_value(self.__data)
+        writer.write_uint(self.__typecode)
+        writer.write_uint(self.__align.align_code)
+        writer.write_value(self.__integer_digits)
+        writer.write_value(self.__decimal_places)
+        writer.write_value(self.__additional_format_len)
+        writer.write_value(self.__str_len)
+
+    def _read_state(self, reader):
+        self.__data = reader.read_value()
+        self.__typecode = reader.read_uint()
+        self.__align = self.__ALIGN_TABLE[reader.read_uint()]
+        self.__integer_digits = reader.read_value()
+        self.__decimal_places = reader.read_value()
+        self.__additional_format_len = reader.read_value()
+        self.__str_len = reader.read_value()
 
-        float_len = self.integer_digits + self.decimal_places
-        if self.decimal_places > 0:
-            # for dot
-            float_len += 1
-
-        return float_len
+    def __get_additional_format_len(self):
+        return _get_additional_format_len(self.data)
 
     def __get_str_len(self):
-        if self.typecode == Typecode.INT:
-            return self.integer_digits + self.additional_format_len
-
-        if self.typecode == Typecode.FLOAT:
-            return self.__get_base_float_len() + self.additional_format_len
-
-        return get_text_len(self.data)
+        return _get_str_len(
+            self.typecode, self.data, self.integer_digits,
+            self.decimal_places, self.additional_format_len)
 
     def __get_typecode_from_data(self, data, is_convert):
         if data is None:
             return Typecode.NONE
 
-        for checker_creator in self.__CHECKER_CREATOR_LIST:
+        for checker_creator in _CHECKER_CREATOR_LIST:
             checker = checker_creator.create(data, is_convert)
             if checker.is_type():
                 return checker.typecode
@@ -188,21 +326,42 @@ class DataProperty(DataPeropertyInterface):
         self.__data = convert_value(data, none_value, is_convert)
 
         if replace_tabs_with_spaces:
-            try:
-                self.__data = self.__data.replace("\t", " " * tab_length)
-            except (TypeError, AttributeError):
-                pass
+            self.__data = _replace_tabs(self.__data, tab_length)
 
 
 class ColumnDataProperty(DataPeropertyInterface):
     __slots__ = (
+        "__is_removable",
+        "__min_padding_len",
         "__typecode_bitmap",
-        "__str_len",
+        "__typecode_count_table",
+        "__minmax_str_len",
         "__minmax_integer_digits",
         "__minmax_decimal_places",
         "__minmax_additional_format_len",
+        "__moment",
+        "__str_len_histogram",
+        "__distinct_sketch",
+        "__minmax_value",
+        "__minmax_significant_digits",
     )
 
+    # (dtype name, min value, max value) in ascending order of the width
+    __INTEGER_DTYPE_LIST = (
+        ("int8", -(2 ** 7), 2 ** 7 - 1),
+        ("uint8", 0, 2 ** 8 - 1),
+        ("int16", -(2 ** 15), 2 ** 15 - 1),
+        ("uint16", 0, 2 ** 16 - 1),
+        ("int32", -(2 ** 31), 2 ** 31 - 1),
+        ("uint32", 0, 2 ** 32 - 1),
+        ("int64", -(2 ** 63), 2 ** 63 - 1),
+        ("uint64", 0, 2 ** 64 - 1),
+    )
+    __FLOAT32_DIGITS = 6
+    __FLOAT32_MAX = 3.4028234663852886e+38
+    __FLOAT32_MIN_NORMAL = 1.1754943508222875e-38
+    __FLOAT64_DIGITS = 17
+
     @property
     def align(self):
         return align_getter.get_align_from_typecode(self.typecode)
@@ -225,7 +384,22 @@ class ColumnDataProperty(DataPeropertyInterface):
 
     @property
     def padding_len(self):
-        return self.__str_len
+        max_str_len = self.__minmax_str_len.max_value
+        if max_str_len is None:
+            return self.__min_padding_len
+
+        return max(self.__min_padding_len, max_str_len)
+
+    @property
+    def is_removable(self):
+        """
+        :return:
+            ``True`` if the body data can be removed by
+            :py:meth:`.remove_body`.
+        :rtype: bool
+        """
+
+        return self.__is_removable
 
     @property
     def minmax_integer_digits(self):
@@ -239,12 +413,165 @@ class ColumnDataProperty(DataPeropertyInterface):
     def minmax_additional_format_len(self):
         return self.__minmax_additional_format_len
 
-    def __init__(self, min_padding_len=0):
+    @property
+    def count(self):
+        """
+        :return: Number of the body data.
+        :rtype: int
+        """
+
+        return sum(self.__typecode_count_table.values())
+
+    @property
+    def null_count(self):
+        """
+        :return: Number of the body data that are ``None``.
+        :rtype: int
+        """
+
+        return self.__typecode_count_table.get(Typecode.NONE, 0)
+
+    @property
+    def null_ratio(self):
+        """
+        :return:
+            Ratio of ``None`` in the body data.
+            Returns ``float("nan")`` if the column has no body data.
+        :rtype: float
+        """
+
+        count = self.count
+        if count == 0:
+            return float("nan")
+
+        return float(self.null_count) / count
+
+    @property
+    def typecode_count_table(self):
+        """
+        :return: Number of the body data for each type code.
+        :rtype: dict
+        """
+
+        return dict(self.__typecode_count_table)
+
+    @property
+    def moment(self):
+        """
+        :return: Count/mean/variance of the ``int``/``float`` body data.
+        :rtype: :py:class:`~.MomentContainer`
+        """
+
+        return self.__moment
+
+    @property
+    def str_len_histogram(self):
+        """
+        :return: Number of the body data for each ``str_len``.
+        :rtype: dict
+        """
+
+        return dict(self.__str_len_histogram)
+
+    @property
+    def approx_distinct(self):
+        """
+        :return:
+            Estimated number of the distinct body data except ``None``.
+            Returns ``float("nan")`` if ``distinct_precision`` is ``None``.
+            Removed data by :py:meth:`.remove_body` remain counted.
+        :rtype: int
+        """
+
+        if self.__distinct_sketch is None:
+            return float("nan")
+
+        return self.__distinct_sketch.approx_distinct()
+
+    @property
+    def distinct_sketch(self):
+        return self.__distinct_sketch
+
+    @property
+    def minmax_value(self):
+        """
+        :return: Min/max of the ``int``/``float`` body data.
+        :rtype: :py:class:`~.MinMaxContainer`
+        """
+
+        return self.__minmax_value
+
+    @property
+    def minmax_significant_digits(self):
+        """
+        :return:
+            Min/max number of significant digits of the
+            ``int``/``float`` body data.
+        :rtype: :py:class:`~.MinMaxContainer`
+        """
+
+        return self.__minmax_significant_digits
+
+    @property
+    def storage_dtype(self):
+        """
+        Return the minimal storage type name (numpy/Arrow style) that can hold
+        every body data of the column without loss:
+
+            - ``"int8"``/``"uint8"`` ... ``"int64"``/``"uint64"``
+              for ``INT`` columns
+            - ``"float32"``/``"float64"`` for ``FLOAT`` columns
+            - ``"datetime64[us]"`` for ``DATETIME`` columns
+            - ``"object"`` otherwise
+
+        ``None`` cells are not taken into account, use :py:attr:`.null_count`
+        to decide whether a validity mask is required.
+
+        :return:
+            ``None`` for ``INT``/``FLOAT`` columns whose value range is
+            unknown (e.g. extracted with ``is_width_only``).
+        :rtype: str
+        """
+
+        typecode = self.typecode
+
+        if typecode == Typecode.INT:
+            return self.__get_integer_dtype()
+
+        if typecode == Typecode.FLOAT:
+            return self.__get_float_dtype()
+
+        if typecode == Typecode.DATETIME:
+            return "datetime64[us]"
+
+        return "object"
+
+    def __init__(
+            self, min_padding_len=0, is_removable=False,
+            distinct_precision=None):
+        if is_removable:
+            container_class = MultisetMinMaxContainer
+        else:
+            container_class = MinMaxContainer
+
+        self.__is_removable = is_removable
+        self.__min_padding_len = min_padding_len
         self.__typecode_bitmap = Typecode.NONE
-        self.__str_len = min_padding_len
-        self.__minmax_integer_digits = MinMaxContainer()
-        self.__minmax_decimal_places = MinMaxContainer()
-        self.__minmax_additional_format_len = MinMaxContainer()
+        self.__typecode_count_table = {}
+        self.__minmax_str_len = container_class()
+        self.__minmax_integer_digits = container_class()
+        self.__minmax_decimal_places = container_class()
+        self.__minmax_additional_format_len = container_class()
+        self.__moment = MomentContainer()
+        self.__str_len_histogram = {}
+
+        self.__minmax_value = container_class()
+        self.__minmax_significant_digits = container_class()
+
+        if distinct_precision is None:
+            self.__distinct_sketch = None
+        else:
+            self.__distinct_sketch = HyperLogLog(distinct_precision)
 
     def __repr__(self):
         return ", ".join([
@@ -257,19 +584,307 @@ class ColumnDataProperty(DataPeropertyInterface):
                 str(self.minmax_additional_format_len)),
         ])
 
+    def _write_state(self, writer):
+        writer.write_value(self.__is_removable)
+        writer.write_value(self.__min_padding_len)
+        writer.write_uint(self.__typecode_bitmap)
+
+        writer.write_uint(len(self.__typecode_count_table))
+        for typecode, count in self.__typecode_count_table.items():
+            writer.write_uint(typecode)
+            writer.write_uint(count)
+
+        writer.write_uint(len(self.__str_len_histogram))
+        for str_len, count in self.__str_len_histogram.items():
+            writer.write_value(str_len)
+            writer.write_uint(count)
+
+        for container in self.__get_container_list():
+            container._write_state(writer)
+        self.__moment._write_state(writer)
+
+        writer.write_value(self.__distinct_sketch is not None)
+        if self.__distinct_sketch is not None:
+            self.__distinct_sketch._write_state(writer)
+
+    def _read_state(self, reader):
+        self.__is_removable = reader.read_value()
+        self.__min_padding_len = reader.read_value()
+        self.__typecode_bitmap = reader.read_uint()
+
+        self.__typecode_count_table = {}
+        for _i in range(reader.read_uint()):
+            typecode = reader.read_uint()
+            self.__typecode_count_table[typecode] = reader.read_uint()
+
+        self.__str_len_histogram = {}
+        for _i in range(reader.read_uint()):
+            str_len = reader.read_value()
+            self.__str_len_histogram[str_len] = reader.read_uint()
+
+        if self.__is_removable:
+            container_class = MultisetMinMaxContainer
+        else:
+            container_class = MinMaxContainer
+
+        self.__minmax_str_len = read_object(container_class, reader)
+        self.__minmax_integer_digits = read_object(container_class, reader)
+        self.__minmax_decimal_places = read_object(container_class, reader)
+        self.__minmax_additional_format_len = read_object(
+            container_class, reader)
+        self.__minmax_value = read_object(container_class, reader)
+        self.__minmax_significant_digits = read_object(
+            container_class, reader)
+        self.__moment = read_object(MomentContainer, reader)
+
+        if reader.read_value():
+            self.__distinct_sketch = read_object(HyperLogLog, reader)
+        else:
+            self.__distinct_sketch = None
+
     def update_header(self, dataprop):
         self.__update(dataprop)
 
-    def update_body(self, dataprop):
-        self.__typecode_bitmap |= dataprop.typecode
+    def update_body(self, dataprop, count=1):
+        """
+        :param int count:
+            Number of occurrences of the ``dataprop`` in the column.
+            Updating with ``count`` is equal to updating ``count`` times,
+            e.g. for aggregated input such as ``GROUP BY`` results.
+        """
+
+        self.__typecode_count_table[dataprop.typecode] = (
+            self.__typecode_count_table.get(dataprop.typecode, 0) + count)
+        self.__typecode_bitmap = self.__apply_datetime_bitmap(
+            self.__typecode_bitmap | dataprop.typecode)
+        self.__str_len_histogram[dataprop.str_len] = (
+            self.__str_len_histogram.get(dataprop.str_len, 0) + count)
+        self.__moment.update(self.__get_numeric_value(dataprop), count)
+
+        if self.__is_numeric_value(dataprop):
+            self.__minmax_value.update(dataprop.data, count)
+            self.__minmax_significant_digits.update(
+                self.__get_significant_digits(dataprop), count)
 
         if all([
-            self.__typecode_bitmap & Typecode.DATETIME,
-            self.__typecode_bitmap & ~Typecode.DATETIME,
+            self.__distinct_sketch is not None,
+            dataprop.typecode != Typecode.NONE,
+            dataprop.data is not None,
         ]):
-            self.__typecode_bitmap |= Typecode.STRING
+            self.__distinct_sketch.add(dataprop.data)
 
-        self.__update(dataprop)
+        self.__update(dataprop, count)
+
+    def update_body_width(self, typecode, str_len, count=1):
+        """
+        Update with only the type and the width of a body data
+        (e.g. results of :py:func:`.get_typecode_and_str_len`).
+        ``typecode``, ``align``, ``padding_len``, ``count``,
+        ``typecode_count_table`` and ``str_len_histogram`` are updated as
+        :py:meth:`.update_body` does, the digits and the value statistics
+        are not.
+        """
+
+        self.__typecode_count_table[typecode] = (
+            self.__typecode_count_table.get(typecode, 0) + count)
+        self.__typecode_bitmap = self.__apply_datetime_bitmap(
+            self.__typecode_bitmap | typecode)
+        self.__str_len_histogram[str_len] = (
+            self.__str_len_histogram.get(str_len, 0) + count)
+
+        if not is_nan(str_len):
+            self.__minmax_str_len.update(str_len, count)
+
+    def remove_body(self, dataprop):
+        """
+        Remove a body data that previously passed to
+        :py:meth:`.update_body`.
+
+        :raises RuntimeError: If the instance is not removable.
+        :raises ValueError: If the ``dataprop`` has not been added.
+        """
+
+        if not self.is_removable:
+            raise RuntimeError("column property is not removable")
+
+        count = self.__typecode_count_table.get(dataprop.typecode, 0)
+        if count == 0:
+            raise ValueError("data not found: %s" % (dataprop))
+
+        # validate all of the removals before changing anything
+        removal_list = self.__get_removal_list(dataprop)
+        for container, value in removal_list:
+            if value is None or is_nan(value):
+                continue
+            if container.count(value) == 0:
+                raise ValueError("data not found: %s" % (dataprop))
+
+        if count > 1:
+            self.__typecode_count_table[dataprop.typecode] = count - 1
+        else:
+            del self.__typecode_count_table[dataprop.typecode]
+
+            typecode_bitmap = Typecode.NONE
+            for typecode in self.__typecode_count_table:
+                typecode_bitmap |= typecode
+            self.__typecode_bitmap = self.__apply_datetime_bitmap(
+                typecode_bitmap)
+
+        str_len_count = self.__str_len_histogram.get(dataprop.str_len, 0)
+        if str_len_count > 1:
+            self.__str_len_histogram[dataprop.str_len] = str_len_count - 1
+        else:
+            self.__str_len_histogram.pop(dataprop.str_len, None)
+        self.__moment.remove(self.__get_numeric_value(dataprop))
+
+        for container, value in removal_list:
+            container.remove(value)
+
+    def merge(self, other):
+        """
+        Merge another column property that extracted from other rows of
+        the same column, e.g. a chunk of rows processed separately.
+        The result is equal to a column property that updated with
+        all of the data of both.
+        """
+
+        self.__typecode_bitmap = self.__apply_datetime_bitmap(
+            self.__typecode_bitmap | other.__typecode_bitmap)
+
+        for typecode, count in other.__typecode_count_table.items():
+            self.__typecode_count_table[typecode] = (
+                self.__typecode_count_table.get(typecode, 0) + count)
+
+        for str_len, count in other.__str_len_histogram.items():
+            self.__str_len_histogram[str_len] = (
+                self.__str_len_histogram.get(str_len, 0) + count)
+
+        self.__min_padding_len = max(
+            self.__min_padding_len, other.__min_padding_len)
+        self.__minmax_str_len.merge(other.__minmax_str_len)
+        self.__minmax_integer_digits.merge(other.__minmax_integer_digits)
+        self.__minmax_decimal_places.merge(other.__minmax_decimal_places)
+        self.__minmax_additional_format_len.merge(
+            other.__minmax_additional_format_len)
+        self.__moment.merge(other.__moment)
+        self.__minmax_value.merge(other.__minmax_value)
+        self.__minmax_significant_digits.merge(
+            other.__minmax_significant_digits)
+
+        if all([
+            self.__distinct_sketch is not None,
+            other.__distinct_sketch is not None,
+        ]):
+            self.__distinct_sketch.merge(other.__distinct_sketch)
+
+    def __get_container_list(self):
+        return [
+            self.__minmax_str_len,
+            self.__minmax_integer_digits,
+            self.__minmax_decimal_places,
+            self.__minmax_additional_format_len,
+            self.__minmax_value,
+            self.__minmax_significant_digits,
+        ]
+
+    def __get_removal_list(self, dataprop):
+        removal_list = []
+
+        if self.__is_numeric_value(dataprop):
+            removal_list.extend([
+                (self.__minmax_value, dataprop.data),
+                (
+                    self.__minmax_significant_digits,
+                    self.__get_significant_digits(dataprop),
+                ),
+            ])
+
+        if not is_nan(dataprop.str_len):
+            removal_list.append((self.__minmax_str_len, dataprop.str_len))
+
+        if dataprop.typecode in (Typecode.FLOAT, Typecode.INT):
+            removal_list.append(
+                (self.__minmax_integer_digits, dataprop.integer_digits))
+
+        if dataprop.typecode == Typecode.FLOAT:
+            removal_list.append(
+                (self.__minmax_decimal_places, dataprop.decimal_places))
+
+        removal_list.append((
+            self.__minmax_additional_format_len,
+            dataprop.additional_format_len))
+
+        return removal_list
+
+    def __get_integer_dtype(self):
+        min_value = self.minmax_value.min_value
+        max_value = self.minmax_value.max_value
+
+        if min_value is None:
+            # the value range is not collected
+            return None
+
+        for dtype, dtype_min, dtype_max in self.__INTEGER_DTYPE_LIST:
+            if dtype_min <= min_value and max_value <= dtype_max:
+                return dtype
+
+        return "object"
+
+    def __get_float_dtype(self):
+        max_digits = self.minmax_significant_digits.max_value
+
+        if max_digits is None:
+            # the value range is not collected
+            return None
+
+        if max_digits > self.__FLOAT32_DIGITS:
+            return "float64"
+
+        return "float32"
+
+    @classmethod
+    def __get_significant_digits(cls, dataprop):
+        value = dataprop.data
+
+        try:
+            abs_value = abs(float(value))
+        except (TypeError, ValueError, OverflowError):
+            return cls.__FLOAT64_DIGITS
+
+        if abs_value > cls.__FLOAT32_MAX or (
+                0 < abs_value < cls.__FLOAT32_MIN_NORMAL):
+            # out of the float32 range requires float64
+            return cls.__FLOAT64_DIGITS
+
+        return _get_significant_digits(value)
+
+    @staticmethod
+    def __is_numeric_value(dataprop):
+        return all([
+            dataprop.typecode in (Typecode.FLOAT, Typecode.INT),
+            dataprop.data is not None,
+            not is_nan(dataprop.data),
+        ])
+
+    @staticmethod
+    def __get_numeric_value(dataprop):
+        if dataprop.typecode not in (Typecode.FLOAT, Typecode.INT):
+            return None
+
+        try:
+            return float(dataprop.data)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    @staticmethod
+    def __apply_datetime_bitmap(typecode_bitmap):
+        if all([
+            typecode_bitmap & Typecode.DATETIME,
+            typecode_bitmap & ~Typecode.DATETIME,
+        ]):
+            typecode_bitmap |= Typecode.STRING
+
+        return typecode_bitmap
 
     @staticmethod
     def __get_typecode_from_bitmap(typecode_bitmap):
@@ -286,14 +901,17 @@ class ColumnDataProperty(DataPeropertyInterface):
 
         return Typecode.STRING
 
-    def __update(self, dataprop):
-        self.__str_len = max(self.__str_len, dataprop.str_len)
+    def __update(self, dataprop, count=1):
+        if not is_nan(dataprop.str_len):
+            self.__minmax_str_len.update(dataprop.str_len, count)
 
         if dataprop.typecode in (Typecode.FLOAT, Typecode.INT):
-            self.__minmax_integer_digits.update(dataprop.integer_digits)
+            self.__minmax_integer_digits.update(
+                dataprop.integer_digits, count)
 
         if dataprop.typecode == Typecode.FLOAT:
-            self.__minmax_decimal_places.update(dataprop.decimal_places)
+            self.__minmax_decimal_places.update(
+                dataprop.decimal_places, count)
 
         self.__minmax_additional_format_len.update(
-            dataprop.additional_format_len)
+            dataprop.additional_format_len, count)
@@ -156,6 +156,24 @@ def get_number_of_digit(value):
     return (integer_digits, decimal_places)
 
 
+def _get_significant_digits(value):
+    """
+    :return:
+        Number of significant decimal digits that are required to
+        represent the ``value`` without loss.
+    :rtype: int
+    """
+
+    if isinstance(value, float):
+        text = repr(value).split("e")[0]
+    else:
+        text = str(value)
+
+    digits = text.lstrip("-").replace(".", "").strip("0")
+
+    return max(1, len(digits))
+
+
 def get_text_len(text):
     try:
         return len(str(text))
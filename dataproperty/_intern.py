@@ -0,0 +1,89 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+import sys
+import threading
+
+import six
+
+
+class StringInternTable(object):
+    """
+    Size-bounded table of strings that shares one object among equal
+    strings, e.g. the ``data`` of :py:class:`~.DataProperty` instances of
+    columns that repeat the same values (hostnames, statuses, etc.).
+
+    Up to ``max_size`` distinct strings are kept in the table. Once the
+    table is full, strings that are not in the table are returned as is.
+    ``saved_byte_count`` is the total size of the string objects that
+    replaced by an equal string of the table.
+    """
+
+    @property
+    def max_size(self):
+        return self.__max_size
+
+    @property
+    def size(self):
+        return len(self.__string_table)
+
+    @property
+    def hit_count(self):
+        """
+        :return: Number of the strings that replaced by the table.
+        :rtype: int
+        """
+
+        return self.__hit_count
+
+    @property
+    def saved_byte_count(self):
+        """
+        :return:
+            Total size in bytes (``sys.getsizeof``) of the strings that
+            replaced by the table.
+        :rtype: int
+        """
+
+        return self.__saved_byte_count
+
+    def __init__(self, max_size=65536):
+        self.__max_size = max_size
+        self.__lock = threading.Lock()
+        self.clear()
+
+    def intern(self, value):
+        """
+        :return:
+            The string of the table that equal to the ``value``.
+            Returns the ``value`` itself if it is not a string,
+            or it is not in the table and the table is full.
+        """
+
+        if not isinstance(value, six.string_types):
+            return value
+
+        with self.__lock:
+            interned = self.__string_table.get(value)
+
+            if interned is None:
+                if len(self.__string_table) < self.__max_size:
+                    self.__string_table[value] = value
+
+                return value
+
+            if interned is not value:
+                self.__hit_count += 1
+                self.__saved_byte_count += sys.getsizeof(value)
+
+            return interned
+
+    def clear(self):
+        with self.__lock:
+            self.__string_table = {}
+            self.__hit_count = 0
+            self.__saved_byte_count = 0
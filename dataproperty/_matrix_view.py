@@ -0,0 +1,137 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+import threading
+
+from six.moves import range
+
+from ._data_property import DataProperty
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    # Python 2.6
+    OrderedDict = None
+
+
+class DataPropertyMatrixView(object):
+    """
+    A lazy view of the :py:class:`~.DataProperty` matrix of a data matrix.
+
+    A :py:class:`~.DataProperty` is created only when its cell is
+    accessed, and kept in an LRU cache of up to ``max_cache_size`` cells,
+    so the cost of an access does not depend on the size of the table.
+    On Python 2.6, which lacks ``collections.OrderedDict``, the cache is
+    cleared when it is full instead.
+
+    .. code:: python
+
+        view[row_idx]               # list of DataProperty of a row
+        view[row_idx, col_idx]      # DataProperty of a cell
+        view[start:end]             # list of rows
+        view[start:end, col_idx]    # list of DataProperty of a column
+        view[row_idx, start:end]    # list of DataProperty of a row
+
+    The data matrix is read at each access, so it must support indexing
+    (e.g. a ``list``). Call :py:meth:`.clear_cache` after modifying cells
+    of the data matrix.
+    """
+
+    @property
+    def max_cache_size(self):
+        return self.__max_cache_size
+
+    @property
+    def cache_size(self):
+        return len(self.__cache)
+
+    def __init__(
+            self, data_matrix, none_value=None, is_convert=True,
+            max_cache_size=4096, is_retain_data=True,
+            string_intern_table=None):
+        self.__data_matrix = data_matrix
+        self.__none_value = none_value
+        self.__is_convert = is_convert
+        self.__is_retain_data = is_retain_data
+        self.__string_intern_table = string_intern_table
+        self.__max_cache_size = max_cache_size
+        self.__cache = OrderedDict() if OrderedDict is not None else {}
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__data_matrix)
+
+    def __iter__(self):
+        for row_idx in range(len(self)):
+            yield self.__get_row(row_idx, slice(None))
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            row_key, col_key = key
+        else:
+            row_key, col_key = key, slice(None)
+
+        if isinstance(row_key, slice):
+            return [
+                self.__get_row(row_idx, col_key)
+                for row_idx in range(*row_key.indices(len(self)))
+            ]
+
+        return self.__get_row(
+            self.__to_index(row_key, len(self)), col_key)
+
+    def clear_cache(self):
+        with self.__lock:
+            self.__cache.clear()
+
+    @staticmethod
+    def __to_index(idx, size):
+        if idx < 0:
+            idx += size
+
+        if not 0 <= idx < size:
+            raise IndexError("index out of range: %s" % (idx))
+
+        return idx
+
+    def __get_row(self, row_idx, col_key):
+        data_list = self.__data_matrix[row_idx] or []
+
+        if isinstance(col_key, slice):
+            return [
+                self.__get_cell(row_idx, col_idx, data_list)
+                for col_idx in range(*col_key.indices(len(data_list)))
+            ]
+
+        return self.__get_cell(
+            row_idx, self.__to_index(col_key, len(data_list)), data_list)
+
+    def __get_cell(self, row_idx, col_idx, data_list):
+        key = (row_idx, col_idx)
+
+        with self.__lock:
+            try:
+                dataprop = self.__cache.pop(key)
+            except KeyError:
+                dataprop = None
+
+            if dataprop is None:
+                dataprop = DataProperty(
+                    data_list[col_idx], self.__none_value, self.__is_convert,
+                    is_retain_data=self.__is_retain_data,
+                    string_intern_table=self.__string_intern_table)
+
+            # the most recently used cell is at the end
+            self.__cache[key] = dataprop
+            if len(self.__cache) > self.__max_cache_size:
+                if OrderedDict is not None:
+                    self.__cache.popitem(last=False)
+                else:
+                    self.__cache.clear()
+                    self.__cache[key] = dataprop
+
+        return dataprop
@@ -0,0 +1,322 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+from collections import namedtuple
+import io
+import os.path
+from timeit import default_timer
+
+from ._base_extractor import BasePropertyExtractor
+from ._csv_extractor import CsvPropertyExtractor
+from ._parallel import ExecutionProfile
+from ._parallel import ExecutorType
+from ._parallel import extract_row_chunk
+from ._parallel import get_cpu_count
+from ._parallel import get_row_count
+from ._parallel import merge_column_property_list
+from ._cache import fingerprint_file
+from ._serialize import dumps_column_property_list
+from ._serialize import loads_column_property_list
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    # Python 2.6
+    OrderedDict = None
+
+
+class FileFormat(object):
+    """
+    Formats of the files of :py:class:`~.MultiFilePropertyExtractor`.
+    """
+
+    CSV = "csv"
+
+    #: one JSON array (a row) or object (a record) per line
+    JSONL = "jsonl"
+
+
+ShardTiming = namedtuple(
+    "ShardTiming", "source_path row_count elapsed_time")
+
+_EXTENSION_FORMAT_TABLE = {
+    ".csv": FileFormat.CSV,
+    ".jsonl": FileFormat.JSONL,
+    ".ndjson": FileFormat.JSONL,
+}
+
+
+def get_file_format(source_path):
+    _root, extension = os.path.splitext(source_path)
+
+    try:
+        return _EXTENSION_FORMAT_TABLE[extension.lower()]
+    except KeyError:
+        raise ValueError("unknown file format: %s" % (source_path))
+
+
+def _merge_body(body_prop_list, chunk_prop_list, none_value):
+    if not chunk_prop_list:
+        return body_prop_list
+
+    if body_prop_list is None:
+        return chunk_prop_list
+
+    return merge_column_property_list(
+        body_prop_list, [chunk_prop_list], none_value)
+
+
+def _extract_jsonl_header_and_body(
+        source_path, header_list, file_option_table, option_table):
+    import json
+
+    batch_row_count = file_option_table["batch_row_count"]
+    json_option_table = {}
+    if OrderedDict is not None:
+        # keep the order of the keys of the records
+        json_option_table["object_pairs_hook"] = OrderedDict
+    body_prop_list = None
+    row_list = []
+
+    with io.open(
+            source_path, "r", encoding=file_option_table["encoding"]) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+
+            record = json.loads(line, **json_option_table)
+            if isinstance(record, dict):
+                if not header_list:
+                    header_list = list(record.keys())
+
+                row_list.append([record.get(key) for key in header_list])
+            else:
+                row_list.append(record)
+
+            if len(row_list) >= batch_row_count:
+                body_prop_list = _merge_body(
+                    body_prop_list, extract_row_chunk(row_list, option_table),
+                    option_table["none_value"])
+                row_list = []
+
+    if row_list:
+        body_prop_list = _merge_body(
+            body_prop_list, extract_row_chunk(row_list, option_table),
+            option_table["none_value"])
+
+    return (header_list, body_prop_list or [])
+
+
+def extract_file_shard(
+        source_path, file_format, header_list, file_option_table,
+        option_table):
+    """
+    Worker function: extract a file of
+    :py:class:`~.MultiFilePropertyExtractor`.
+
+    :return:
+        The header of the file, column properties of the data rows,
+        and the elapsed time.
+    :rtype: tuple
+    """
+
+    start_time = default_timer()
+
+    if file_format == FileFormat.CSV:
+        extractor = CsvPropertyExtractor()
+        for key, value in option_table.items():
+            setattr(extractor, key, value)
+        extractor.source_path = source_path
+        extractor.header_list = header_list
+        extractor.encoding = file_option_table["encoding"]
+        extractor.delimiter = file_option_table["delimiter"]
+        extractor.quotechar = file_option_table["quotechar"]
+        extractor.chunk_byte_size = file_option_table["chunk_byte_size"]
+
+        header_list, body_prop_list = extractor._extract_header_and_body(
+            ExecutionProfile())
+    else:
+        header_list, body_prop_list = _extract_jsonl_header_and_body(
+            source_path, header_list, file_option_table, option_table)
+
+    return (header_list, body_prop_list, default_timer() - start_time)
+
+
+def extract_encoded_file_shard(*args):
+    """
+    Worker function: same as :py:func:`.extract_file_shard` with
+    the column properties in the compact binary representation.
+    """
+
+    header_list, body_prop_list, elapsed_time = extract_file_shard(*args)
+
+    return (
+        header_list, dumps_column_property_list(body_prop_list),
+        elapsed_time)
+
+
+class MultiFilePropertyExtractor(BasePropertyExtractor):
+    """
+    Extract column properties from a set of files (shards) that have
+    the same schema, e.g. daily exports split into multiple files.
+
+    Each file of ``source_path_list`` is extracted independently
+    (in parallel with ``executor_type``), and the results are merged into
+    one result that equal to extracting the concatenated data.
+    ``ExecutorType.AUTO`` uses a process pool if there are multiple files
+    and multiple CPUs.
+
+    The format of the files is ``file_format``, or detected from the file
+    extensions (``.csv``, ``.jsonl``/``.ndjson``) if it is ``None``.
+    CSV files are extracted as with :py:class:`~.CsvPropertyExtractor`.
+    Lines of JSONL files are rows (JSON arrays) or records (JSON objects),
+    the values of a record are taken in the order of the header,
+    missing keys are ``None``. On Python 2.6, the order of the keys of
+    a record is not preserved, so a ``header_list`` is required for
+    the files of records.
+
+    If ``header_list`` is empty, the header is taken from the files
+    (the first record of CSV files, the keys of the first JSON object),
+    and a :py:class:`ValueError` is raised if the headers of the files are
+    not the same.
+
+    The row counts and the elapsed times of the files of the last
+    extraction are stored in ``shard_timing_list``
+    (list of ``ShardTiming(source_path, row_count, elapsed_time)``).
+    """
+
+    def __init__(self):
+        super(MultiFilePropertyExtractor, self).__init__()
+
+        self.source_path_list = []
+        self.file_format = None
+        self.encoding = "utf-8"
+        self.delimiter = ","
+        self.quotechar = '"'
+        self.chunk_byte_size = 4 * 1024 ** 2
+        self.batch_row_count = 1024
+        self.shard_timing_list = []
+
+    def _get_option_list(self):
+        return super(MultiFilePropertyExtractor, self)._get_option_list() + [
+            self.file_format,
+            self.encoding,
+            self.delimiter,
+            self.quotechar,
+        ]
+
+    def _get_source_fingerprint(self):
+        return "\n".join([
+            fingerprint_file(source_path)
+            for source_path in self.source_path_list
+        ])
+
+    def _extract_column_property_list(self):
+        start_time = default_timer()
+        profile = ExecutionProfile()
+        profile.max_workers = self.max_workers or get_cpu_count()
+        profile.executor_type = self.__get_executor_type(
+            len(self.source_path_list), profile.max_workers)
+
+        shard_result_list = self.__extract_shard_list(profile)
+
+        header_list = self.header_list
+        if not header_list:
+            shard_header_list = [
+                shard_header for shard_header, _body, _time in
+                shard_result_list if shard_header
+            ]
+            header_list = shard_header_list[0] if shard_header_list else []
+            for shard_header in shard_header_list:
+                if list(shard_header) != list(header_list):
+                    raise ValueError("header mismatch: %s, %s" % (
+                        header_list, shard_header))
+
+        body_list = [
+            body_prop_list for _header, body_prop_list, _time in
+            shard_result_list if body_prop_list
+        ]
+        if body_list:
+            column_prop_list = merge_column_property_list(
+                self._create_column_property_list(
+                    max(len(body_prop_list) for body_prop_list in body_list),
+                    header_list),
+                body_list, self.none_value)
+        else:
+            column_prop_list = []
+
+        self.shard_timing_list = [
+            ShardTiming(
+                source_path,
+                get_row_count(body_prop_list),
+                elapsed_time)
+            for source_path, (_header, body_prop_list, elapsed_time) in zip(
+                self.source_path_list, shard_result_list)
+        ]
+        profile.actual_time = default_timer() - start_time
+        self.execution_profile = profile
+
+        return column_prop_list
+
+    def __get_executor_type(self, shard_count, max_workers):
+        if self.executor_type != ExecutorType.AUTO:
+            return self.executor_type
+
+        if shard_count > 1 and max_workers > 1:
+            return ExecutorType.PROCESS
+
+        return ExecutorType.SERIAL
+
+    def __extract_shard_list(self, profile):
+        task_list = [
+            (
+                source_path,
+                self.file_format or get_file_format(source_path),
+                self.header_list,
+                self.__get_file_option_table(),
+                self._get_worker_option_table(),
+            )
+            for source_path in self.source_path_list
+        ]
+
+        if profile.executor_type == ExecutorType.SERIAL:
+            return [extract_file_shard(*task) for task in task_list]
+
+        if profile.executor_type == ExecutorType.THREAD:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(profile.max_workers) as executor:
+                future_list = [
+                    executor.submit(extract_file_shard, *task)
+                    for task in task_list
+                ]
+
+                return [future.result() for future in future_list]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(profile.max_workers) as executor:
+            future_list = [
+                executor.submit(extract_encoded_file_shard, *task)
+                for task in task_list
+            ]
+            result_list = [future.result() for future in future_list]
+
+        return [
+            (header_list, loads_column_property_list(body), elapsed_time)
+            for header_list, body, elapsed_time in result_list
+        ]
+
+    def __get_file_option_table(self):
+        return {
+            "encoding": self.encoding,
+            "delimiter": self.delimiter,
+            "quotechar": self.quotechar,
+            "chunk_byte_size": self.chunk_byte_size,
+            "batch_row_count": self.batch_row_count,
+        }
@@ -0,0 +1,403 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+import array
+import multiprocessing
+import sys
+
+from six.moves import cPickle as pickle
+
+from ._serialize import dumps_column_property_list
+
+
+class ExecutorType(object):
+    """
+    Execution strategies of :py:class:`~.PropertyExtractor`.
+    """
+
+    #: extract in the calling thread
+    SERIAL = "serial"
+
+    #: shard the data to a thread pool.
+    #: scales across cores on free-threaded (no-GIL) CPython builds
+    THREAD = "thread"
+
+    #: shard the data to a process pool
+    PROCESS = "process"
+
+    #: choose one of the above from a cost estimation of a probe
+    AUTO = "auto"
+
+
+class ExecutionProfile(object):
+    """
+    Instrumentation of an extraction by :py:class:`~.PropertyExtractor`:
+    the chosen execution strategy, and the estimated/actual times
+    in seconds. ``probe_*``/``estimated_time`` are set only for
+    ``ExecutorType.AUTO``.
+    """
+
+    def __init__(self):
+        self.executor_type = None
+        self.shard_type = None
+        self.max_workers = None
+        self.chunk_size = None
+        self.probe_row_count = 0
+        self.probe_time = None
+        self.estimated_time = None
+        self.actual_time = None
+
+    def __repr__(self):
+        return ", ".join([
+            "executor_type=" + str(self.executor_type),
+            "shard_type=" + str(self.shard_type),
+            "max_workers=" + str(self.max_workers),
+            "chunk_size=" + str(self.chunk_size),
+            "probe_row_count=" + str(self.probe_row_count),
+            "probe_time=" + str(self.probe_time),
+            "estimated_time=" + str(self.estimated_time),
+            "actual_time=" + str(self.actual_time),
+        ])
+
+
+class ShardType(object):
+    """
+    How :py:class:`~.PropertyExtractor` splits a data matrix into tasks.
+    """
+
+    #: choose ``ROW`` or ``COLUMN`` from the shape of the data matrix
+    AUTO = "auto"
+
+    #: split into ranges of rows
+    ROW = "row"
+
+    #: split into ranges of columns, suited for wide tables with few rows
+    COLUMN = "column"
+
+
+def get_cpu_count():
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+def is_free_threaded():
+    """
+    :return: ``True`` if the interpreter runs without the GIL.
+    :rtype: bool
+    """
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None:
+        return False
+
+    return not is_gil_enabled()
+
+
+def is_shared_memory_available():
+    try:
+        from multiprocessing import shared_memory  # noqa
+    except ImportError:
+        return False
+
+    return True
+
+
+def split_range(total, chunk_size):
+    return [
+        (start, min(start + chunk_size, total))
+        for start in range(0, total, chunk_size)
+    ]
+
+
+class SharedMatrix(object):
+    """
+    Data matrix that placed in a ``multiprocessing.shared_memory`` block,
+    so that worker processes can read rows without receiving those through
+    pipes.
+
+    Each row is pickled into the block and located by an offset array.
+    The block layout is::
+
+        [pickled rows][row offsets (int64) * (row_count + 1)]
+
+    A column matrix (a list of columns) is placed in the same way, each
+    column as a row, so that a worker reads only the columns of its chunk.
+    """
+
+    @property
+    def layout(self):
+        """
+        :return:
+            Picklable information that is required to attach the block
+            from worker processes.
+        :rtype: tuple
+        """
+
+        return (self.__shm.name, self.__data_size, self.__row_count)
+
+    @property
+    def row_count(self):
+        return self.__row_count
+
+    def __init__(self, data_matrix):
+        from multiprocessing import shared_memory
+
+        chunk_list = [
+            pickle.dumps(data_list, pickle.HIGHEST_PROTOCOL)
+            for data_list in data_matrix
+        ]
+        row_offset_list = array.array("q", [0])
+        data_size = 0
+        for chunk in chunk_list:
+            data_size += len(chunk)
+            row_offset_list.append(data_size)
+
+        self.__data_size = data_size
+        self.__row_count = len(chunk_list)
+
+        row_offset_bytes = row_offset_list.tobytes()
+        self.__shm = shared_memory.SharedMemory(
+            create=True, size=max(1, data_size + len(row_offset_bytes)))
+
+        buf = self.__shm.buf
+        buf[:data_size] = b"".join(chunk_list)
+        buf[data_size:data_size + len(row_offset_bytes)] = row_offset_bytes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.__shm is None:
+            return
+
+        self.__shm.close()
+        self.__shm.unlink()
+        self.__shm = None
+
+
+class _SharedMatrixView(object):
+
+    @property
+    def row_count(self):
+        return self.__row_count
+
+    def __init__(self, layout):
+        from multiprocessing import shared_memory
+
+        name, data_size, row_count = layout
+        itemsize = array.array("q").itemsize
+        self.__row_count = row_count
+
+        self.__shm = shared_memory.SharedMemory(name=name)
+        buf = self.__shm.buf
+        self.__data = buf[:data_size]
+        self.__row_offset_list = buf[
+            data_size:data_size + (row_count + 1) * itemsize].cast("q")
+
+    def close(self):
+        self.__data.release()
+        self.__row_offset_list.release()
+        self.__shm.close()
+
+    def iter_rows(self, row_start, row_end):
+        data = self.__data
+        row_offset_list = self.__row_offset_list
+
+        for row_idx in range(row_start, row_end):
+            yield pickle.loads(
+                data[row_offset_list[row_idx]:row_offset_list[row_idx + 1]])
+
+
+def get_column_list(row_list, col_start, col_end):
+    """
+    :return:
+        Columns ``[col_start, col_end)`` of rows with the existing cells
+        only: cells that missing in short rows are not included, so the
+        columns need to be padded after the extraction.
+    :rtype: list
+    """
+
+    return [
+        [
+            data_list[col_idx] for data_list in row_list
+            if data_list is not None and col_idx < len(data_list)
+        ]
+        for col_idx in range(col_start, col_end)
+    ]
+
+
+def _create_worker_extractor(option_table):
+    from ._property_extractor import PropertyExtractor
+
+    extractor = PropertyExtractor()
+    for key, value in option_table.items():
+        setattr(extractor, key, value)
+
+    return extractor
+
+
+def warm_up_worker():
+    """
+    Worker initializer: import the datetime parsing modules and fill the
+    converter caches before the first task arrives.
+    """
+
+    from .converter import convert_value
+
+    for value in ("2017-01-01T00:00:00-0500", "2017-01-01T00:00:00+0000"):
+        convert_value(value)
+
+
+def extract_table(header_list, data_matrix, option_table):
+    """
+    Worker function: extract column properties of a whole table.
+    """
+
+    extractor = _create_worker_extractor(option_table)
+    extractor.header_list = header_list
+    extractor.data_matrix = data_matrix
+
+    return extractor.extract_column_property_list()
+
+
+def extract_row_chunk(data_matrix, option_table):
+    """
+    Worker function: extract column properties of a chunk of rows
+    without the header.
+    """
+
+    extractor = _create_worker_extractor(option_table)
+    extractor.data_matrix = data_matrix
+
+    return extractor._extract_column_property_list_serial()
+
+
+def extract_shared_row_chunk(layout, row_start, row_end, option_table):
+    """
+    Worker function: same as :py:func:`.extract_row_chunk` for the rows
+    ``[row_start, row_end)`` of a :py:class:`.SharedMatrix`.
+    """
+
+    view = _SharedMatrixView(layout)
+    try:
+        return extract_row_chunk(
+            list(view.iter_rows(row_start, row_end)), option_table)
+    finally:
+        view.close()
+
+
+def extract_column_chunk(column_matrix, option_table):
+    """
+    Worker function: extract column properties from a list of columns
+    without the header.
+    """
+
+    extractor = _create_worker_extractor(option_table)
+
+    return extractor._extract_column_property_list_from_columns(column_matrix)
+
+
+def extract_shared_column_chunk(layout, col_start, col_end, option_table):
+    """
+    Worker function: same as :py:func:`.extract_column_chunk` for the
+    columns ``[col_start, col_end)`` of a :py:class:`.SharedMatrix` of
+    a column matrix.
+    """
+
+    view = _SharedMatrixView(layout)
+    try:
+        return extract_column_chunk(
+            list(view.iter_rows(col_start, col_end)), option_table)
+    finally:
+        view.close()
+
+
+def call_encoded(func, *args):
+    """
+    Call a worker function in a worker process and return the result in
+    the compact binary representation, that is much smaller than pickled
+    column properties.
+    """
+
+    return dumps_column_property_list(func(*args))
+
+
+def get_row_count(column_prop_list):
+    """
+    :return:
+        Number of the rows of column properties that padded to the same
+        length, ``0`` if there are no columns.
+    :rtype: int
+    """
+
+    return max([column_prop.count for column_prop in column_prop_list] + [0])
+
+
+def pad_column_property_list(column_prop_list, row_count, none_value=None):
+    """
+    Pad the columns that have less than ``row_count`` data with ``None``,
+    in one weighted update per column.
+    """
+
+    none_prop = None
+
+    for column_prop in column_prop_list:
+        pad_count = row_count - column_prop.count
+        if pad_count <= 0:
+            continue
+
+        if none_prop is None:
+            from ._data_property import DataProperty
+
+            none_prop = DataProperty(None, none_value)
+
+        column_prop.update_body(none_prop, pad_count)
+
+    return column_prop_list
+
+
+def merge_column_property_list(
+        column_prop_list, chunk_result_list, none_value=None):
+    """
+    Merge row chunk results into the column properties.
+    Columns that a chunk does not have are padded with ``None`` for the
+    rows of the chunk, and columns of a chunk that wider than the column
+    properties are appended.
+    """
+
+    row_count = get_row_count(column_prop_list)
+
+    for chunk_column_prop_list in chunk_result_list:
+        chunk_row_count = get_row_count(chunk_column_prop_list)
+
+        for col_idx, chunk_column_prop in enumerate(chunk_column_prop_list):
+            if col_idx < len(column_prop_list):
+                column_prop_list[col_idx].merge(chunk_column_prop)
+            else:
+                column_prop_list.append(chunk_column_prop)
+
+        row_count += chunk_row_count
+        pad_column_property_list(column_prop_list, row_count, none_value)
+
+    return column_prop_list
+
+
+def concat_column_property_list(chunk_result_list):
+    """
+    Concatenate column chunk results in the order of the chunks.
+    """
+
+    column_prop_list = []
+    for chunk_column_prop_list in chunk_result_list:
+        column_prop_list.extend(chunk_column_prop_list)
+
+    return column_prop_list
@@ -4,52 +4,532 @@
 .. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
 """
 
+from __future__ import absolute_import
+import math
+import threading
+from timeit import default_timer
+
+from ._base_extractor import BasePropertyExtractor
+from ._cache import fingerprint_matrix
 from ._data_property import DataProperty
 from ._data_property import ColumnDataProperty
 from ._function import is_empty_list_or_tuple
-from ._function import is_not_empty_list_or_tuple
+from ._function import is_list_or_tuple
+from ._parallel import ExecutionProfile
+from ._parallel import ExecutorType
+from ._parallel import ShardType
+from ._parallel import SharedMatrix
+from ._parallel import call_encoded
+from ._parallel import concat_column_property_list
+from ._parallel import extract_column_chunk
+from ._parallel import extract_row_chunk
+from ._parallel import extract_shared_column_chunk
+from ._parallel import extract_shared_row_chunk
+from ._parallel import get_cpu_count
+from ._parallel import is_free_threaded
+from ._parallel import is_shared_memory_available
+from ._parallel import get_column_list
+from ._parallel import merge_column_property_list
+from ._parallel import pad_column_property_list
+from ._parallel import split_range
+from ._serialize import loads_column_property_list
+
+
+class PropertyExtractor(BasePropertyExtractor):
+    """
+    Extract properties from a data matrix.
+
+    Rows of the data matrix can be ragged: the columns are as many as
+    the cells of the longest row, and the missing cells of the shorter
+    rows are counted as ``None``. The cells are extracted in a single
+    pass, so the cost is proportional to the number of the cells.
+
+    Options of :py:class:`~.BasePropertyExtractor` are also available.
+    The fingerprint of the ``cache`` key is of the file of ``source_path``
+    if it is set, otherwise of the ``data_matrix``.
+    With a ``source_path``, the ``data_matrix`` is not read at the cache
+    hit, so it can be a lazily loading iterable.
+    Without a ``source_path``, an iterator ``data_matrix`` is replaced by
+    a list of its rows, which is used for both of the fingerprint and
+    the extraction.
+
+    If ``executor_type`` is ``ExecutorType.THREAD``/``ExecutorType.PROCESS``,
+    the data matrix is split into chunks of ``chunk_size`` rows or columns
+    according to ``shard_type`` and extracted by ``max_workers`` worker
+    threads/processes.
+    ``ShardType.AUTO`` shards by columns if the matrix has more columns than
+    rows, otherwise by rows.
+    With ``is_shared_memory`` (and Python 3.8+), the data matrix
+    is placed in a shared memory block once, workers read their chunk from
+    the block and send back only the encoded column properties.
+    Disabled by default: whether it is faster than sending the chunks
+    depends on the data.
+
+    ``ExecutorType.AUTO`` extracts a probe of the first rows serially,
+    estimates the cost of the remaining rows from it, and chooses serial,
+    thread (only on free-threaded builds) or process execution along with
+    the chunk size. The decision and the estimated/actual times of the last
+    extraction are stored in ``execution_profile``
+    (:py:class:`~.ExecutionProfile`).
 
+    Extraction keeps no state in the instance except ``execution_profile``,
+    so an instance can be used by multiple threads concurrently as long as
+    its attributes are not modified during the extraction.
+    """
 
-class PropertyExtractor(object):
+    __PROBE_ROW_COUNT = 32
+
+    # cost model of ExecutorType.AUTO in seconds
+    __THREAD_POOL_OVERHEAD = 0.005
+    __PROCESS_POOL_OVERHEAD = 0.2
+    __PROCESS_CELL_OVERHEAD = 2e-6
+    __TARGET_CHUNK_TIME = 0.05
 
     def __init__(self):
-        self.header_list = []
+        super(PropertyExtractor, self).__init__()
+
         self.data_matrix = []
-        self.min_padding_len = 0
-        self.none_value = None
-        self.is_convert = True
+        #: keep the converted data of extract_data_property_matrix results
+        self.is_retain_data = True
+        #: StringInternTable to share equal strings of the data
+        self.string_intern_table = None
+        self.shard_type = ShardType.AUTO
+        self.is_shared_memory = False
 
     def extract_data_property_matrix(self):
         return [
-            self.__extract_data_property_list(data_list)
+            self._extract_data_property_list(
+                data_list, self.is_retain_data, self.string_intern_table)
             for data_list in self.data_matrix
         ]
 
-    def extract_column_property_list(self):
-        data_prop_matrix = self.extract_data_property_matrix()
-        header_prop_list = self.__extract_data_property_list(self.header_list)
-        column_prop_list = []
+    def extract_data_property_matrix_view(self, max_cache_size=4096):
+        """
+        Same as :py:meth:`.extract_data_property_matrix`, except that
+        the :py:class:`~.DataProperty` of a cell is created when it is
+        accessed. The ``data_matrix`` is materialized as a list if it does
+        not support indexing.
+
+        :param int max_cache_size:
+            Maximum number of the cached cells of the view.
+        :rtype: DataPropertyMatrixView
+        """
+
+        from ._matrix_view import DataPropertyMatrixView
+
+        data_matrix = self.data_matrix
+        if not hasattr(data_matrix, "__getitem__"):
+            data_matrix = list(data_matrix)
 
-        for col_idx, col_prop_list in enumerate(zip(*data_prop_matrix)):
-            column_prop = ColumnDataProperty(
-                min_padding_len=self.min_padding_len)
+        return DataPropertyMatrixView(
+            data_matrix, self.none_value, self.is_convert, max_cache_size,
+            self.is_retain_data, self.string_intern_table)
 
-            if is_not_empty_list_or_tuple(header_prop_list):
-                header_prop = header_prop_list[col_idx]
-                column_prop.update_header(header_prop)
+    def _extract_column_property_list(self):
+        start_time = default_timer()
+        profile = ExecutionProfile()
 
-            for prop in col_prop_list:
-                column_prop.update_body(prop)
+        if self.executor_type == ExecutorType.SERIAL:
+            profile.executor_type = ExecutorType.SERIAL
+            profile.max_workers = 1
+            column_prop_list = self._extract_column_property_list_serial()
+        else:
+            column_prop_list = self.__extract_column_property_list_by_executor(
+                profile)
 
-            column_prop_list.append(column_prop)
+        profile.actual_time = default_timer() - start_time
+        self.execution_profile = profile
 
         return column_prop_list
 
-    def __extract_data_property_list(self, data_list):
-        if is_empty_list_or_tuple(data_list):
+    def _extract_column_property_list_serial(self):
+        # a single pass over the cells: rows can be ragged, and the missing
+        # cells and None cells are counted as None at the end
+        column_prop_list = []
+        row_count = 0
+
+        for data_list in self.data_matrix:
+            if is_empty_list_or_tuple(data_list):
+                data_list = []
+
+            for col_idx, data in enumerate(data_list):
+                if col_idx == len(column_prop_list):
+                    column_prop_list.append(ColumnDataProperty(
+                        min_padding_len=self.min_padding_len,
+                        is_removable=self.is_removable,
+                        distinct_precision=self.distinct_precision))
+
+                if data is not None:
+                    self._update_column_body(column_prop_list[col_idx], data)
+
+            row_count += 1
+
+        pad_column_property_list(column_prop_list, row_count, self.none_value)
+
+        return merge_column_property_list(
+            self._create_column_property_list(len(column_prop_list)),
+            [column_prop_list])
+
+    def _get_shard_type(self, row_count, column_count):
+        if self.shard_type != ShardType.AUTO:
+            return self.shard_type
+
+        if column_count > row_count:
+            return ShardType.COLUMN
+
+        return ShardType.ROW
+
+    def __extract_column_property_list_by_executor(self, profile):
+        data_matrix = list(self.data_matrix)
+        if not data_matrix:
+            profile.executor_type = ExecutorType.SERIAL
             return []
 
-        return [
-            DataProperty(data, self.none_value, self.is_convert)
-            for data in data_list
-        ]
+        option_table = self._get_worker_option_table()
+        row_count = len(data_matrix)
+        column_count = max(
+            len(data_list) if data_list is not None else 0
+            for data_list in data_matrix)
+        profile.max_workers = self.max_workers or get_cpu_count()
+        chunk_result_list = []
+
+        if self.executor_type == ExecutorType.AUTO:
+            probe_row_count = min(len(data_matrix), self.__PROBE_ROW_COUNT)
+            probe_start_time = default_timer()
+            chunk_result_list.append(extract_row_chunk(
+                data_matrix[:probe_row_count], option_table))
+            profile.probe_row_count = probe_row_count
+            profile.probe_time = default_timer() - probe_start_time
+
+            data_matrix = data_matrix[probe_row_count:]
+            self.__plan_execution(
+                profile,
+                profile.probe_time / max(1, probe_row_count * column_count),
+                len(data_matrix), column_count)
+        else:
+            profile.executor_type = self.executor_type
+            profile.shard_type = self._get_shard_type(
+                len(data_matrix), column_count)
+            if profile.shard_type == ShardType.COLUMN:
+                item_count = column_count
+            else:
+                item_count = len(data_matrix)
+            profile.chunk_size = self._get_chunk_size(
+                item_count, profile.max_workers)
+
+        if data_matrix:
+            if profile.executor_type == ExecutorType.SERIAL:
+                chunk_result_list.append(
+                    extract_row_chunk(data_matrix, option_table))
+            else:
+                chunk_result_list.extend(self.__run_executor(
+                    profile, data_matrix, column_count, option_table))
+
+        return pad_column_property_list(
+            merge_column_property_list(
+                self._create_column_property_list(column_count),
+                chunk_result_list, self.none_value),
+            row_count, self.none_value)
+
+    def __plan_execution(self, profile, cell_cost, row_count, column_count):
+        max_workers = profile.max_workers
+        shard_type = self._get_shard_type(row_count, column_count)
+        if shard_type == ShardType.COLUMN:
+            item_count = column_count
+            item_cost = cell_cost * row_count
+        else:
+            item_count = row_count
+            item_cost = cell_cost * column_count
+
+        serial_time = item_cost * item_count
+        candidate_list = [(serial_time, ExecutorType.SERIAL)]
+
+        worker_count = min(max_workers, item_count)
+        if worker_count > 1:
+            parallel_time = serial_time / worker_count
+
+            if is_free_threaded():
+                candidate_list.append((
+                    parallel_time + self.__THREAD_POOL_OVERHEAD,
+                    ExecutorType.THREAD))
+
+            candidate_list.append((
+                parallel_time + self.__PROCESS_POOL_OVERHEAD +
+                row_count * column_count * self.__PROCESS_CELL_OVERHEAD,
+                ExecutorType.PROCESS))
+
+        estimated_time, executor_type = min(
+            candidate_list, key=lambda candidate: candidate[0])
+
+        if self.chunk_size:
+            chunk_size = self.chunk_size
+        else:
+            # chunks long enough to amortize the task overhead,
+            # and at least one chunk for each worker
+            chunk_size = min(
+                max(1, int(self.__TARGET_CHUNK_TIME / max(item_cost, 1e-9))),
+                max(1, int(math.ceil(float(item_count) / max_workers))))
+
+        profile.executor_type = executor_type
+        profile.shard_type = shard_type
+        profile.chunk_size = chunk_size
+        profile.estimated_time = profile.probe_time + estimated_time
+
+    def __run_executor(self, profile, data_matrix, column_count, option_table):
+        if profile.shard_type == ShardType.COLUMN:
+            range_list = split_range(column_count, profile.chunk_size)
+            shared_worker = extract_shared_column_chunk
+            worker = extract_column_chunk
+
+            def get_chunk(col_start, col_end):
+                return get_column_list(data_matrix, col_start, col_end)
+
+            def get_shared_matrix():
+                # column-major, so that each worker decodes its columns only
+                return SharedMatrix(
+                    get_column_list(data_matrix, 0, column_count))
+        else:
+            range_list = split_range(len(data_matrix), profile.chunk_size)
+            shared_worker = extract_shared_row_chunk
+            worker = extract_row_chunk
+
+            def get_chunk(row_start, row_end):
+                return data_matrix[row_start:row_end]
+
+            def get_shared_matrix():
+                return SharedMatrix(data_matrix)
+
+        if profile.executor_type == ExecutorType.THREAD:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(profile.max_workers) as executor:
+                future_list = [
+                    executor.submit(
+                        worker, get_chunk(start, end), option_table)
+                    for start, end in range_list
+                ]
+                result_list = [future.result() for future in future_list]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(profile.max_workers) as executor:
+                if self.is_shared_memory and is_shared_memory_available():
+                    with get_shared_matrix() as shared_matrix:
+                        future_list = [
+                            executor.submit(
+                                call_encoded, shared_worker,
+                                shared_matrix.layout, start, end,
+                                option_table)
+                            for start, end in range_list
+                        ]
+                        result_list = [
+                            future.result() for future in future_list]
+                else:
+                    future_list = [
+                        executor.submit(
+                            call_encoded, worker, get_chunk(start, end),
+                            option_table)
+                        for start, end in range_list
+                    ]
+                    result_list = [future.result() for future in future_list]
+
+            result_list = [
+                loads_column_property_list(result) for result in result_list]
+
+        if profile.shard_type == ShardType.COLUMN:
+            # a set of column chunks makes up a chunk of the rows
+            return [concat_column_property_list(result_list)]
+
+        return result_list
+
+    def _get_source_fingerprint(self):
+        if self.source_path:
+            return super(PropertyExtractor, self)._get_source_fingerprint()
+
+        # an iterator is read once for both of the fingerprint and
+        # the extraction
+        if not is_list_or_tuple(self.data_matrix):
+            self.data_matrix = list(self.data_matrix)
+
+        return fingerprint_matrix(self.data_matrix)
+
+
+class IncrementalPropertyExtractor(BasePropertyExtractor):
+    """
+    Extract column properties from a table that grows over time.
+
+    Column properties are kept between calls of :py:meth:`.append_rows`
+    and updated only with the appended cells. Rows can be ragged: the
+    missing cells are counted as ``None`` when the column properties are
+    read.
+    The results are equal to the results of
+    :py:meth:`~.PropertyExtractor.extract_column_property_list`
+    for all of the rows appended so far, and
+    :py:meth:`.extract_column_property_list` returns them.
+    ``executor_type`` is not used: rows are extracted when appended.
+
+    If ``is_removable`` is ``True`` before the first rows are appended,
+    the appended rows are retained and cells can be edited or deleted by
+    :py:meth:`.update_cell`/:py:meth:`.delete_row` without a full
+    recompute of the columns.
+
+    Updates are serialized by a lock, so rows can be appended from
+    multiple threads.
+    """
+
+    @property
+    def column_property_list(self):
+        with self.__lock:
+            self.__pad_column_property_list()
+
+            return list(self.__column_prop_list)
+
+    @property
+    def row_count(self):
+        return self.__row_count
+
+    def __init__(self):
+        super(IncrementalPropertyExtractor, self).__init__()
+
+        self.__lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        with self.__lock:
+            self.__column_prop_list = []
+            self.__row_list = []
+            self.__row_count = 0
+
+            # number of the retained rows of each width
+            self.__width_count_table = {}
+
+    def append_rows(self, row_list):
+        """
+        :param list row_list: Rows to append.
+        :return: Updated column properties.
+        :rtype: list of :py:class:`~.ColumnDataProperty`
+        """
+
+        with self.__lock:
+            for row in row_list:
+                self.__append_row(row)
+
+            return self.column_property_list
+
+    def update_cell(self, row_idx, col_idx, value):
+        """
+        Replace a cell of the appended rows.
+
+        :param int row_idx: Row index of the cell.
+        :param int col_idx: Column index of the cell.
+        :param value: New value of the cell.
+        :return: Updated column property.
+        :rtype: :py:class:`~.ColumnDataProperty`
+        :raises RuntimeError: If ``is_removable`` is ``False``.
+        :raises IndexError: If the cell is out of range.
+        """
+
+        with self.__lock:
+            self.__pad_column_property_list()
+            row = self.__get_row(row_idx)
+
+            # rows may be shorter than the column properties
+            column_count = len(self.__column_prop_list)
+            if col_idx < 0:
+                col_idx += column_count
+            if not 0 <= col_idx < column_count:
+                raise IndexError("index out of range: %s" % (col_idx))
+
+            column_prop = self.__column_prop_list[col_idx]
+            data = row[col_idx] if col_idx < len(row) else None
+            column_prop.remove_body(self.__to_data_property(data))
+            column_prop.update_body(self.__to_data_property(value))
+
+            if col_idx >= len(row):
+                self.__update_width_count(len(row), -1)
+                row.extend([None] * (col_idx + 1 - len(row)))
+                self.__update_width_count(len(row), 1)
+            row[col_idx] = value
+
+            return column_prop
+
+    def delete_row(self, row_idx):
+        """
+        Delete a row of the appended rows. The columns beyond the widest
+        of the remaining rows are dropped.
+
+        :param int row_idx: Index of the row to delete.
+        :return: Updated column properties.
+        :rtype: list of :py:class:`~.ColumnDataProperty`
+        :raises RuntimeError: If ``is_removable`` is ``False``.
+        """
+
+        with self.__lock:
+            self.__pad_column_property_list()
+            row = self.__get_row(row_idx)
+
+            for col_idx, column_prop in enumerate(self.__column_prop_list):
+                data = row[col_idx] if col_idx < len(row) else None
+                column_prop.remove_body(self.__to_data_property(data))
+
+            del self.__row_list[row_idx]
+            self.__row_count -= 1
+
+            # drop the columns that only the deleted row had
+            self.__update_width_count(len(row), -1)
+            del self.__column_prop_list[
+                max([0] + list(self.__width_count_table)):]
+
+            return list(self.__column_prop_list)
+
+    def _extract_column_property_list(self):
+        start_time = default_timer()
+        profile = ExecutionProfile()
+        profile.executor_type = ExecutorType.SERIAL
+        profile.max_workers = 1
+
+        column_prop_list = self.column_property_list
+
+        profile.actual_time = default_timer() - start_time
+        self.execution_profile = profile
+
+        return column_prop_list
+
+    def __get_row(self, row_idx):
+        if not self.is_removable:
+            raise RuntimeError("extractor is not removable")
+
+        return self.__row_list[row_idx]
+
+    def __update_width_count(self, width, count):
+        width_count = self.__width_count_table.get(width, 0) + count
+
+        if width_count > 0:
+            self.__width_count_table[width] = width_count
+        else:
+            self.__width_count_table.pop(width, None)
+
+    def __pad_column_property_list(self):
+        pad_column_property_list(
+            self.__column_prop_list, self.__row_count, self.none_value)
+
+    def __to_data_property(self, data):
+        return DataProperty(data, self.none_value, self.is_convert)
+
+    def __append_row(self, row):
+        prop_list = self._extract_data_property_list(row)
+
+        column_count = len(self.__column_prop_list)
+        if len(prop_list) > column_count:
+            # cells of the previous rows are padded with None later
+            self.__column_prop_list.extend(
+                self._create_column_property_list(
+                    len(prop_list))[column_count:])
+
+        for column_prop, prop in zip(self.__column_prop_list, prop_list):
+            column_prop.update_body(prop)
+
+        if self.is_removable:
+            self.__row_list.append(list(row))
+            self.__update_width_count(len(row), 1)
+        self.__row_count += 1
@@ -0,0 +1,122 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+from timeit import default_timer
+
+from ._base_extractor import BasePropertyExtractor
+from ._cache import fingerprint_matrix
+from ._function import is_list_or_tuple
+from ._parallel import ExecutionProfile
+from ._parallel import ExecutorType
+from ._parallel import pad_column_property_list
+
+
+class RecordPropertyExtractor(BasePropertyExtractor):
+    """
+    Extract column properties from ``record_list``, an iterable of
+    mappings (e.g. ``dict`` rows of JSON or ORMs), without building
+    a data matrix.
+
+    If ``header_list`` is not empty, its items are the keys of the columns.
+    Otherwise the columns are the keys of the records in the order of
+    appearance: a key that first appears in a later record makes a column
+    whose cells of the previous records are ``None``.
+    Missing keys of a record are ``None``, and keys that are not in the
+    ``header_list`` are ignored.
+
+    The column of each key is resolved once, and the cells of the records
+    are fed directly into the column properties.
+    ``executor_type`` is not used: records are extracted serially.
+    """
+
+    def __init__(self):
+        super(RecordPropertyExtractor, self).__init__()
+
+        self.record_list = []
+
+    def _get_source_fingerprint(self):
+        if self.source_path:
+            return super(
+                RecordPropertyExtractor, self)._get_source_fingerprint()
+
+        if not is_list_or_tuple(self.record_list):
+            self.record_list = list(self.record_list)
+
+        return fingerprint_matrix(self.record_list)
+
+    def _extract_column_property_list(self):
+        start_time = default_timer()
+        profile = ExecutionProfile()
+        profile.executor_type = ExecutorType.SERIAL
+        profile.max_workers = 1
+
+        if self.header_list:
+            column_prop_list = self.__extract_by_header()
+        else:
+            column_prop_list = self.__extract_by_key()
+
+        profile.actual_time = default_timer() - start_time
+        self.execution_profile = profile
+
+        return column_prop_list
+
+    def __extract_by_header(self):
+        key_list = list(self.header_list)
+        column_prop_list = self._create_column_property_list(len(key_list))
+        column_list = list(zip(key_list, column_prop_list))
+        row_count = 0
+
+        for record in self.record_list:
+            self.__update_row(record, column_list)
+            row_count += 1
+
+        pad_column_property_list(column_prop_list, row_count, self.none_value)
+
+        return column_prop_list
+
+    def __extract_by_key(self):
+        key_list = []
+        key_set = set()
+        column_prop_list = []
+        column_list = []
+        row_count = 0
+
+        for record in self.record_list:
+            if not key_set.issuperset(record):
+                self.__add_column(
+                    record, key_list, key_set, column_prop_list, column_list)
+
+            self.__update_row(record, column_list)
+            row_count += 1
+
+        pad_column_property_list(column_prop_list, row_count, self.none_value)
+
+        # the header is the keys of the records
+        for column_prop, key_prop in zip(
+                column_prop_list, self._extract_data_property_list(key_list)):
+            column_prop.update_header(key_prop)
+
+        return column_prop_list
+
+    def __update_row(self, record, column_list):
+        for key, column_prop in column_list:
+            data = record.get(key)
+            if data is not None:
+                self._update_column_body(column_prop, data)
+
+    def __add_column(
+            self, record, key_list, key_set, column_prop_list, column_list):
+        for key in record:
+            if key in key_set:
+                continue
+
+            column_prop = self._create_column_property_list(1, [])[0]
+
+            key_list.append(key)
+            key_set.add(key)
+            column_prop_list.append(column_prop)
+            column_list.append((key, column_prop))
@@ -0,0 +1,246 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+import datetime
+import struct
+
+import six
+from six.moves import cPickle as pickle
+
+
+SERIALIZE_VERSION = 1
+
+_COLUMN_PROPERTY_LIST_MAGIC = b"DPCL"
+
+_TAG_NONE = b"N"
+_TAG_TRUE = b"T"
+_TAG_FALSE = b"F"
+_TAG_INT = b"i"
+_TAG_FLOAT = b"f"
+_TAG_TEXT = b"s"
+_TAG_BYTES = b"b"
+_TAG_DATETIME = b"d"
+_TAG_PICKLE = b"p"
+
+_SMALL_UINT_BYTES_LIST = [six.int2byte(value) for value in range(0x80)]
+_FLOAT_STRUCT = struct.Struct("<d")
+_DATETIME_STRUCT = struct.Struct("<HBBBBBI")
+
+
+class Writer(object):
+    """
+    Encoder of the compact binary representation.
+    Integers are encoded as variable length (zigzag) integers.
+    """
+
+    def __init__(self):
+        self.__chunk_list = []
+
+    def to_bytes(self):
+        return b"".join(self.__chunk_list)
+
+    def write_uint(self, value):
+        if value < 0x80:
+            self.__chunk_list.append(_SMALL_UINT_BYTES_LIST[value])
+            return
+
+        byte_list = bytearray()
+        while value > 0x7f:
+            byte_list.append((value & 0x7f) | 0x80)
+            value >>= 7
+        byte_list.append(value)
+
+        self.__chunk_list.append(bytes(byte_list))
+
+    def write_int(self, value):
+        if value < 0:
+            self.write_uint(((-value) << 1) - 1)
+        else:
+            self.write_uint(value << 1)
+
+    def write_float(self, value):
+        self.__chunk_list.append(_FLOAT_STRUCT.pack(value))
+
+    def write_bytes(self, value):
+        self.write_uint(len(value))
+        self.__chunk_list.append(bytes(value))
+
+    def write_value(self, value):
+        """
+        Write a value with a type tag.
+        Values of types that have no dedicated encoding are pickled.
+        """
+
+        chunk_list = self.__chunk_list
+
+        if value is None:
+            chunk_list.append(_TAG_NONE)
+        elif value is True:
+            chunk_list.append(_TAG_TRUE)
+        elif value is False:
+            chunk_list.append(_TAG_FALSE)
+        elif isinstance(value, six.integer_types):
+            chunk_list.append(_TAG_INT)
+            self.write_int(value)
+        elif isinstance(value, float):
+            chunk_list.append(_TAG_FLOAT)
+            self.write_float(value)
+        elif isinstance(value, six.text_type):
+            chunk_list.append(_TAG_TEXT)
+            self.write_bytes(value.encode("utf-8"))
+        elif isinstance(value, six.binary_type):
+            chunk_list.append(_TAG_BYTES)
+            self.write_bytes(value)
+        elif all([
+            type(value) is datetime.datetime,
+            getattr(value, "tzinfo", None) is None,
+        ]):
+            chunk_list.append(_TAG_DATETIME)
+            chunk_list.append(_DATETIME_STRUCT.pack(
+                value.year, value.month, value.day,
+                value.hour, value.minute, value.second, value.microsecond))
+        else:
+            chunk_list.append(_TAG_PICKLE)
+            self.write_bytes(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+
+class Reader(object):
+    """
+    Decoder of the binary representation that encoded by :py:class:`Writer`.
+    """
+
+    def __init__(self, data, offset=0):
+        self.__data = data
+        self.__offset = offset
+
+    def read_uint(self):
+        data = self.__data
+        offset = self.__offset
+
+        byte = six.indexbytes(data, offset)
+        if byte < 0x80:
+            self.__offset = offset + 1
+            return byte
+
+        value = 0
+        shift = 0
+
+        while True:
+            byte = six.indexbytes(data, offset)
+            offset += 1
+            value |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+
+        self.__offset = offset
+
+        return value
+
+    def read_int(self):
+        value = self.read_uint()
+        if value & 1:
+            return -((value + 1) >> 1)
+
+        return value >> 1
+
+    def read_float(self):
+        value = _FLOAT_STRUCT.unpack_from(self.__data, self.__offset)[0]
+        self.__offset += _FLOAT_STRUCT.size
+
+        return value
+
+    def read_bytes(self):
+        size = self.read_uint()
+        value = self.__data[self.__offset:self.__offset + size]
+        self.__offset += size
+
+        return bytes(value)
+
+    def read_value(self):
+        tag = self.__data[self.__offset:self.__offset + 1]
+        self.__offset += 1
+
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_TRUE:
+            return True
+        if tag == _TAG_FALSE:
+            return False
+        if tag == _TAG_INT:
+            return self.read_int()
+        if tag == _TAG_FLOAT:
+            return self.read_float()
+        if tag == _TAG_TEXT:
+            return self.read_bytes().decode("utf-8")
+        if tag == _TAG_BYTES:
+            return self.read_bytes()
+        if tag == _TAG_DATETIME:
+            value = datetime.datetime(
+                *_DATETIME_STRUCT.unpack_from(self.__data, self.__offset))
+            self.__offset += _DATETIME_STRUCT.size
+            return value
+        if tag == _TAG_PICKLE:
+            return pickle.loads(self.read_bytes())
+
+        raise ValueError("unknown type tag: %r" % (tag))
+
+    def read_version(self):
+        version = self.read_uint()
+        if version != SERIALIZE_VERSION:
+            raise ValueError(
+                "unsupported serialization version: expected=%d, actual=%d" % (
+                    SERIALIZE_VERSION, version))
+
+        return version
+
+
+def read_object(cls, reader):
+    obj = cls.__new__(cls)
+    obj._read_state(reader)
+
+    return obj
+
+
+def dumps_column_property_list(column_prop_list):
+    """
+    Encode column properties into the compact binary representation.
+
+    :param list column_prop_list: :py:class:`~.ColumnDataProperty` list.
+    :rtype: bytes
+    """
+
+    writer = Writer()
+    writer.write_bytes(_COLUMN_PROPERTY_LIST_MAGIC)
+    writer.write_uint(SERIALIZE_VERSION)
+    writer.write_uint(len(column_prop_list))
+    for column_prop in column_prop_list:
+        column_prop._write_state(writer)
+
+    return writer.to_bytes()
+
+
+def loads_column_property_list(data):
+    """
+    Decode column properties that encoded by
+    :py:func:`.dumps_column_property_list`.
+
+    :rtype: list of :py:class:`~.ColumnDataProperty`
+    :raises ValueError: If the ``data`` is not an encoded column properties.
+    """
+
+    from ._data_property import ColumnDataProperty
+
+    reader = Reader(data)
+    if reader.read_bytes() != _COLUMN_PROPERTY_LIST_MAGIC:
+        raise ValueError("invalid column property list data")
+    reader.read_version()
+
+    return [
+        read_object(ColumnDataProperty, reader)
+        for _i in range(reader.read_uint())
+    ]
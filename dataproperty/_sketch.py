@@ -0,0 +1,130 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+import hashlib
+import math
+import struct
+import zlib
+
+import six
+
+
+def _get_bit_length(value):
+    # int.bit_length is not available on Python 2.6
+    if value == 0:
+        return 0
+
+    return len(bin(value)) - 2
+
+
+class HyperLogLog(object):
+    """
+    Approximate distinct counter with ``2 ** precision`` bytes of registers.
+    The standard error of the estimation is about
+    ``1.04 / sqrt(2 ** precision)``.
+
+    Values are hashed by their text representation with a hash that is
+    stable across processes, so sketches that created in different worker
+    processes can be merged.
+    """
+
+    __slots__ = ("__precision", "__register_list")
+
+    MIN_PRECISION = 4
+    MAX_PRECISION = 18
+
+    @property
+    def precision(self):
+        return self.__precision
+
+    @property
+    def register_list(self):
+        return self.__register_list
+
+    def __init__(self, precision=12):
+        if not self.MIN_PRECISION <= precision <= self.MAX_PRECISION:
+            raise ValueError(
+                "precision must be in the range of %d to %d: actual=%s" % (
+                    self.MIN_PRECISION, self.MAX_PRECISION, precision))
+
+        self.__precision = precision
+        self.__register_list = bytearray(1 << precision)
+
+    def __repr__(self):
+        return "precision=%d, approx_distinct=%d" % (
+            self.precision, self.approx_distinct())
+
+    def add(self, value):
+        hash_value = struct.unpack(
+            "<Q", hashlib.md5(self.__to_bytes(value)).digest()[:8])[0]
+
+        register_idx = hash_value >> (64 - self.__precision)
+        remain_bits = 64 - self.__precision
+        remain_value = hash_value & ((1 << remain_bits) - 1)
+        rank = remain_bits - _get_bit_length(remain_value) + 1
+
+        if rank > self.__register_list[register_idx]:
+            self.__register_list[register_idx] = rank
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError(
+                "precision mismatch: expected=%d, actual=%d" % (
+                    self.precision, other.precision))
+
+        register_list = self.__register_list
+        for register_idx, rank in enumerate(other.register_list):
+            if rank > register_list[register_idx]:
+                register_list[register_idx] = rank
+
+    def approx_distinct(self):
+        """
+        :return: Estimated number of the distinct values.
+        :rtype: int
+        """
+
+        register_count = len(self.__register_list)
+        estimate = (
+            self.__get_alpha(register_count) * register_count ** 2 /
+            sum(2.0 ** -rank for rank in self.__register_list))
+
+        if estimate <= 2.5 * register_count:
+            # small range correction
+            # bytearray.count of an int is not available on Python 2
+            zero_count = self.__register_list.count(b"\x00")
+            if zero_count > 0:
+                estimate = register_count * math.log(
+                    register_count / zero_count)
+
+        return int(round(estimate))
+
+    def _write_state(self, writer):
+        writer.write_uint(self.__precision)
+        writer.write_bytes(zlib.compress(bytes(self.__register_list), 1))
+
+    def _read_state(self, reader):
+        self.__precision = reader.read_uint()
+        self.__register_list = bytearray(zlib.decompress(reader.read_bytes()))
+
+    @staticmethod
+    def __get_alpha(register_count):
+        if register_count == 16:
+            return 0.673
+        if register_count == 32:
+            return 0.697
+        if register_count == 64:
+            return 0.709
+
+        return 0.7213 / (1 + 1.079 / register_count)
+
+    @staticmethod
+    def __to_bytes(value):
+        if isinstance(value, six.binary_type):
+            return value
+
+        return six.text_type(value).encode("utf-8")
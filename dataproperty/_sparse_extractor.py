@@ -0,0 +1,148 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+from timeit import default_timer
+
+from six.moves import range
+
+from ._base_extractor import BasePropertyExtractor
+from ._cache import fingerprint_matrix
+from ._data_property import DataProperty
+from ._function import is_list_or_tuple
+from ._parallel import ExecutionProfile
+from ._parallel import ExecutorType
+from ._parallel import merge_column_property_list
+from ._parallel import pad_column_property_list
+
+
+class SparsePropertyExtractor(BasePropertyExtractor):
+    """
+    Extract properties from ``sparse_matrix``, a matrix that has only
+    the cells that are not ``None``, in either form of:
+
+        - a mapping of the coordinates to the values:
+          ``{(row_idx, col_idx): value, ...}``
+        - a sequence of the columns, each column is a pair of
+          the row indices and the values:
+          ``[(row_idx_list, value_list), ...]``
+
+    The matrix has ``row_count`` rows, or as many as the largest row index
+    if it is ``None``, and as many columns as the largest column index or
+    the ``header_list``. The other cells are ``None``: they are counted in
+    one weighted update per column, instead of one per cell.
+
+    :py:meth:`.extract_data_property_matrix` returns a sparse result:
+    a ``dict`` of the coordinates to the :py:class:`~.DataProperty` of
+    the cells of the ``sparse_matrix``, with ``is_retain_data`` and
+    ``string_intern_table`` as :py:class:`~.PropertyExtractor`.
+    ``executor_type`` is not used: cells are extracted serially.
+    """
+
+    def __init__(self):
+        super(SparsePropertyExtractor, self).__init__()
+
+        self.sparse_matrix = {}
+        self.row_count = None
+        self.is_retain_data = True
+        self.string_intern_table = None
+
+    def extract_data_property_matrix(self):
+        prop_table = {}
+
+        for col_idx, row_idx_list, value_list in self.__iter_column():
+            for row_idx, value in zip(row_idx_list, value_list):
+                prop_table[(row_idx, col_idx)] = DataProperty(
+                    value, self.none_value, self.is_convert,
+                    is_retain_data=self.is_retain_data,
+                    string_intern_table=self.string_intern_table)
+
+        return prop_table
+
+    def _get_option_list(self):
+        return super(SparsePropertyExtractor, self)._get_option_list() + [
+            self.row_count,
+        ]
+
+    def _get_source_fingerprint(self):
+        if self.source_path:
+            return super(
+                SparsePropertyExtractor, self)._get_source_fingerprint()
+
+        if hasattr(self.sparse_matrix, "items"):
+            return fingerprint_matrix(sorted(
+                self.sparse_matrix.items(), key=lambda item: item[0]))
+
+        if not is_list_or_tuple(self.sparse_matrix):
+            self.sparse_matrix = list(self.sparse_matrix)
+
+        return fingerprint_matrix(self.sparse_matrix)
+
+    def _extract_column_property_list(self):
+        start_time = default_timer()
+        profile = ExecutionProfile()
+        profile.executor_type = ExecutorType.SERIAL
+        profile.max_workers = 1
+
+        body_prop_table = {}
+        max_row_idx = -1
+
+        for col_idx, row_idx_list, value_list in self.__iter_column():
+            column_prop = self._create_column_property_list(1, [])[0]
+
+            for row_idx, value in zip(row_idx_list, value_list):
+                if value is not None:
+                    self._update_column_body(column_prop, value)
+                max_row_idx = max(max_row_idx, row_idx)
+
+            body_prop_table[col_idx] = column_prop
+
+        row_count = self.row_count
+        if row_count is None:
+            row_count = max_row_idx + 1
+        elif max_row_idx >= row_count:
+            raise ValueError("row index out of range: %d >= %d" % (
+                max_row_idx, row_count))
+
+        column_count = max(
+            [len(self.header_list or [])] +
+            [col_idx + 1 for col_idx in body_prop_table])
+        body_prop_list = [
+            body_prop_table.get(col_idx) or
+            self._create_column_property_list(1, [])[0]
+            for col_idx in range(column_count)
+        ]
+
+        pad_column_property_list(body_prop_list, row_count, self.none_value)
+
+        column_prop_list = merge_column_property_list(
+            self._create_column_property_list(column_count), [body_prop_list])
+
+        profile.actual_time = default_timer() - start_time
+        self.execution_profile = profile
+
+        return column_prop_list
+
+    def __iter_column(self):
+        sparse_matrix = self.sparse_matrix
+
+        if not hasattr(sparse_matrix, "items"):
+            for col_idx, (row_idx_list, value_list) in enumerate(
+                    sparse_matrix):
+                yield (col_idx, row_idx_list, value_list)
+
+            return
+
+        column_table = {}
+        for (row_idx, col_idx), value in sparse_matrix.items():
+            row_idx_list, value_list = column_table.setdefault(
+                col_idx, ([], []))
+            row_idx_list.append(row_idx)
+            value_list.append(value)
+
+        for col_idx in sorted(column_table):
+            row_idx_list, value_list = column_table[col_idx]
+            yield (col_idx, row_idx_list, value_list)
@@ -0,0 +1,243 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+from timeit import default_timer
+
+import six
+
+from ._base_extractor import BasePropertyExtractor
+from ._cache import fingerprint_file
+from ._parallel import ExecutionProfile
+from ._parallel import ExecutorType
+from ._parallel import pad_column_property_list
+
+
+class SqliteAffinity(object):
+    """
+    Type affinities of SQLite columns.
+    """
+
+    INTEGER = "INTEGER"
+    TEXT = "TEXT"
+    BLOB = "BLOB"
+    REAL = "REAL"
+    NUMERIC = "NUMERIC"
+
+
+def get_sqlite_affinity(declared_type):
+    """
+    :return:
+        Type affinity of a column that declared as ``declared_type``,
+        by the rules of SQLite.
+    :rtype: str
+    """
+
+    declared_type = (declared_type or "").upper()
+
+    if "INT" in declared_type:
+        return SqliteAffinity.INTEGER
+
+    if any([
+        type_name in declared_type for type_name in ("CHAR", "CLOB", "TEXT")
+    ]):
+        return SqliteAffinity.TEXT
+
+    if "BLOB" in declared_type or not declared_type:
+        return SqliteAffinity.BLOB
+
+    if any([
+        type_name in declared_type for type_name in ("REAL", "FLOA", "DOUB")
+    ]):
+        return SqliteAffinity.REAL
+
+    return SqliteAffinity.NUMERIC
+
+
+def _quote_identifier(name):
+    return '"%s"' % (name.replace('"', '""'))
+
+
+class SqlitePropertyExtractor(BasePropertyExtractor):
+    """
+    Extract column properties from a table (``table_name``) or a query
+    (``query`` with ``query_parameters``) of a ``sqlite3`` ``connection``.
+
+    Rows are streamed from the cursor by ``fetchmany`` of ``batch_size``
+    rows, so the whole result set is never held in memory.
+    If ``header_list`` is empty, the column names are used as the header.
+
+    With ``is_declared_type`` (``table_name`` only), the conversion attempts
+    are skipped for the values of the columns with ``INTEGER``/``REAL``
+    affinity that SQLite returns as ``int``/``float``: the type of those
+    values is already known, so the results are the same as without it.
+    The other values (e.g. text stored in the columns) are extracted as
+    usual.
+
+    With ``is_aggregate_pushdown``, each column is aggregated by SQLite as
+    ``SELECT col, count(*) ... GROUP BY typeof(col), col`` and each
+    distinct value is extracted once with its number of occurrences
+    (:py:meth:`~.ColumnDataProperty.update_body` with ``count``),
+    instead of each cell. The results are the same as without it.
+    This is effective for columns that have few distinct values.
+    Note that the table or the ``query`` is scanned once per column:
+    a ``query`` must return the same rows at each execution
+    (e.g. no ``random()``, or ``LIMIT`` without ``ORDER BY``),
+    and an expensive ``query`` is executed as many times as the columns.
+    """
+
+    __AFFINITY_NATIVE_TYPE_TABLE = {
+        SqliteAffinity.INTEGER: six.integer_types,
+        SqliteAffinity.REAL: (float, ),
+    }
+
+    def __init__(self):
+        super(SqlitePropertyExtractor, self).__init__()
+
+        self.connection = None
+        self.table_name = None
+        self.query = None
+        self.query_parameters = ()
+        self.batch_size = 1024
+        self.is_declared_type = False
+        self.is_aggregate_pushdown = False
+
+    def _get_option_list(self):
+        return super(SqlitePropertyExtractor, self)._get_option_list() + [
+            self.table_name,
+            self.query,
+            self.query_parameters,
+            self.is_declared_type,
+        ]
+
+    def _get_source_fingerprint(self):
+        for _seq, name, file_path in self.connection.execute(
+                "PRAGMA database_list"):
+            if name == "main":
+                break
+
+        if not file_path:
+            raise ValueError("cache requires a database file")
+
+        return fingerprint_file(file_path)
+
+    def _extract_column_property_list(self):
+        start_time = default_timer()
+        profile = ExecutionProfile()
+        profile.executor_type = ExecutorType.SERIAL
+        profile.max_workers = 1
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(self.__get_query(), self.query_parameters)
+            column_name_list = [
+                description[0] for description in cursor.description]
+            native_type_list = self.__get_native_type_list(
+                column_name_list)
+            column_prop_list = self._create_column_property_list(
+                len(column_name_list), self.header_list or column_name_list)
+
+            if self.is_aggregate_pushdown:
+                cursor.close()
+                cursor = self.connection.cursor()
+                self.__update_by_aggregate(
+                    cursor, column_prop_list, column_name_list,
+                    native_type_list)
+            else:
+                self.__update_by_row(
+                    cursor, column_prop_list, native_type_list)
+        finally:
+            cursor.close()
+
+        profile.actual_time = default_timer() - start_time
+        self.execution_profile = profile
+
+        return column_prop_list
+
+    def __get_query(self):
+        if self.query:
+            return self.query
+
+        if not self.table_name:
+            raise ValueError("either table_name or query is required")
+
+        return "SELECT * FROM %s" % (_quote_identifier(self.table_name))
+
+    def __get_native_type_list(self, column_name_list):
+        """
+        :return:
+            Types of the values of each column that are extracted without
+            conversion attempts: the values of the types are the type of
+            the affinity of the column.
+        :rtype: list of tuple
+        """
+
+        if not all([self.is_declared_type, self.table_name, self.is_convert]):
+            return [()] * len(column_name_list)
+
+        affinity_table = dict(
+            (name, get_sqlite_affinity(declared_type))
+            for _cid, name, declared_type, _notnull, _default, _pk
+            in self.connection.execute(
+                "PRAGMA table_info(%s)" % (
+                    _quote_identifier(self.table_name))))
+
+        return [
+            self.__AFFINITY_NATIVE_TYPE_TABLE.get(
+                affinity_table.get(column_name), ())
+            for column_name in column_name_list
+        ]
+
+    def __update_by_row(self, cursor, column_prop_list, native_type_list):
+        column_list = list(zip(column_prop_list, native_type_list))
+        row_count = 0
+
+        while True:
+            row_list = cursor.fetchmany(self.batch_size)
+            if not row_list:
+                break
+
+            for row in row_list:
+                for (column_prop, native_types), value in zip(
+                        column_list, row):
+                    if value is None:
+                        continue
+
+                    if isinstance(value, native_types):
+                        self._update_column_body(
+                            column_prop, value, is_convert=False)
+                    else:
+                        self._update_column_body(column_prop, value)
+
+            row_count += len(row_list)
+
+        pad_column_property_list(column_prop_list, row_count, self.none_value)
+
+    def __update_by_aggregate(
+            self, cursor, column_prop_list, column_name_list,
+            native_type_list):
+        query = self.__get_query()
+
+        for column_prop, column_name, native_types in zip(
+                column_prop_list, column_name_list, native_type_list):
+            column = _quote_identifier(column_name)
+            cursor.execute(
+                "SELECT %s, count(*) FROM (%s) "
+                "GROUP BY typeof(%s), %s COLLATE BINARY" % (
+                    column, query, column, column),
+                self.query_parameters)
+
+            while True:
+                row_list = cursor.fetchmany(self.batch_size)
+                if not row_list:
+                    break
+
+                for value, count in row_list:
+                    if isinstance(value, native_types):
+                        self._update_column_body(
+                            column_prop, value, count, is_convert=False)
+                    else:
+                        self._update_column_body(column_prop, value, count)
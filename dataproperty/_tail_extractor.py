@@ -0,0 +1,153 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from __future__ import absolute_import
+import os
+import threading
+
+from ._csv_extractor import _find_record_end
+from ._csv_extractor import _read_csv_row_list
+from ._property_extractor import IncrementalPropertyExtractor
+
+
+def find_last_record_end(buf, quotechar, delimiter=b","):
+    """
+    :return:
+        Position next to the last line break of ``buf`` that is not inside
+        a quoted field, ``0`` if there is no such line break.
+    :rtype: int
+    """
+
+    record_end = 0
+
+    while True:
+        next_record_end = _find_record_end(
+            buf, record_end, record_end, quotechar, delimiter)
+        if next_record_end == -1:
+            return record_end
+
+        record_end = next_record_end
+
+
+class TailPropertyExtractor(IncrementalPropertyExtractor):
+    """
+    Follow an append-only CSV/log file of ``source_path`` and keep
+    the column properties of the rows of the file.
+
+    Each :py:meth:`.poll` reads only the bytes appended since the previous
+    poll, and updates the column properties with the complete records of
+    them. An incomplete last line is kept until it is completed.
+    If the file is truncated, or replaced by another file (rotated), the
+    state is reset and the file is read from the start. A truncation is
+    detected by the size of the file, or by a change of the first
+    ``HEAD_SIZE`` bytes of the file: a file truncated in place
+    (e.g. ``copytruncate``) may grow beyond the previous offset before
+    the next poll.
+
+    If ``header_list`` is empty, the first record of the file is used as
+    the header (``file_header_list``).
+    """
+
+    HEAD_SIZE = 1024
+
+    @property
+    def offset(self):
+        """
+        :return: Byte offset of the file read so far.
+        :rtype: int
+        """
+
+        return self.__offset
+
+    @property
+    def file_header_list(self):
+        return self.__file_header_list
+
+    def __init__(self):
+        self.__poll_lock = threading.Lock()
+        self.__offset = 0
+        self.__partial = b""
+        self.__head = b""
+        self.__inode = None
+        self.__file_header_list = None
+
+        super(TailPropertyExtractor, self).__init__()
+
+        self.encoding = "utf-8"
+        self.delimiter = ","
+        self.quotechar = '"'
+
+    def clear(self):
+        super(TailPropertyExtractor, self).clear()
+
+        self.__offset = 0
+        self.__partial = b""
+        self.__head = b""
+        self.__inode = None
+        self.__file_header_list = None
+
+    def poll(self):
+        """
+        Read the appended bytes of the file and update the column
+        properties.
+
+        :return: Updated column properties.
+        :rtype: list of :py:class:`~.ColumnDataProperty`
+        """
+
+        with self.__poll_lock:
+            try:
+                stat = os.stat(self.source_path)
+            except OSError:
+                # the file is being rotated
+                return self.column_property_list
+
+            if any([
+                self.__inode is not None and stat.st_ino != self.__inode,
+                stat.st_size < self.__offset,
+            ]):
+                self.clear()
+
+            with open(self.source_path, "rb") as f:
+                if f.read(len(self.__head)) != self.__head:
+                    # truncated in place and rewritten
+                    self.clear()
+                self.__inode = stat.st_ino
+
+                if stat.st_size == self.__offset:
+                    return self.column_property_list
+
+                f.seek(self.__offset)
+                buf = self.__partial + f.read(stat.st_size - self.__offset)
+                self.__offset += len(buf) - len(self.__partial)
+
+                if len(self.__head) < self.HEAD_SIZE:
+                    f.seek(0)
+                    self.__head = f.read(
+                        min(self.HEAD_SIZE, self.__offset))
+
+            record_end = find_last_record_end(
+                buf, self.quotechar.encode(self.encoding),
+                self.delimiter.encode(self.encoding))
+            self.__partial = buf[record_end:]
+            row_list = _read_csv_row_list(buf, 0, record_end, {
+                "encoding": self.encoding,
+                "delimiter": self.delimiter,
+                "quotechar": self.quotechar,
+            })
+
+            if row_list and not self.header_list and (
+                    self.__file_header_list is None):
+                self.__file_header_list = row_list.pop(0)
+
+            return self.append_rows(row_list)
+
+    def _create_column_property_list(self, column_count, header_list=None):
+        if header_list is None and not self.header_list:
+            header_list = self.__file_header_list
+
+        return super(TailPropertyExtractor, self)._create_column_property_list(
+            column_count, header_list)
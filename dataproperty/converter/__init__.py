@@ -21,14 +21,14 @@ from .._type_checker_creator import DateTimeTypeCheckerCreator
 _ConverterFactory = namedtuple(
     "ConverterFactory", "type_checker_factory value_converter_factory")
 
-_type_factory_list = [
+_type_factory_list = (
     _ConverterFactory(
         IntegerTypeCheckerCreator(), IntegerConverterCreator()),
     _ConverterFactory(
         FloatTypeCheckerCreator(), FloatConverterCreator()),
     _ConverterFactory(
         DateTimeTypeCheckerCreator(), DateTimeConverterCreator()),
-]
+)
 
 
 def convert_value(value, none_return_value=None, is_convert=True):
@@ -6,10 +6,15 @@
 
 from __future__ import absolute_import
 import abc
+import datetime
 
 from .._error import TypeConversionError
 
 
+# marker of the values that are not in a cache
+_MISSING = object()
+
+
 class ValueConverterInterface(object):
 
     @abc.abstractmethod
@@ -56,6 +61,22 @@ class FloatConverter(ValueConverter):
 
 
 class DateTimeConverter(ValueConverter):
+    """
+    Parse results and timezones are cached at class level, so that they are
+    shared by all of the tables converted in a process. Strings whose
+    parse results depend on the date of today (e.g. ``"10:30"``) are not
+    cached.
+    """
+
+    __PARSE_CACHE_SIZE = 4096
+
+    # string -> parsed datetime, or None if the string is not a datetime
+    __parse_cache = {}
+    __PARSE_DEFAULT_DATETIME_LIST = (
+        datetime.datetime(2000, 1, 1),
+        datetime.datetime(2001, 2, 2),
+    )
+    __timezone_cache = {}
 
     __DAYS_TO_SECONDS_COEF = 60 ** 2 * 24
     __MICROSECONDS_TO_SECONDS_COEF = 1000.0 ** 2
@@ -77,10 +98,13 @@ class DateTimeConverter(ValueConverter):
 
         self.__datetime = None
 
+    @classmethod
+    def clear_cache(cls):
+        cls.__parse_cache.clear()
+        cls.__timezone_cache.clear()
+
     def convert(self):
         import datetime
-        import dateutil.parser
-        import pytz
 
         if isinstance(self._value, datetime.datetime):
             self.__datetime = self._value
@@ -89,7 +113,7 @@ class DateTimeConverter(ValueConverter):
         if not self._is_convert:
             return self._value
         try:
-            self.__datetime = dateutil.parser.parse(self._value)
+            self.__datetime = self.__parse(self._value)
         except (AttributeError, ValueError):
             raise TypeConversionError
 
@@ -99,12 +123,73 @@ class DateTimeConverter(ValueConverter):
         except (AttributeError, KeyError):
             return self.__datetime
 
-        pytz_timezone = pytz.timezone(dst_timezone_name)
+        pytz_timezone = self.__get_timezone(dst_timezone_name)
         self.__datetime = self.__datetime.replace(tzinfo=None)
         self.__datetime = pytz_timezone.localize(self.__datetime)
 
         return self.__datetime
 
+    def __parse(self, value):
+        import dateutil.parser
+
+        parse_cache = self.__parse_cache
+
+        try:
+            # a single lookup: the cache can be cleared by another thread
+            # between a membership test and an item access
+            result = parse_cache.get(value, _MISSING)
+        except TypeError:
+            # unhashable values are left to the parser
+            return dateutil.parser.parse(value)
+
+        if result is None:
+            raise ValueError("invalid datetime string: %s" % (value))
+
+        if result is not _MISSING:
+            return result
+
+        if len(parse_cache) >= self.__PARSE_CACHE_SIZE:
+            parse_cache.clear()
+
+        # the parser fills the missing fields of a string (e.g. "10:30")
+        # from the date of today, so only the strings that are parsed to
+        # the same datetime with different default dates are cached.
+        # a day of any month is valid in the first default date,
+        # so a string that cannot be parsed with it is not a datetime.
+        try:
+            result = dateutil.parser.parse(
+                value, default=self.__PARSE_DEFAULT_DATETIME_LIST[0])
+        except (AttributeError, ValueError):
+            parse_cache[value] = None
+            raise
+
+        try:
+            is_date_independent = result == dateutil.parser.parse(
+                value, default=self.__PARSE_DEFAULT_DATETIME_LIST[1])
+        except ValueError:
+            # e.g. "Feb 29" is not a date of the second default year
+            is_date_independent = False
+
+        if not is_date_independent:
+            return dateutil.parser.parse(value)
+
+        parse_cache[value] = result
+
+        return result
+
+    def __get_timezone(self, timezone_name):
+        import pytz
+
+        try:
+            return self.__timezone_cache[timezone_name]
+        except KeyError:
+            pass
+
+        pytz_timezone = pytz.timezone(timezone_name)
+        self.__timezone_cache[timezone_name] = pytz_timezone
+
+        return pytz_timezone
+
     def __get_timedelta_sec(self):
         dt = self.__datetime.utcoffset()
 
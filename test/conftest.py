@@ -0,0 +1,14 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import sys
+
+
+collect_ignore = []
+
+if sys.version_info < (3, 5):
+    # async def is a syntax error
+    collect_ignore.append("test_async_extractor.py")
@@ -0,0 +1,39 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import pytest
+
+from dataproperty import ExecutorType
+from dataproperty import PropertyExtractor
+
+
+def extract_column_property_list(
+        header_list, data_matrix, executor_type=ExecutorType.SERIAL,
+        **kwargs):
+    prop_extractor = PropertyExtractor()
+    prop_extractor.header_list = header_list
+    prop_extractor.data_matrix = data_matrix
+    prop_extractor.executor_type = executor_type
+    for key, value in kwargs.items():
+        setattr(prop_extractor, key, value)
+
+    return prop_extractor.extract_column_property_list()
+
+
+def assert_column_property_list_equal(lhs_list, rhs_list):
+    assert len(lhs_list) == len(rhs_list)
+
+    for lhs, rhs in zip(lhs_list, rhs_list):
+        assert str(lhs) == str(rhs)
+        assert lhs.count == rhs.count
+        assert lhs.typecode_count_table == rhs.typecode_count_table
+        assert lhs.str_len_histogram == rhs.str_len_histogram
+        assert lhs.minmax_value == rhs.minmax_value
+        assert lhs.moment.count == rhs.moment.count
+        assert lhs.moment.mean() == pytest.approx(
+            rhs.moment.mean(), nan_ok=True)
+        assert lhs.moment.variance() == pytest.approx(
+            rhs.moment.variance(), nan_ok=True)
@@ -0,0 +1,113 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import sys
+
+import pytest
+
+from dataproperty import *
+
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="requires asyncio.run")
+
+TEST_HEADER_LIST = ["i", "f", "s", "dt"]
+TEST_DATA_MATRIX = [
+    [i, i / 3.0, "s" * (i % 7), "2017-01-%02d" % (1 + i % 28)]
+    for i in range(60)
+]
+
+
+def extract_column_property_list(data_matrix):
+    prop_extractor = PropertyExtractor()
+    prop_extractor.header_list = TEST_HEADER_LIST
+    prop_extractor.data_matrix = data_matrix
+
+    return prop_extractor.extract_column_property_list()
+
+
+async def aiter_rows(data_matrix):
+    for row in data_matrix:
+        yield row
+
+
+def run_with_ticker(extractor, data_matrix):
+    import asyncio
+
+    async def run():
+        tick_list = []
+        is_done = asyncio.Event()
+
+        async def ticker():
+            while not is_done.is_set():
+                tick_list.append(None)
+                await asyncio.sleep(0)
+
+        ticker_task = asyncio.ensure_future(ticker())
+        result = await extractor.append_rows_async(aiter_rows(data_matrix))
+        is_done.set()
+        await ticker_task
+
+        return result, len(tick_list)
+
+    return asyncio.run(run())
+
+
+class Test_AsyncPropertyExtractor_append_rows_async:
+
+    def test_normal_inline(self):
+        extractor = AsyncPropertyExtractor()
+        extractor.header_list = TEST_HEADER_LIST
+        extractor.time_slice = 0
+
+        column_prop_list, tick_count = run_with_ticker(
+            extractor, TEST_DATA_MATRIX)
+
+        assert tick_count >= len(TEST_DATA_MATRIX)
+        assert [str(prop) for prop in column_prop_list] == [
+            str(prop)
+            for prop in extract_column_property_list(TEST_DATA_MATRIX)]
+        assert extractor.row_count == len(TEST_DATA_MATRIX)
+
+    @pytest.mark.parametrize(["batch_size"], [[1], [7], [1000]])
+    def test_normal_executor(self, batch_size):
+        from concurrent.futures import ThreadPoolExecutor
+
+        extractor = AsyncPropertyExtractor()
+        extractor.header_list = TEST_HEADER_LIST
+        extractor.batch_size = batch_size
+
+        with ThreadPoolExecutor(1) as executor:
+            extractor.executor = executor
+            column_prop_list, tick_count = run_with_ticker(
+                extractor, TEST_DATA_MATRIX)
+
+        assert tick_count > 0
+        assert [str(prop) for prop in column_prop_list] == [
+            str(prop)
+            for prop in extract_column_property_list(TEST_DATA_MATRIX)]
+
+    def test_normal_incremental(self):
+        import asyncio
+
+        extractor = AsyncPropertyExtractor()
+        extractor.header_list = TEST_HEADER_LIST
+        asyncio.run(extractor.append_rows_async(
+            aiter_rows(TEST_DATA_MATRIX[:10])))
+        extractor.append_rows(TEST_DATA_MATRIX[10:20])
+        column_prop_list = asyncio.run(extractor.append_rows_async(
+            aiter_rows(TEST_DATA_MATRIX[20:])))
+
+        assert [str(prop) for prop in column_prop_list] == [
+            str(prop)
+            for prop in extract_column_property_list(TEST_DATA_MATRIX)]
+
+    def test_null(self):
+        import asyncio
+
+        extractor = AsyncPropertyExtractor()
+
+        assert asyncio.run(extractor.append_rows_async(aiter_rows([]))) == []
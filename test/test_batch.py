@@ -0,0 +1,105 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import datetime
+
+import pytest
+
+from dataproperty import *
+from dataproperty.converter import DateTimeConverter
+
+from helper import extract_column_property_list
+from helper import assert_column_property_list_equal
+
+
+TEST_TABLE_LIST = [
+    (["i", "f", "s"], [[1, 1.1, "aa"], [2, 2.2, "bbb"]]),
+    (None, [["2017-01-02 03:04:05-0500", 1], [None, "1.5"]]),
+    (["dt"], [[datetime.datetime(2017, 1, 1)], ["abc"]]),
+    (None, []),
+]
+
+
+class Test_BatchPropertyExtractor_extract_iter:
+
+    @pytest.mark.parametrize(["executor_type", "max_pending"], [
+        [ExecutorType.THREAD, None],
+        [ExecutorType.THREAD, 1],
+        [ExecutorType.PROCESS, None],
+        [ExecutorType.PROCESS, 2],
+    ])
+    def test_normal(self, executor_type, max_pending):
+        with BatchPropertyExtractor(executor_type, max_workers=2) as batch:
+            batch.max_pending = max_pending
+            result_table = dict(batch.extract_iter(TEST_TABLE_LIST))
+
+            # the pool is reused by the following batches
+            result_list = batch.extract(TEST_TABLE_LIST[::-1])
+
+        assert sorted(result_table) == list(range(len(TEST_TABLE_LIST)))
+        for idx, (header_list, data_matrix) in enumerate(TEST_TABLE_LIST):
+            expected_list = extract_column_property_list(
+                header_list, data_matrix)
+
+            assert_column_property_list_equal(
+                result_table[idx], expected_list)
+            assert_column_property_list_equal(
+                result_list[len(TEST_TABLE_LIST) - 1 - idx], expected_list)
+
+    def test_normal_option(self):
+        with BatchPropertyExtractor(ExecutorType.THREAD) as batch:
+            batch.min_padding_len = 8
+            result_list = batch.extract(TEST_TABLE_LIST[:1])
+
+        for column_prop in result_list[0]:
+            assert column_prop.padding_len == 8
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            BatchPropertyExtractor(ExecutorType.SERIAL)
+
+
+class Test_DateTimeConverter_cache:
+
+    @pytest.mark.parametrize(["value", "expected"], [
+        ["2017-03-22T10:00:00+0900", "2017-03-22T10:00:00+09:00"],
+        ["2017-01-22T10:00:00-0500", "2017-01-22T10:00:00-05:00"],
+    ])
+    def test_normal(self, value, expected):
+        DateTimeConverter.clear_cache()
+
+        for _i in range(2):
+            assert DateTimeConverter(value).convert().isoformat() == expected
+
+    @pytest.mark.parametrize(["value", "is_cached"], [
+        ["10:30", False],
+        ["Monday", False],
+        ["Feb 29", False],
+        ["2017-01-22 10:30", True],
+    ])
+    def test_normal_date_of_today(self, value, is_cached):
+        # missing fields are filled from the date of today
+        DateTimeConverter.clear_cache()
+
+        try:
+            DateTimeConverter(value).convert()
+        except TypeConversionError:
+            pass
+
+        parse_cache = DateTimeConverter._DateTimeConverter__parse_cache
+        assert (value in parse_cache) == is_cached
+
+        DateTimeConverter.clear_cache()
+
+    @pytest.mark.parametrize(["value"], [
+        ["invalid time string"],
+    ])
+    def test_exception(self, value):
+        DateTimeConverter.clear_cache()
+
+        for _i in range(2):
+            with pytest.raises(TypeConversionError):
+                DateTimeConverter(value).convert()
@@ -0,0 +1,172 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import os
+import time
+
+import pytest
+
+from dataproperty import *
+
+
+TEST_DATA_MATRIX = [
+    [1, 1.1, "aa", 1, 1],
+    [2, 2.2, "bbb", 2.2, 2.2],
+    [3, 3.33, "cccc", -3, "ccc"],
+]
+
+
+@pytest.fixture
+def cache(tmpdir):
+    return ColumnPropertyCache(str(tmpdir.join("cache")))
+
+
+def make_extractor(cache, data_matrix=TEST_DATA_MATRIX):
+    prop_extractor = PropertyExtractor()
+    prop_extractor.header_list = ["i", "f", "s", "if", "mix"]
+    prop_extractor.data_matrix = data_matrix
+    prop_extractor.cache = cache
+
+    return prop_extractor
+
+
+class Test_ColumnPropertyCache_get_set:
+
+    def test_normal(self, cache):
+        assert cache.get("key") is None
+
+        cache.set("key", make_extractor(None).extract_column_property_list())
+        column_prop_list = cache.get("key")
+
+        assert len(column_prop_list) == 5
+        assert column_prop_list[1].typecode == Typecode.FLOAT
+
+        cache.clear()
+        assert cache.get("key") is None
+
+    def test_normal_broken_entry(self, cache):
+        cache.set("key", [])
+        with open(os.path.join(cache.cache_dir, "key.colprop"), "wb") as f:
+            f.write(b"broken")
+
+        assert cache.get("key") is None
+
+    def test_normal_eviction(self, tmpdir):
+        column_prop_list = make_extractor(None).extract_column_property_list()
+        ColumnPropertyCache(str(tmpdir)).set("a", column_prop_list)
+        entry_size = os.path.getsize(str(tmpdir.join("a.colprop")))
+
+        cache = ColumnPropertyCache(str(tmpdir), max_size=entry_size * 2)
+        cache.set("b", column_prop_list)
+        os.utime(str(tmpdir.join("a.colprop")), (1, 1))
+        os.utime(str(tmpdir.join("b.colprop")), (2, 2))
+        assert cache.get("a") is not None
+        cache.set("c", column_prop_list)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+        ColumnPropertyCache(str(tmpdir), max_size=0).set("d", [])
+        assert os.listdir(str(tmpdir)) == []
+
+
+class Test_PropertyExtractor_cache:
+
+    def test_normal_matrix(self, cache):
+        expected_list = make_extractor(cache).extract_column_property_list()
+        column_prop_list = make_extractor(cache).extract_column_property_list()
+
+        assert len(os.listdir(cache.cache_dir)) == 1
+        for col_prop, expected in zip(column_prop_list, expected_list):
+            assert str(col_prop) == str(expected)
+
+        make_extractor(
+            cache, TEST_DATA_MATRIX[:2]).extract_column_property_list()
+        assert len(os.listdir(cache.cache_dir)) == 2
+
+    def test_normal_iterator(self, cache):
+        expected_list = make_extractor(None).extract_column_property_list()
+
+        for _i in range(2):
+            column_prop_list = make_extractor(
+                cache, (row for row in TEST_DATA_MATRIX)
+            ).extract_column_property_list()
+
+            assert len(column_prop_list) == len(expected_list)
+            for col_prop, expected in zip(column_prop_list, expected_list):
+                assert str(col_prop) == str(expected)
+
+        assert len(os.listdir(cache.cache_dir)) == 1
+
+    @pytest.mark.parametrize(["extractor_class", "attr", "value"], [
+        [RecordPropertyExtractor, "record_list", [{"a": 1}, {"a": 2}]],
+        [ColumnarPropertyExtractor, "column_matrix", [[1, 2], ["a", "b"]]],
+        [SparsePropertyExtractor, "sparse_matrix", [([0, 1], [1, 2])]],
+    ])
+    def test_normal_iterator_input(
+            self, cache, extractor_class, attr, value):
+        prop_extractor = extractor_class()
+        setattr(prop_extractor, attr, value)
+        expected_list = prop_extractor.extract_column_property_list()
+
+        prop_extractor = extractor_class()
+        prop_extractor.cache = cache
+        setattr(prop_extractor, attr, iter(value))
+        column_prop_list = prop_extractor.extract_column_property_list()
+
+        assert len(column_prop_list) == len(expected_list)
+        for col_prop, expected in zip(column_prop_list, expected_list):
+            assert str(col_prop) == str(expected)
+            assert col_prop.count == expected.count
+
+    def test_normal_options(self, cache):
+        make_extractor(cache).extract_column_property_list()
+
+        prop_extractor = make_extractor(cache)
+        prop_extractor.min_padding_len = 10
+        column_prop_list = prop_extractor.extract_column_property_list()
+
+        assert len(os.listdir(cache.cache_dir)) == 2
+        assert column_prop_list[0].padding_len == 10
+
+    def test_normal_source_path(self, cache, tmpdir):
+        source_path = tmpdir.join("data.csv")
+        source_path.write("dummy")
+
+        prop_extractor = make_extractor(cache)
+        prop_extractor.source_path = str(source_path)
+        expected_list = prop_extractor.extract_column_property_list()
+
+        prop_extractor = make_extractor(cache, data_matrix=None)
+        prop_extractor.source_path = str(source_path)
+        column_prop_list = prop_extractor.extract_column_property_list()
+
+        for col_prop, expected in zip(column_prop_list, expected_list):
+            assert str(col_prop) == str(expected)
+
+        mtime = time.time() + 10
+        os.utime(str(source_path), (mtime, mtime))
+        with pytest.raises(TypeError):
+            prop_extractor.extract_column_property_list()
+
+
+class Test_fingerprint:
+
+    def test_normal_matrix(self):
+        assert fingerprint_matrix(TEST_DATA_MATRIX) == fingerprint_matrix(
+            [list(row) for row in TEST_DATA_MATRIX])
+        assert fingerprint_matrix(TEST_DATA_MATRIX) != fingerprint_matrix(
+            TEST_DATA_MATRIX[:2])
+        assert fingerprint_matrix([[1]]) != fingerprint_matrix([["1"]])
+
+    def test_normal_file(self, tmpdir):
+        file_path = tmpdir.join("data.csv")
+        file_path.write("a")
+        fingerprint = fingerprint_file(str(file_path))
+        file_path.write("ab")
+
+        assert fingerprint != fingerprint_file(str(file_path))
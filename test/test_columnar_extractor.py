@@ -0,0 +1,78 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import array
+import datetime
+
+import pytest
+
+from dataproperty import *
+
+from helper import extract_column_property_list
+from helper import assert_column_property_list_equal
+
+
+TEST_HEADER_LIST = ["i", "f", "s"]
+TEST_DATA_MATRIX = [
+    [1, 1.1, "aa"],
+    [2, 2.2, "bbb"],
+    [3, -0.001, datetime.datetime(2017, 1, 1)],
+    [None, 44444, None],
+]
+
+
+def transpose(data_matrix):
+    return [list(column) for column in zip(*data_matrix)]
+
+
+class Test_ColumnarPropertyExtractor_extract_column_property_list:
+
+    @pytest.mark.parametrize(["header_list", "executor_type", "chunk_size"], [
+        [TEST_HEADER_LIST, ExecutorType.SERIAL, None],
+        [None, ExecutorType.SERIAL, None],
+        [TEST_HEADER_LIST, ExecutorType.THREAD, 1],
+        [TEST_HEADER_LIST, ExecutorType.PROCESS, 2],
+        [TEST_HEADER_LIST, ExecutorType.AUTO, None],
+    ])
+    def test_normal(self, header_list, executor_type, chunk_size):
+        prop_extractor = ColumnarPropertyExtractor()
+        prop_extractor.header_list = header_list
+        prop_extractor.column_matrix = transpose(TEST_DATA_MATRIX)
+        prop_extractor.executor_type = executor_type
+        prop_extractor.max_workers = 2
+        prop_extractor.chunk_size = chunk_size
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(),
+            extract_column_property_list(header_list, TEST_DATA_MATRIX))
+
+    def test_normal_iterable(self):
+        prop_extractor = ColumnarPropertyExtractor()
+        prop_extractor.column_matrix = (
+            column for column in [
+                array.array("i", [1, 2, 3]),
+                (value * 0.5 for value in range(3)),
+                iter(["a", "bb", None]),
+            ])
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(),
+            extract_column_property_list(
+                None, [[1, 0.0, "a"], [2, 0.5, "bb"], [3, 1.0, None]]))
+
+    def test_normal_jagged(self):
+        prop_extractor = ColumnarPropertyExtractor()
+        prop_extractor.column_matrix = [[1, 2, 3], ["a"], []]
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(),
+            extract_column_property_list(
+                None, [[1, "a", None], [2, None, None], [3, None, None]]))
+
+    def test_null(self):
+        prop_extractor = ColumnarPropertyExtractor()
+
+        assert prop_extractor.extract_column_property_list() == []
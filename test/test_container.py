@@ -9,6 +9,9 @@ import pytest
 import six
 
 
+nan = float("nan")
+
+
 @pytest.fixture
 def container():
     return MinMaxContainer()
@@ -128,3 +131,113 @@ class Test_MinMaxContainer_update:
 
         assert container.min_value == -six.MAXSIZE
         assert container.max_value == six.MAXSIZE
+
+
+class Test_MultisetMinMaxContainer_update_remove:
+
+    @pytest.mark.parametrize(
+        ["value_list", "remove_list", "expected_min", "expected_max"],
+        [
+            [[1, 2, 3], [], 1, 3],
+            [[1, 2, 3], [1], 2, 3],
+            [[1, 2, 3], [3], 1, 2],
+            [[1, 1, 3, 3], [1, 3], 1, 3],
+            [[1, 2, 3], [1, 2, 3], None, None],
+            [[None, -1.5, 2, None], [None, 2], -1.5, -1.5],
+        ])
+    def test_normal(self, value_list, remove_list, expected_min, expected_max):
+        container = MultisetMinMaxContainer(value_list)
+        for value in remove_list:
+            container.remove(value)
+
+        assert container.min_value == expected_min
+        assert container.max_value == expected_max
+
+    def test_normal_count_table(self):
+        container = MultisetMinMaxContainer([1, 1, 2])
+
+        assert container.count_table == {1: 2, 2: 1}
+        assert container.count(1) == 2
+        assert container.count(3) == 0
+        assert container == MinMaxContainer([1, 2])
+        assert str(container) == "min=1, max=2"
+
+    @pytest.mark.parametrize(["value_list", "value", "expected"], [
+        [[], 1, ValueError],
+        [[1, 2], 3, ValueError],
+    ])
+    def test_exception(self, value_list, value, expected):
+        container = MultisetMinMaxContainer(value_list)
+
+        with pytest.raises(expected):
+            container.remove(value)
+
+
+class Test_MinMaxContainer_merge:
+
+    @pytest.mark.parametrize(["lhs", "rhs", "expected"], [
+        [[1, 3], [0, 2], MinMaxContainer([0, 3])],
+        [[1, 3], [], MinMaxContainer([1, 3])],
+        [[], [1, 3], MinMaxContainer([1, 3])],
+    ])
+    def test_normal(self, lhs, rhs, expected):
+        container = MinMaxContainer(lhs)
+        container.merge(MinMaxContainer(rhs))
+
+        assert container == expected
+
+    def test_normal_multiset(self):
+        container = MultisetMinMaxContainer([1, 3])
+        container.merge(MultisetMinMaxContainer([3, 5]))
+
+        assert container.count_table == {1: 1, 3: 2, 5: 1}
+
+        container.remove(5)
+        assert container == MinMaxContainer([1, 3])
+
+
+class Test_MomentContainer:
+
+    @pytest.mark.parametrize(["value_list", "expected_mean", "expected_var"], [
+        [[1, 2, 3, 4], 2.5, 1.25],
+        [[None, 1.5, nan, 1.5], 1.5, 0],
+        [[-six.MAXSIZE, six.MAXSIZE], 0, float(six.MAXSIZE) ** 2],
+    ])
+    def test_normal(self, value_list, expected_mean, expected_var):
+        container = MomentContainer(value_list)
+
+        assert container.mean() == pytest.approx(expected_mean)
+        assert container.variance() == pytest.approx(expected_var)
+
+    def test_normal_remove(self):
+        container = MomentContainer([1, 2, 3, 10])
+        container.remove(10)
+
+        assert container.count == 3
+        assert container.mean() == pytest.approx(2)
+        assert container.variance() == pytest.approx(2.0 / 3)
+
+        for value in [1, 2, 3]:
+            container.remove(value)
+        assert container.count == 0
+
+    @pytest.mark.parametrize(["lhs", "rhs"], [
+        [[1, 2, 3], [4, 5, 6, 7]],
+        [[], [4, 5]],
+        [[4, 5], []],
+    ])
+    def test_normal_merge(self, lhs, rhs):
+        container = MomentContainer(lhs)
+        container.merge(MomentContainer(rhs))
+        expected = MomentContainer(lhs + rhs)
+
+        assert container.count == expected.count
+        assert container.mean() == pytest.approx(expected.mean())
+        assert container.variance() == pytest.approx(expected.variance())
+
+    def test_null(self):
+        container = MomentContainer()
+
+        assert container.count == 0
+        assert is_nan(container.mean())
+        assert is_nan(container.variance())
@@ -0,0 +1,185 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import csv
+import io
+
+import pytest
+
+from dataproperty import *
+from dataproperty._csv_extractor import split_csv_range
+
+from helper import extract_column_property_list
+from helper import assert_column_property_list_equal
+
+
+TEST_CSV = u"""i,f,s,"quoted
+header"
+1,1.1,aa,"a
+b"
+2,2.2,"b,bb",""
+3,-0.1,"c""c",2017-01-01 00:00:00
+
+4,"5","d
+""e""
+f",x
+"""
+
+
+def load_csv(text):
+    return [
+        row for row in csv.reader(io.StringIO(text, newline="")) if row]
+
+
+@pytest.fixture
+def csv_path(tmpdir):
+    path = tmpdir.join("test.csv")
+    path.write_binary(TEST_CSV.encode("utf-8"))
+
+    return str(path)
+
+
+class Test_split_csv_range:
+
+    @pytest.mark.parametrize(["chunk_byte_size"], [
+        [1], [5], [16], [1024],
+    ])
+    def test_normal(self, chunk_byte_size):
+        buf = TEST_CSV.encode("utf-8")
+        range_list = split_csv_range(buf, chunk_byte_size, b'"')
+
+        assert range_list[0][0] == 0
+        assert range_list[-1][1] == len(buf)
+
+        row_list = []
+        for start, end in range_list:
+            row_list.extend(load_csv(buf[start:end].decode("utf-8")))
+
+        assert row_list == load_csv(TEST_CSV)
+
+    @pytest.mark.parametrize(["value", "delimiter", "expected"], [
+        [b'1,5"inch\n2,"q\nw"\n', b",", [(0, 9), (9, 17)]],
+        [b'"a""\nb",c\n1\n', b",", [(0, 10), (10, 12)]],
+        [b'a\r"b\nc"\n', b",", [(0, 8)]],
+        [b'1;"q\nw"\n', b";", [(0, 8)]],
+        [b'1,"q\nw', b",", [(0, 6)]],
+    ])
+    def test_normal_quote(self, value, delimiter, expected):
+        assert split_csv_range(value, 1, b'"', 0, delimiter) == expected
+
+    def test_null(self):
+        assert split_csv_range(b"", 16, b'"') == []
+
+
+class Test_CsvPropertyExtractor_extract_column_property_list:
+
+    @pytest.mark.parametrize(["executor_type", "chunk_byte_size"], [
+        [ExecutorType.SERIAL, 1],
+        [ExecutorType.SERIAL, 20],
+        [ExecutorType.SERIAL, 1024],
+        [ExecutorType.THREAD, 8],
+        [ExecutorType.PROCESS, 8],
+        [ExecutorType.AUTO, 8],
+    ])
+    def test_normal(self, csv_path, executor_type, chunk_byte_size):
+        row_list = load_csv(TEST_CSV)
+        expected_extractor = PropertyExtractor()
+        expected_extractor.header_list = row_list[0]
+        expected_extractor.data_matrix = row_list[1:]
+
+        prop_extractor = CsvPropertyExtractor()
+        prop_extractor.source_path = csv_path
+        prop_extractor.executor_type = executor_type
+        prop_extractor.max_workers = 2
+        prop_extractor.chunk_byte_size = chunk_byte_size
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(),
+            expected_extractor.extract_column_property_list())
+
+    def test_normal_header_list(self, csv_path):
+        row_list = load_csv(TEST_CSV)
+        expected_extractor = PropertyExtractor()
+        expected_extractor.header_list = ["a", "b", "c", "d"]
+        expected_extractor.data_matrix = row_list
+
+        prop_extractor = CsvPropertyExtractor()
+        prop_extractor.source_path = csv_path
+        prop_extractor.header_list = ["a", "b", "c", "d"]
+        prop_extractor.chunk_byte_size = 16
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(),
+            expected_extractor.extract_column_property_list())
+
+    @pytest.mark.parametrize(["executor_type"], [
+        [ExecutorType.SERIAL],
+        [ExecutorType.PROCESS],
+    ])
+    def test_normal_longer_than_header(self, tmpdir, executor_type):
+        path = tmpdir.join("ragged.csv")
+        path.write_binary(b"a,b\n1,2\n3,4,xyz\n5\n")
+        expected_extractor = PropertyExtractor()
+        expected_extractor.header_list = ["a", "b"]
+        expected_extractor.data_matrix = [["1", "2"], ["3", "4", "xyz"], ["5"]]
+
+        prop_extractor = CsvPropertyExtractor()
+        prop_extractor.source_path = str(path)
+        prop_extractor.executor_type = executor_type
+        prop_extractor.max_workers = 2
+        prop_extractor.chunk_byte_size = 4
+
+        column_prop_list = prop_extractor.extract_column_property_list()
+
+        assert len(column_prop_list) == 3
+        assert_column_property_list_equal(
+            column_prop_list,
+            expected_extractor.extract_column_property_list())
+
+    @pytest.mark.parametrize(["chunk_byte_size"], [[16], [1024]])
+    def test_normal_unquoted_quote(self, tmpdir, chunk_byte_size):
+        # a quote inside an unquoted field does not start a quoted field
+        text = 'a,b\n1,5"inch\n' + '2,"q\nw"\n' * 50
+        path = tmpdir.join("quote.csv")
+        path.write_binary(text.encode("utf-8"))
+        row_list = load_csv(text)
+
+        prop_extractor = CsvPropertyExtractor()
+        prop_extractor.source_path = str(path)
+        prop_extractor.chunk_byte_size = chunk_byte_size
+
+        column_prop_list = prop_extractor.extract_column_property_list()
+
+        assert len(row_list) == 52
+        assert column_prop_list[0].typecode == Typecode.INT
+        assert_column_property_list_equal(
+            column_prop_list,
+            extract_column_property_list(row_list[0], row_list[1:]))
+
+    def test_normal_cache(self, csv_path, tmpdir):
+        prop_extractor = CsvPropertyExtractor()
+        prop_extractor.source_path = csv_path
+        prop_extractor.cache = ColumnPropertyCache(str(tmpdir.join("cache")))
+
+        expected_list = prop_extractor.extract_column_property_list()
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(), expected_list)
+
+    @pytest.mark.parametrize(["value"], [
+        [u""],
+        [u"a,b\n"],
+        [u"a,b\n\n\n"],
+    ])
+    def test_null(self, tmpdir, value):
+        path = tmpdir.join("null.csv")
+        path.write_binary(value.encode("utf-8"))
+
+        prop_extractor = CsvPropertyExtractor()
+        prop_extractor.source_path = str(path)
+        prop_extractor.chunk_byte_size = 1
+
+        assert prop_extractor.extract_column_property_list() == []
@@ -0,0 +1,218 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import datetime
+
+import pytest
+
+from dataproperty import *
+
+from helper import extract_column_property_list
+from helper import assert_column_property_list_equal
+
+
+TEST_DATA_MATRIX = [
+    [1, 1.1, "aa", 1, 1],
+    [2, 2.2, "bbb", 2.2, 2.2],
+    [3, 3.33, "cccc", -3, "ccc"],
+    [None, -0.001, None, 44444, datetime.datetime(2017, 1, 1)],
+]
+
+
+@pytest.fixture
+def incremental_extractor():
+    return IncrementalPropertyExtractor()
+
+
+class Test_IncrementalPropertyExtractor_append_rows:
+
+    @pytest.mark.parametrize(["header_list", "value", "chunk_size"], [
+        [["i", "f", "s", "if", "mix"], TEST_DATA_MATRIX, 1],
+        [["i", "f", "s", "if", "mix"], TEST_DATA_MATRIX, 3],
+        [None, TEST_DATA_MATRIX, 2],
+        [[], TEST_DATA_MATRIX, 4],
+    ])
+    def test_normal(
+            self, incremental_extractor, header_list, value, chunk_size):
+        incremental_extractor.header_list = header_list
+
+        for i in range(0, len(value), chunk_size):
+            col_prop_list = incremental_extractor.append_rows(
+                value[i:i + chunk_size])
+            expected_list = extract_column_property_list(
+                header_list, value[:i + chunk_size])
+
+            assert len(col_prop_list) == len(expected_list)
+            for col_prop, expected in zip(col_prop_list, expected_list):
+                assert str(col_prop) == str(expected)
+
+        assert incremental_extractor.row_count == len(value)
+        assert incremental_extractor.column_property_list == col_prop_list
+
+    @pytest.mark.parametrize(["value"], [
+        [[[1, 2, 3], [1, 2], [1, 2, 3]]],
+        [[[1], [1, 2.5], [], [1, 2, "abc"]]],
+    ])
+    def test_normal_jagged(self, incremental_extractor, value):
+        incremental_extractor.append_rows(value[:1])
+        col_prop_list = incremental_extractor.append_rows(value[1:])
+        expected_list = extract_column_property_list(None, value)
+
+        assert len(col_prop_list) == len(expected_list)
+        for col_prop, expected in zip(col_prop_list, expected_list):
+            assert str(col_prop) == str(expected)
+            assert col_prop.typecode_count_table == (
+                expected.typecode_count_table)
+
+    def test_normal_extract_column_property_list(
+            self, incremental_extractor):
+        incremental_extractor.append_rows([[1, 2], [3, 4]])
+
+        assert_column_property_list_equal(
+            incremental_extractor.extract_column_property_list(),
+            extract_column_property_list(None, [[1, 2], [3, 4]]))
+        assert not hasattr(incremental_extractor, "data_matrix")
+
+    def test_normal_copy(self, incremental_extractor):
+        incremental_extractor.append_rows([[1, 2]])
+        incremental_extractor.column_property_list.pop()
+        incremental_extractor.append_rows([[3, 4]]).pop()
+
+        assert len(incremental_extractor.column_property_list) == 2
+
+    def test_normal_clear(self, incremental_extractor):
+        incremental_extractor.append_rows(TEST_DATA_MATRIX)
+        incremental_extractor.clear()
+
+        assert incremental_extractor.row_count == 0
+        assert incremental_extractor.column_property_list == []
+
+    def test_null(self, incremental_extractor):
+        assert incremental_extractor.append_rows([]) == []
+
+    @pytest.mark.parametrize(["value", "expected"], [
+        [None, TypeError],
+    ])
+    def test_exception(self, incremental_extractor, value, expected):
+        with pytest.raises(expected):
+            incremental_extractor.append_rows(value)
+
+
+class Test_IncrementalPropertyExtractor_update_cell:
+
+    @pytest.mark.parametrize(["row_idx", "col_idx", "value"], [
+        [0, 0, 12345],
+        [2, 1, "abc"],
+        [3, 4, 1.5],
+        [1, 2, None],
+    ])
+    def test_normal(self, incremental_extractor, row_idx, col_idx, value):
+        header_list = ["i", "f", "s", "if", "mix"]
+        incremental_extractor.header_list = header_list
+        incremental_extractor.is_removable = True
+        incremental_extractor.append_rows(TEST_DATA_MATRIX)
+
+        col_prop = incremental_extractor.update_cell(row_idx, col_idx, value)
+
+        data_matrix = [list(row) for row in TEST_DATA_MATRIX]
+        data_matrix[row_idx][col_idx] = value
+        expected_list = extract_column_property_list(header_list, data_matrix)
+
+        assert col_prop is incremental_extractor.column_property_list[col_idx]
+        for col_prop, expected in zip(
+                incremental_extractor.column_property_list, expected_list):
+            assert str(col_prop) == str(expected)
+
+    @pytest.mark.parametrize(["value", "col_idx", "expected"], [
+        [[[1, "a", 1.5], [2]], -1, [[1, "a", 1.5], [2, None, "x"]]],
+        [[[1, "a", 1.5], [2]], -3, [[1, "a", 1.5], ["x"]]],
+    ])
+    def test_normal_negative(
+            self, incremental_extractor, value, col_idx, expected):
+        incremental_extractor.is_removable = True
+        incremental_extractor.append_rows(value)
+
+        col_prop = incremental_extractor.update_cell(1, col_idx, "x")
+
+        assert col_prop is incremental_extractor.column_property_list[col_idx]
+        assert_column_property_list_equal(
+            incremental_extractor.column_property_list,
+            extract_column_property_list(None, expected))
+
+    def test_exception(self, incremental_extractor):
+        incremental_extractor.append_rows(TEST_DATA_MATRIX)
+
+        with pytest.raises(RuntimeError):
+            incremental_extractor.update_cell(0, 0, 1)
+
+    @pytest.mark.parametrize(["col_idx"], [[5], [-6]])
+    def test_exception_index(self, incremental_extractor, col_idx):
+        incremental_extractor.is_removable = True
+        incremental_extractor.append_rows(TEST_DATA_MATRIX)
+
+        with pytest.raises(IndexError):
+            incremental_extractor.update_cell(0, col_idx, 1)
+
+
+class Test_IncrementalPropertyExtractor_delete_row:
+
+    @pytest.mark.parametrize(["row_idx"], [[0], [1], [3], [-1]])
+    def test_normal(self, incremental_extractor, row_idx):
+        incremental_extractor.is_removable = True
+        incremental_extractor.append_rows(TEST_DATA_MATRIX)
+
+        col_prop_list = incremental_extractor.delete_row(row_idx)
+
+        data_matrix = list(TEST_DATA_MATRIX)
+        del data_matrix[row_idx]
+        expected_list = extract_column_property_list(None, data_matrix)
+
+        assert incremental_extractor.row_count == len(data_matrix)
+        for col_prop, expected in zip(col_prop_list, expected_list):
+            assert str(col_prop) == str(expected)
+
+    @pytest.mark.parametrize(["row_idx", "expected_column_count"], [
+        [0, 3],
+        [1, 3],
+        [2, 2],
+    ])
+    def test_normal_jagged(
+            self, incremental_extractor, row_idx, expected_column_count):
+        data_matrix = [[1, "a"], [2.5], [3, "bb", "c"]]
+        incremental_extractor.is_removable = True
+        incremental_extractor.append_rows(data_matrix)
+
+        col_prop_list = incremental_extractor.delete_row(row_idx)
+
+        data_matrix = list(data_matrix)
+        del data_matrix[row_idx]
+
+        assert len(col_prop_list) == expected_column_count
+        assert_column_property_list_equal(
+            incremental_extractor.column_property_list,
+            extract_column_property_list(None, data_matrix))
+
+    def test_normal_jagged_updated(self, incremental_extractor):
+        incremental_extractor.is_removable = True
+        incremental_extractor.append_rows([[1], [2, "a", "b"], [3]])
+
+        # the row is widened by the update
+        incremental_extractor.update_cell(0, 1, "x")
+        incremental_extractor.delete_row(1)
+
+        assert_column_property_list_equal(
+            incremental_extractor.column_property_list,
+            extract_column_property_list(None, [[1, "x"], [3]]))
+
+        incremental_extractor.delete_row(0)
+        incremental_extractor.delete_row(0)
+        assert incremental_extractor.column_property_list == []
+
+    def test_exception(self, incremental_extractor):
+        incremental_extractor.append_rows(TEST_DATA_MATRIX)
+
+        with pytest.raises(RuntimeError):
+            incremental_extractor.delete_row(0)
@@ -0,0 +1,88 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import sys
+
+import pytest
+
+from dataproperty import *
+
+
+def new_str(value):
+    # an equal but distinct string object
+    return "".join(list(value))
+
+
+class Test_StringInternTable_intern:
+
+    def test_normal(self):
+        table = StringInternTable()
+        first = new_str("host-a")
+        second = new_str("host-a")
+        assert first is not second
+
+        assert table.intern(first) is first
+        assert table.intern(second) is first
+        assert table.intern(first) is first
+        assert table.size == 1
+        assert table.hit_count == 1
+        assert table.saved_byte_count == sys.getsizeof(second)
+
+    @pytest.mark.parametrize(["value"], [
+        [None],
+        [1],
+        [1.5],
+        [b"\x00\x01"] if sys.version_info[0] >= 3 else [bytearray(b"a")],
+    ])
+    def test_normal_not_string(self, value):
+        table = StringInternTable()
+
+        assert table.intern(value) is value
+        assert table.size == 0
+
+    def test_normal_max_size(self):
+        table = StringInternTable(max_size=1)
+        table.intern(new_str("aa"))
+        value = new_str("bb")
+
+        assert table.intern(value) is value
+        assert table.intern(new_str("bb")) is not value
+        assert table.size == 1
+        assert table.max_size == 1
+
+    def test_normal_clear(self):
+        table = StringInternTable()
+        table.intern(new_str("a"))
+        table.intern(new_str("a"))
+        table.clear()
+
+        assert table.size == 0
+        assert table.hit_count == 0
+        assert table.saved_byte_count == 0
+
+
+class Test_PropertyExtractor_string_intern_table:
+
+    def test_normal(self):
+        table = StringInternTable()
+        prop_extractor = PropertyExtractor()
+        prop_extractor.data_matrix = [
+            [new_str("ok"), new_str("a\tb"), 1],
+            [new_str("ok"), new_str("a\tb"), 2],
+            [new_str("ng"), new_str("a\tb"), 3],
+        ]
+        prop_extractor.string_intern_table = table
+        prop_matrix = prop_extractor.extract_data_property_matrix()
+
+        assert prop_matrix[0][0].data is prop_matrix[1][0].data
+        assert prop_matrix[0][1].data == "a  b"
+        assert prop_matrix[0][1].data is prop_matrix[2][1].data
+        assert prop_matrix[2][0].data == "ng"
+        assert table.hit_count == 3
+        assert table.saved_byte_count > 0
+
+        prop_view = prop_extractor.extract_data_property_matrix_view()
+        assert prop_view[1, 1].data is prop_matrix[0][1].data
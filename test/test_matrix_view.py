@@ -0,0 +1,188 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import datetime
+
+import pytest
+from six.moves import range
+
+from dataproperty import *
+
+
+TEST_DATA_MATRIX = [
+    [1, 1.1, "aa"],
+    [2, "2.2", "bbb"],
+    [3, -0.001, datetime.datetime(2017, 1, 1)],
+    [None, 44444],
+    None,
+]
+
+
+def extract_data_property_matrix(data_matrix, none_value=None):
+    prop_extractor = PropertyExtractor()
+    prop_extractor.data_matrix = data_matrix
+    prop_extractor.none_value = none_value
+
+    return prop_extractor.extract_data_property_matrix()
+
+
+def extract_data_property_matrix_view(
+        data_matrix, none_value=None, max_cache_size=4096):
+    prop_extractor = PropertyExtractor()
+    prop_extractor.data_matrix = data_matrix
+    prop_extractor.none_value = none_value
+
+    return prop_extractor.extract_data_property_matrix_view(max_cache_size)
+
+
+def assert_data_property_list_equal(lhs_list, rhs_list):
+    assert len(lhs_list) == len(rhs_list)
+
+    for lhs, rhs in zip(lhs_list, rhs_list):
+        assert str(lhs) == str(rhs)
+
+
+class Test_DataPropertyMatrixView_getitem:
+
+    @pytest.mark.parametrize(["none_value"], [
+        [None],
+        ["null"],
+    ])
+    def test_normal_row(self, none_value):
+        expected = extract_data_property_matrix(TEST_DATA_MATRIX, none_value)
+        view = extract_data_property_matrix_view(TEST_DATA_MATRIX, none_value)
+
+        assert len(view) == len(expected)
+        for row_idx, expected_list in enumerate(expected):
+            assert_data_property_list_equal(view[row_idx], expected_list)
+
+        assert_data_property_list_equal(view[-2], expected[-2])
+
+    @pytest.mark.parametrize(["row_idx", "col_idx", "expected"], [
+        [0, 0, 1],
+        [1, 1, 2.2],
+        [2, -1, datetime.datetime(2017, 1, 1)],
+        [-2, 1, 44444],
+        [3, 0, None],
+    ])
+    def test_normal_cell(self, row_idx, col_idx, expected):
+        view = extract_data_property_matrix_view(TEST_DATA_MATRIX)
+
+        assert view[row_idx, col_idx].data == expected
+
+    def test_normal_slice(self):
+        expected = extract_data_property_matrix(TEST_DATA_MATRIX)
+        view = extract_data_property_matrix_view(TEST_DATA_MATRIX)
+
+        for lhs_list, rhs_list in zip(view[1:4], expected[1:4]):
+            assert_data_property_list_equal(lhs_list, rhs_list)
+
+        assert_data_property_list_equal(view[2, 1:], expected[2][1:])
+        assert_data_property_list_equal(
+            view[:4, 1], [data_list[1] for data_list in expected[:4]])
+        assert [
+            [dataprop.data for dataprop in data_list]
+            for data_list in view[::2, :2]
+        ] == [[1, 1.1], [3, -0.001], []]
+        assert view[10:] == []
+
+    def test_normal_iter(self):
+        expected = extract_data_property_matrix(TEST_DATA_MATRIX)
+        view = extract_data_property_matrix_view(TEST_DATA_MATRIX)
+
+        for lhs_list, rhs_list in zip(view, expected):
+            assert_data_property_list_equal(lhs_list, rhs_list)
+
+    def test_normal_lazy(self):
+        data_matrix = [[i, str(i), i * 0.5] for i in range(100000)]
+        view = extract_data_property_matrix_view(data_matrix)
+
+        assert len(view) == 100000
+        assert view.cache_size == 0
+
+        assert [dataprop.data for dataprop in view[-1]] == [
+            99999, 99999, 49999.5]
+        assert view.cache_size == 3
+
+    def test_normal_iterable(self):
+        view = extract_data_property_matrix_view(
+            iter(TEST_DATA_MATRIX[:3]))
+
+        assert len(view) == 3
+        assert view[2, 0].data == 3
+
+    @pytest.mark.parametrize(["key", "expected"], [
+        [5, IndexError],
+        [-6, IndexError],
+        [(0, 3), IndexError],
+        [(3, 2), IndexError],
+        [(4, 0), IndexError],
+    ])
+    def test_exception(self, key, expected):
+        view = extract_data_property_matrix_view(TEST_DATA_MATRIX)
+
+        with pytest.raises(expected):
+            view[key]
+
+
+class Test_DataPropertyMatrixView_cache:
+
+    def test_normal_reuse(self):
+        view = extract_data_property_matrix_view(TEST_DATA_MATRIX)
+
+        assert view[0, 0] is view[0, 0]
+        assert view[0][0] is view[0, 0]
+        assert view.cache_size == 3
+
+    def test_normal_lru(self):
+        view = extract_data_property_matrix_view(
+            TEST_DATA_MATRIX, max_cache_size=2)
+        first = view[0, 0]
+        view[0, 1]
+        view[0, 0]
+        view[0, 2]
+
+        assert view.max_cache_size == 2
+        assert view.cache_size == 2
+
+        # (0, 1) is evicted as the least recently used cell
+        assert view[0, 0] is first
+        view[0, 1]
+        view[0, 2]
+        assert view[0, 0] is not first
+
+    def test_normal_clear_cache(self):
+        data_matrix = [[1, 2], [3, 4]]
+        view = extract_data_property_matrix_view(data_matrix)
+
+        assert view[0, 0].data == 1
+
+        data_matrix[0][0] = "a"
+        assert view[0, 0].data == 1
+
+        view.clear_cache()
+        assert view.cache_size == 0
+        assert view[0, 0].data == "a"
+
+
+class Test_BasePropertyExtractor_extract_data_property_matrix_view:
+
+    @pytest.mark.parametrize(["extractor_class"], [
+        [CsvPropertyExtractor],
+        [ColumnarPropertyExtractor],
+        [MultiFilePropertyExtractor],
+        [RecordPropertyExtractor],
+        [SparsePropertyExtractor],
+        [SqlitePropertyExtractor],
+    ])
+    def test_normal(self, extractor_class):
+        prop_extractor = extractor_class()
+
+        # extractors of the inputs other than a data matrix
+        assert isinstance(prop_extractor, BasePropertyExtractor)
+        assert not isinstance(prop_extractor, PropertyExtractor)
+        assert not hasattr(
+            prop_extractor, "extract_data_property_matrix_view")
@@ -0,0 +1,153 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import pytest
+
+from dataproperty import *
+
+from helper import assert_column_property_list_equal
+
+
+TEST_HEADER_LIST = ["i", "f", "s"]
+TEST_DATA_MATRIX = [
+    [1, 1.1, "aa"],
+    [2, 2.2, "bbb"],
+    [3, -0.1, "2017-01-01 00:00:00"],
+    [4, 5, None],
+    [5, 1.25, "x"],
+]
+
+
+def to_csv(header_list, data_matrix):
+    return "".join([
+        ",".join(["" if value is None else str(value) for value in row]) +
+        "\n"
+        for row in [header_list] + data_matrix
+    ])
+
+
+def to_jsonl(header_list, data_matrix):
+    import json
+
+    return "".join([
+        json.dumps(dict(zip(header_list, row))) + "\n"
+        for row in data_matrix
+    ])
+
+
+def write_shard_list(tmpdir, extension, converter, split_list):
+    path_list = []
+
+    for idx, (start, end) in enumerate(split_list):
+        path = tmpdir.join("shard%d%s" % (idx, extension))
+        path.write(converter(TEST_HEADER_LIST, TEST_DATA_MATRIX[start:end]))
+        path_list.append(str(path))
+
+    return path_list
+
+
+class Test_MultiFilePropertyExtractor_extract_column_property_list:
+
+    @pytest.mark.parametrize(
+        ["extension", "converter", "expected_data_matrix", "executor_type"],
+        [
+            [
+                ".csv", to_csv,
+                [
+                    ["" if value is None else str(value) for value in row]
+                    for row in TEST_DATA_MATRIX
+                ],
+                executor_type,
+            ]
+            for executor_type in (
+                ExecutorType.SERIAL, ExecutorType.THREAD,
+                ExecutorType.PROCESS, ExecutorType.AUTO)
+        ] + [
+            [".jsonl", to_jsonl, TEST_DATA_MATRIX, executor_type]
+            for executor_type in (ExecutorType.SERIAL, ExecutorType.PROCESS)
+        ])
+    def test_normal(
+            self, tmpdir, extension, converter, expected_data_matrix,
+            executor_type):
+        expected_extractor = PropertyExtractor()
+        expected_extractor.header_list = TEST_HEADER_LIST
+        expected_extractor.data_matrix = expected_data_matrix
+
+        prop_extractor = MultiFilePropertyExtractor()
+        prop_extractor.source_path_list = write_shard_list(
+            tmpdir, extension, converter, [(0, 2), (2, 2), (2, 5)])
+        prop_extractor.executor_type = executor_type
+        prop_extractor.max_workers = 2
+        prop_extractor.batch_row_count = 2
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(),
+            expected_extractor.extract_column_property_list())
+
+        assert [
+            shard_timing.row_count
+            for shard_timing in prop_extractor.shard_timing_list
+        ] == [2, 0, 3]
+        for shard_timing in prop_extractor.shard_timing_list:
+            assert shard_timing.elapsed_time >= 0
+
+    def test_normal_file_format(self, tmpdir):
+        path = tmpdir.join("shard.txt")
+        path.write(to_jsonl(TEST_HEADER_LIST, TEST_DATA_MATRIX))
+
+        prop_extractor = MultiFilePropertyExtractor()
+        prop_extractor.source_path_list = [str(path)]
+        prop_extractor.file_format = FileFormat.JSONL
+
+        assert len(prop_extractor.extract_column_property_list()) == 3
+
+    def test_normal_unquoted_quote(self, tmpdir):
+        # a quote inside an unquoted field does not start a quoted field
+        path_list = []
+        for idx in range(2):
+            path = tmpdir.join("shard%d.csv" % (idx))
+            path.write_binary(b'a,b\n1,5"inch\n' + b'2,"q\nw"\n' * 10)
+            path_list.append(str(path))
+
+        prop_extractor = MultiFilePropertyExtractor()
+        prop_extractor.source_path_list = path_list
+        prop_extractor.chunk_byte_size = 16
+
+        column_prop_list = prop_extractor.extract_column_property_list()
+
+        assert [
+            shard_timing.row_count
+            for shard_timing in prop_extractor.shard_timing_list
+        ] == [11, 11]
+        assert column_prop_list[0].typecode == Typecode.INT
+
+    def test_null(self):
+        prop_extractor = MultiFilePropertyExtractor()
+
+        assert prop_extractor.extract_column_property_list() == []
+        assert prop_extractor.shard_timing_list == []
+
+    def test_exception_header(self, tmpdir):
+        path_list = write_shard_list(
+            tmpdir, ".csv", to_csv, [(0, 2), (2, 5)])
+        with open(path_list[1], "w") as f:
+            f.write(to_csv(["a", "b", "c"], TEST_DATA_MATRIX[2:5]))
+
+        prop_extractor = MultiFilePropertyExtractor()
+        prop_extractor.source_path_list = path_list
+
+        with pytest.raises(ValueError):
+            prop_extractor.extract_column_property_list()
+
+    def test_exception_file_format(self, tmpdir):
+        path = tmpdir.join("shard.txt")
+        path.write("")
+
+        prop_extractor = MultiFilePropertyExtractor()
+        prop_extractor.source_path_list = [str(path)]
+
+        with pytest.raises(ValueError):
+            prop_extractor.extract_column_property_list()
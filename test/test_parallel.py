@@ -0,0 +1,187 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import datetime
+
+import pytest
+
+from dataproperty import *
+from dataproperty._parallel import is_shared_memory_available
+
+from helper import extract_column_property_list
+from helper import assert_column_property_list_equal
+
+
+TEST_HEADER_LIST = ["i", "f", "s", "if", "mix"]
+TEST_DATA_MATRIX = [
+    [1, 1.1, "aa", 1, 1],
+    [2, 2.2, "bbb", 2.2, 2.2],
+    [3, 3.33, "cccc", -3, "ccc"],
+    [None, -0.001, None, 44444, datetime.datetime(2017, 1, 1)],
+    [5, "1.5", "d\te", "", None],
+]
+
+
+class Test_PropertyExtractor_process:
+
+    @pytest.mark.parametrize(
+        ["header_list", "value", "chunk_size", "is_shared_memory"],
+        [
+            [TEST_HEADER_LIST, TEST_DATA_MATRIX, 1, True],
+            [TEST_HEADER_LIST, TEST_DATA_MATRIX, 2, False],
+            [None, TEST_DATA_MATRIX, None, True],
+            [None, [[1, 2, 3], [1.5, 2], [1, 2, 3]], 1, True],
+            [None, [], None, True],
+        ])
+    def test_normal(self, header_list, value, chunk_size, is_shared_memory):
+        expected_list = extract_column_property_list(header_list, value)
+        column_prop_list = extract_column_property_list(
+            header_list, value, ExecutorType.PROCESS, max_workers=2,
+            chunk_size=chunk_size, is_shared_memory=is_shared_memory,
+            distinct_precision=8)
+
+        assert_column_property_list_equal(column_prop_list, expected_list)
+        for column_prop in column_prop_list:
+            assert column_prop.distinct_sketch.precision == 8
+
+    @pytest.mark.parametrize(
+        ["header_list", "value", "shard_type", "is_shared_memory"],
+        [
+            [TEST_HEADER_LIST, TEST_DATA_MATRIX, ShardType.COLUMN, True],
+            [TEST_HEADER_LIST, TEST_DATA_MATRIX, ShardType.COLUMN, False],
+            [TEST_HEADER_LIST, TEST_DATA_MATRIX, ShardType.ROW, True],
+            [TEST_HEADER_LIST, TEST_DATA_MATRIX[:2], ShardType.AUTO, True],
+            [TEST_HEADER_LIST, TEST_DATA_MATRIX[:2], ShardType.AUTO, False],
+            [None, [[1, 2, 3], [1.5, 2], [1, 2, 3]], ShardType.COLUMN, True],
+            [None, [[1], [1.5, 2], [], [1, 2, 3]], ShardType.COLUMN, True],
+            [None, [[1], [1.5, 2], [], [1, 2, 3]], ShardType.COLUMN, False],
+            [None, [[1], [1.5, 2], [], [1, 2, 3]], ShardType.ROW, True],
+            [None, [[i] * 50 for i in range(3)], ShardType.AUTO, True],
+        ])
+    def test_normal_shard_type(
+            self, header_list, value, shard_type, is_shared_memory):
+        expected_list = extract_column_property_list(header_list, value)
+        column_prop_list = extract_column_property_list(
+            header_list, value, ExecutorType.PROCESS, max_workers=2,
+            chunk_size=2, shard_type=shard_type,
+            is_shared_memory=is_shared_memory)
+
+        assert_column_property_list_equal(column_prop_list, expected_list)
+
+    @pytest.mark.parametrize(["header_list", "value", "expected"], [
+        [None, None, TypeError],
+    ])
+    def test_exception(self, header_list, value, expected):
+        with pytest.raises(expected):
+            extract_column_property_list(
+                header_list, value, ExecutorType.PROCESS, max_workers=1)
+
+
+class Test_PropertyExtractor_auto:
+
+    @pytest.mark.parametrize(["header_list", "value"], [
+        [TEST_HEADER_LIST, TEST_DATA_MATRIX],
+        [TEST_HEADER_LIST, TEST_DATA_MATRIX * 20],
+        [None, [[1, 2, 3], [1.5, 2], [1, 2, 3]] * 20],
+        [None, []],
+    ])
+    def test_normal(self, header_list, value):
+        prop_extractor = PropertyExtractor()
+        prop_extractor.header_list = header_list
+        prop_extractor.data_matrix = value
+        prop_extractor.executor_type = ExecutorType.AUTO
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(),
+            extract_column_property_list(header_list, value))
+
+        profile = prop_extractor.execution_profile
+        assert profile.executor_type in (
+            ExecutorType.SERIAL, ExecutorType.THREAD, ExecutorType.PROCESS)
+        assert profile.actual_time >= 0
+        if value:
+            assert profile.probe_row_count == min(len(value), 32)
+            assert profile.estimated_time >= profile.probe_time >= 0
+
+    @pytest.mark.parametrize(["header_list", "value", "expected"], [
+        [TEST_HEADER_LIST, TEST_DATA_MATRIX * 20, ShardType.ROW],
+        [None, [[i] * 50 for i in range(40)], ShardType.COLUMN],
+    ])
+    def test_normal_process(self, monkeypatch, header_list, value, expected):
+        # make the process pool look free to force its selection
+        monkeypatch.setattr(
+            PropertyExtractor, "_PropertyExtractor__PROCESS_POOL_OVERHEAD", 0)
+        monkeypatch.setattr(
+            PropertyExtractor, "_PropertyExtractor__PROCESS_CELL_OVERHEAD", 0)
+        monkeypatch.setattr(
+            "dataproperty._property_extractor.is_free_threaded",
+            lambda: False)
+
+        prop_extractor = PropertyExtractor()
+        prop_extractor.header_list = header_list
+        prop_extractor.data_matrix = value
+        prop_extractor.executor_type = ExecutorType.AUTO
+        prop_extractor.max_workers = 2
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(),
+            extract_column_property_list(header_list, value))
+
+        profile = prop_extractor.execution_profile
+        assert profile.executor_type == ExecutorType.PROCESS
+        assert profile.shard_type == expected
+        assert profile.max_workers == 2
+        assert profile.chunk_size >= 1
+
+    def test_normal_serial_profile(self):
+        prop_extractor = PropertyExtractor()
+        prop_extractor.data_matrix = TEST_DATA_MATRIX
+        prop_extractor.extract_column_property_list()
+
+        profile = prop_extractor.execution_profile
+        assert profile.executor_type == ExecutorType.SERIAL
+        assert profile.probe_time is None
+        assert profile.estimated_time is None
+        assert profile.actual_time >= 0
+
+
+@pytest.mark.skipif(
+    not is_shared_memory_available(), reason="requires shared_memory")
+class Test_SharedMatrix:
+
+    def test_normal(self):
+        from dataproperty._parallel import extract_row_chunk
+        from dataproperty._parallel import extract_shared_row_chunk
+
+        option_table = {"none_value": "null"}
+
+        with SharedMatrix(TEST_DATA_MATRIX) as shared_matrix:
+            assert shared_matrix.row_count == len(TEST_DATA_MATRIX)
+
+            assert_column_property_list_equal(
+                extract_shared_row_chunk(
+                    shared_matrix.layout, 1, 4, option_table),
+                extract_row_chunk(TEST_DATA_MATRIX[1:4], option_table))
+
+    def test_normal_column(self):
+        from dataproperty._parallel import extract_column_chunk
+        from dataproperty._parallel import extract_shared_column_chunk
+        from dataproperty._parallel import get_column_list
+
+        option_table = {"none_value": "null"}
+        column_matrix = get_column_list(TEST_DATA_MATRIX, 0, 3)
+
+        with SharedMatrix(column_matrix) as shared_matrix:
+            assert shared_matrix.row_count == 3
+
+            assert_column_property_list_equal(
+                extract_shared_column_chunk(
+                    shared_matrix.layout, 1, 3, option_table),
+                extract_column_chunk(column_matrix[1:3], option_table))
+
+    def test_null(self):
+        with SharedMatrix([]) as shared_matrix:
+            assert shared_matrix.row_count == 0
@@ -14,6 +14,7 @@ from dataproperty import *
 
 nan = float("nan")
 inf = float("inf")
+DATATIME_DATA = datetime.datetime(2017, 1, 1)
 
 
 @pytest.fixture
@@ -230,6 +231,86 @@ class Test_DataPeroperty_repr:
         assert str(dp) == expected
 
 
+class Test_DataPeroperty_is_retain_data:
+
+    @pytest.mark.parametrize(["value", "is_convert"], [
+        [0, True],
+        [-12.234, True],
+        ["-12.234", True],
+        ["-12.234", False],
+        ["2017-01-02 03:04:05", True],
+        [datetime.datetime(2017, 1, 1), True],
+        ["abcdefg", True],
+        [None, True],
+    ])
+    def test_normal(self, value, is_convert):
+        expected = DataProperty(value, is_convert=is_convert)
+        dp = DataProperty(value, is_convert=is_convert, is_retain_data=False)
+
+        assert dp.data is None
+        assert dp.typecode == expected.typecode
+        assert dp.align == expected.align
+        assert dp.str_len == expected.str_len
+        assert dp.format_str == expected.format_str
+        assert dp.additional_format_len == expected.additional_format_len
+        for attr in ("integer_digits", "decimal_places"):
+            lhs = getattr(dp, attr)
+            rhs = getattr(expected, attr)
+            assert lhs == rhs or (is_nan(lhs) and is_nan(rhs))
+
+    def test_normal_repr(self):
+        dp = DataProperty(-12.234, is_retain_data=False)
+
+        assert str(dp) == (
+            "data=None, typename=FLOAT, align=right, str_len=6, "
+            "integer_digits=2, decimal_places=2, additional_format_len=1")
+
+    def test_normal_column(self):
+        value_list = [1, -2.25, "a", None]
+        col_prop = ColumnDataProperty(distinct_precision=10)
+        expected = ColumnDataProperty(distinct_precision=10)
+        for value in value_list:
+            col_prop.update_body(DataProperty(value, is_retain_data=False))
+            expected.update_body(DataProperty(value))
+
+        assert str(col_prop) == str(expected)
+        assert col_prop.padding_len == expected.padding_len
+        assert col_prop.count == 4
+        assert col_prop.minmax_value.min_value is None
+        assert col_prop.approx_distinct == 0
+
+
+class Test_get_typecode_and_str_len:
+
+    @pytest.mark.parametrize(["value", "none_value", "is_convert"], [
+        [0, None, True],
+        [-12345, None, True],
+        [10 ** 30, None, True],
+        [-12.234, None, True],
+        [0.001, None, True],
+        [1e-10, None, True],
+        [nan, None, True],
+        ["-1", None, True],
+        ["-1", None, False],
+        ["-0.25", None, True],
+        ["a\tb", None, True],
+        ["2017-01-01T00:00:00-0500", None, True],
+        ["2017-01-01T00:00:00-0500", None, False],
+        [DATATIME_DATA, None, True],
+        [None, None, True],
+        [None, "null", True],
+        [None, "a\tb", True],
+    ])
+    def test_normal(self, value, none_value, is_convert):
+        dp = DataProperty(value, none_value, is_convert)
+
+        typecode, str_len = get_typecode_and_str_len(
+            value, none_value, is_convert)
+
+        assert typecode == dp.typecode
+        assert str(str_len) == str(dp.str_len)
+
+
 class Test_ColumnDataPeroperty:
     DATATIME_DATA = datetime.datetime(2017, 1, 1)
 
@@ -359,6 +440,267 @@ class Test_ColumnDataPeroperty:
         assert col_prop.padding_len == 0
 
 
+class Test_ColumnDataPeroperty_statistics:
+
+    def test_normal(self):
+        col_prop = ColumnDataProperty()
+        col_prop.update_header(DataProperty("abcdefg"))
+
+        for value in [1, 2.5, None, "abc", None, 4.5]:
+            col_prop.update_body(DataProperty(value))
+
+        assert col_prop.count == 6
+        assert col_prop.null_count == 2
+        assert col_prop.null_ratio == pytest.approx(2.0 / 6)
+        assert col_prop.typecode_count_table == {
+            Typecode.INT: 1,
+            Typecode.FLOAT: 2,
+            Typecode.NONE: 2,
+            Typecode.STRING: 1,
+        }
+        assert col_prop.moment.count == 3
+        assert col_prop.moment.mean() == pytest.approx(8.0 / 3)
+        assert col_prop.moment.variance() == pytest.approx(
+            ((1 - 8.0 / 3) ** 2 + (2.5 - 8.0 / 3) ** 2 +
+             (4.5 - 8.0 / 3) ** 2) / 3)
+        assert col_prop.str_len_histogram == {1: 1, 3: 3, 4: 2}
+
+    def test_null(self):
+        col_prop = ColumnDataProperty()
+
+        assert col_prop.count == 0
+        assert col_prop.null_count == 0
+        assert is_nan(col_prop.null_ratio)
+        assert col_prop.typecode_count_table == {}
+        assert col_prop.moment.count == 0
+        assert col_prop.str_len_histogram == {}
+
+
+class Test_ColumnDataPeroperty_approx_distinct:
+
+    def test_normal(self):
+        col_prop = ColumnDataProperty(distinct_precision=10)
+        other = ColumnDataProperty(distinct_precision=10)
+
+        for value in [1, 2, 2, None, "a", "2"]:
+            col_prop.update_body(DataProperty(value))
+        for value in [1, 3, None]:
+            other.update_body(DataProperty(value))
+
+        assert col_prop.approx_distinct == 3
+
+        col_prop.merge(other)
+        assert col_prop.approx_distinct == 4
+
+    def test_null(self):
+        col_prop = ColumnDataProperty()
+        col_prop.update_body(DataProperty(1))
+
+        assert col_prop.distinct_sketch is None
+        assert is_nan(col_prop.approx_distinct)
+
+
+class Test_ColumnDataPeroperty_storage_dtype:
+
+    @pytest.mark.parametrize(["value_list", "expected"], [
+        [[1, 2, 127], "int8"],
+        [[0, 255], "uint8"],
+        [[-1, 200], "int16"],
+        [[None, 65535], "uint16"],
+        [[1, 70000], "int32"],
+        [[-1, 2 ** 31], "int64"],
+        [[2 ** 63], "uint64"],
+        [[-1, 2 ** 64], "object"],
+        [[1.5, -2.25, nan], "float32"],
+        [[1, 0.125], "float32"],
+        [[123456.7], "float64"],
+        [[1.23456789], "float64"],
+        [[1e-40], "float64"],
+        [[1e+39], "float64"],
+        [[DATATIME_DATA], "datetime64[us]"],
+        [[1, "a"], "object"],
+        [[None], "object"],
+        [[], "object"],
+    ])
+    def test_normal(self, value_list, expected):
+        col_prop = ColumnDataProperty()
+        for value in value_list:
+            col_prop.update_body(DataProperty(value))
+
+        assert col_prop.storage_dtype == expected
+
+    @pytest.mark.parametrize(["value_list", "expected"], [
+        [[100000], None],
+        [[1.23456789], None],
+        [[DATATIME_DATA], "datetime64[us]"],
+        [["a"], "object"],
+    ])
+    def test_normal_width_only(self, value_list, expected):
+        prop_extractor = PropertyExtractor()
+        prop_extractor.data_matrix = [[value] for value in value_list]
+        prop_extractor.is_width_only = True
+        col_prop = prop_extractor.extract_column_property_list()[0]
+
+        # the value range is unknown
+        assert col_prop.storage_dtype == expected
+
+    def test_normal_minmax(self):
+        col_prop = ColumnDataProperty()
+        for value in [1, -2.5, nan, "100", None, "a"]:
+            col_prop.update_body(DataProperty(value))
+
+        assert col_prop.minmax_value == MinMaxContainer([-2.5, 100])
+        assert col_prop.minmax_significant_digits == MinMaxContainer([1, 2])
+
+
+class Test_ColumnDataPeroperty_merge:
+
+    @pytest.mark.parametrize(["lhs", "rhs"], [
+        [[0, -1.234], [55.55, None]],
+        [[0, -1.234, 55.55], ["abcdefg"]],
+        [[datetime.datetime(2017, 1, 1)], [1]],
+        [[], [1, 2.5]],
+        [[1, 2.5], []],
+    ])
+    def test_normal(self, lhs, rhs):
+        col_prop = ColumnDataProperty()
+        col_prop.update_header(DataProperty("abc"))
+        for value in lhs:
+            col_prop.update_body(DataProperty(value))
+
+        other = ColumnDataProperty()
+        for value in rhs:
+            other.update_body(DataProperty(value))
+
+        expected = ColumnDataProperty()
+        expected.update_header(DataProperty("abc"))
+        for value in lhs + rhs:
+            expected.update_body(DataProperty(value))
+
+        col_prop.merge(other)
+
+        assert str(col_prop) == str(expected)
+        assert col_prop.typecode_count_table == expected.typecode_count_table
+        assert col_prop.str_len_histogram == expected.str_len_histogram
+        assert col_prop.moment.count == expected.moment.count
+        assert col_prop.null_count == expected.null_count
+
+
+class Test_ColumnDataPeroperty_update_body_count:
+
+    @pytest.mark.parametrize(["value_count_list", "is_removable"], [
+        [[(0, 3), (-1.234, 2), (None, 4)], False],
+        [[(1, 1), ("abcdefg", 5)], False],
+        [[(datetime.datetime(2017, 1, 1), 2), (1, 2)], False],
+        [[(1, 3), (2.5, 2)], True],
+    ])
+    def test_normal(self, value_count_list, is_removable):
+        col_prop = ColumnDataProperty(is_removable=is_removable)
+        expected = ColumnDataProperty(is_removable=is_removable)
+        for value, count in value_count_list:
+            col_prop.update_body(DataProperty(value), count)
+            for _i in range(count):
+                expected.update_body(DataProperty(value))
+
+        assert str(col_prop) == str(expected)
+        assert col_prop.typecode_count_table == expected.typecode_count_table
+        assert col_prop.str_len_histogram == expected.str_len_histogram
+        assert col_prop.moment.count == expected.moment.count
+        assert col_prop.moment.mean() == pytest.approx(
+            expected.moment.mean(), nan_ok=True)
+        assert col_prop.moment.variance() == pytest.approx(
+            expected.moment.variance(), nan_ok=True)
+
+        if is_removable:
+            value, _count = value_count_list[0]
+            col_prop.remove_body(DataProperty(value))
+            expected.remove_body(DataProperty(value))
+
+            assert str(col_prop) == str(expected)
+
+
+class Test_ColumnDataPeroperty_update_body_width:
+
+    @pytest.mark.parametrize(["value_list"], [
+        [[1, -22, 3]],
+        [[1.5, -0.001, 100]],
+        [["a", 1, DATATIME_DATA]],
+        [[DATATIME_DATA, None]],
+        [[None, None]],
+    ])
+    def test_normal(self, value_list):
+        col_prop = ColumnDataProperty(min_padding_len=2)
+        expected = ColumnDataProperty(min_padding_len=2)
+        for value in value_list:
+            col_prop.update_body_width(*get_typecode_and_str_len(value))
+            expected.update_body(DataProperty(value))
+
+        assert col_prop.typecode == expected.typecode
+        assert col_prop.align == expected.align
+        assert col_prop.padding_len == expected.padding_len
+        assert col_prop.typecode_count_table == expected.typecode_count_table
+        assert col_prop.str_len_histogram == expected.str_len_histogram
+
+    def test_normal_count(self):
+        col_prop = ColumnDataProperty()
+        col_prop.update_body_width(Typecode.INT, 3, 4)
+
+        assert col_prop.count == 4
+        assert col_prop.str_len_histogram == {3: 4}
+
+
+class Test_ColumnDataPeroperty_remove_body:
+
+    @pytest.mark.parametrize(["value_list", "remove_list"], [
+        [[0, -1.234, 55.55], [55.55]],
+        [[0, -1.234, 55.55, "abcdefg"], ["abcdefg"]],
+        [[0, -1.234, 55.55, "abcdefg"], [0, "abcdefg"]],
+        [[1, datetime.datetime(2017, 1, 1)], [1]],
+        [[None, 1, 1.5], [1.5, None]],
+    ])
+    def test_normal(self, value_list, remove_list):
+        col_prop = ColumnDataProperty(is_removable=True)
+        col_prop.update_header(DataProperty("abc"))
+        for value in value_list:
+            col_prop.update_body(DataProperty(value))
+        for value in remove_list:
+            col_prop.remove_body(DataProperty(value))
+
+        expected = ColumnDataProperty()
+        expected.update_header(DataProperty("abc"))
+        for value in value_list:
+            if value in remove_list:
+                continue
+            expected.update_body(DataProperty(value))
+
+        assert col_prop.is_removable
+        assert col_prop.typecode == expected.typecode
+        assert str(col_prop) == str(expected)
+
+    @pytest.mark.parametrize(["is_removable", "value", "expected"], [
+        [False, 1, RuntimeError],
+        [True, 12, ValueError],
+        [True, "a", ValueError],
+    ])
+    def test_exception(self, is_removable, value, expected):
+        col_prop = ColumnDataProperty(is_removable=is_removable)
+        col_prop.update_body(DataProperty(1))
+
+        with pytest.raises(expected):
+            col_prop.remove_body(DataProperty(value))
+
+    def test_exception_unchanged(self):
+        col_prop = ColumnDataProperty(is_removable=True)
+        col_prop.update_body(DataProperty(1))
+        expected = str(col_prop)
+
+        with pytest.raises(ValueError):
+            col_prop.remove_body(DataProperty(12))
+
+        assert str(col_prop) == expected
+        assert col_prop.typecode_count_table == {Typecode.INT: 1}
+
+
 class Test_PropertyExtractor_extract_data_property_matrix:
 
     @pytest.mark.parametrize(["value", "non_value"], [
@@ -410,6 +752,30 @@ class Test_PropertyExtractor_extract_data_property_matrix:
         assert is_nan(prop.decimal_places)
         assert prop.format_str == "s"
 
+    def test_normal_is_retain_data(self, prop_extractor):
+        prop_extractor.data_matrix = [
+            [None, 1],
+            ["1.1", "a"],
+        ]
+        expected = prop_extractor.extract_data_property_matrix()
+
+        prop_extractor.is_retain_data = False
+        prop_matrix = prop_extractor.extract_data_property_matrix()
+
+        for prop_list, expected_list in zip(prop_matrix, expected):
+            for prop, expected_prop in zip(prop_list, expected_list):
+                assert prop.data is None
+                assert prop.typecode == expected_prop.typecode
+                assert prop.str_len == expected_prop.str_len
+
+        prop_matrix = prop_extractor.extract_data_property_matrix_view()
+        assert prop_matrix[1, 0].data is None
+        assert prop_matrix[1, 0].typecode == Typecode.FLOAT
+
+        # column properties keep the value statistics
+        col_prop = prop_extractor.extract_column_property_list()[0]
+        assert col_prop.minmax_value.max_value == 1.1
+
     @pytest.mark.parametrize(["value", "expected"], [
         [None, TypeError],
     ])
@@ -486,6 +852,55 @@ class Test_PropertyExtractor_extract_column_property_list:
         assert prop.decimal_places == 1
         assert prop.format_str == "s"
 
+    @pytest.mark.parametrize(["value", "expected"], [
+        [
+            [[1, "aa"], [2], [], None, [4, "b", 1.5]],
+            [
+                [1, "aa", None],
+                [2, None, None],
+                [None, None, None],
+                [None, None, None],
+                [4, "b", 1.5],
+            ],
+        ],
+        [[[], []], []],
+    ])
+    def test_normal_jagged(self, prop_extractor, value, expected):
+        prop_extractor.none_value = "null"
+        prop_extractor.data_matrix = value
+        col_prop_list = prop_extractor.extract_column_property_list()
+
+        prop_extractor.data_matrix = expected
+        expected_list = prop_extractor.extract_column_property_list()
+
+        assert len(col_prop_list) == len(expected_list)
+        for col_prop, expected in zip(col_prop_list, expected_list):
+            assert str(col_prop) == str(expected)
+            assert col_prop.typecode_count_table == (
+                expected.typecode_count_table)
+            assert col_prop.str_len_histogram == expected.str_len_histogram
+
+    @pytest.mark.parametrize(["executor_type"], [
+        [ExecutorType.SERIAL],
+        [ExecutorType.THREAD],
+        [ExecutorType.PROCESS],
+        [ExecutorType.AUTO],
+    ])
+    def test_normal_longer_than_header(self, prop_extractor, executor_type):
+        prop_extractor.header_list = ["a"]
+        prop_extractor.data_matrix = [[1, 2], [3], [4, 5, "c"]]
+        prop_extractor.executor_type = executor_type
+        col_prop_list = prop_extractor.extract_column_property_list()
+
+        assert len(col_prop_list) == 3
+        assert [col_prop.typecode for col_prop in col_prop_list] == [
+            Typecode.INT, Typecode.INT, Typecode.STRING]
+        # str_len of None is len("None")
+        assert [col_prop.padding_len for col_prop in col_prop_list] == [
+            1, 4, 4]
+        assert [col_prop.null_count for col_prop in col_prop_list] == [
+            0, 1, 2]
+
     @pytest.mark.parametrize(["header_list", "value", "expected"], [
         [
             None,
@@ -503,3 +918,35 @@ class Test_PropertyExtractor_extract_column_property_list:
             prop_extractor.header_list = header_list
             prop_extractor.data_matrix = value
             prop_extractor.extract_column_property_list()
+
+
+class Test_PropertyExtractor_is_width_only:
+
+    @pytest.mark.parametrize(["executor_type", "shard_type"], [
+        [ExecutorType.SERIAL, ShardType.AUTO],
+        [ExecutorType.THREAD, ShardType.ROW],
+        [ExecutorType.THREAD, ShardType.COLUMN],
+    ])
+    def test_normal(self, prop_extractor, executor_type, shard_type):
+        prop_extractor.header_list = ["i", "f", "s", "if", "mix"]
+        prop_extractor.data_matrix = [
+            [1, 1.1, "aa", 1, 1],
+            [2, -2.2, "bbb", 2.2, 2.2],
+            [3, 3.33, "cccc", -3, "ccc"],
+            [None, "4.444", None],
+        ]
+        prop_extractor.executor_type = executor_type
+        prop_extractor.shard_type = shard_type
+        prop_extractor.chunk_size = 2
+        expected_list = prop_extractor.extract_column_property_list()
+
+        prop_extractor.is_width_only = True
+        col_prop_list = prop_extractor.extract_column_property_list()
+
+        assert len(col_prop_list) == len(expected_list)
+        for col_prop, expected in zip(col_prop_list, expected_list):
+            assert col_prop.typecode == expected.typecode
+            assert col_prop.align == expected.align
+            assert col_prop.padding_len == expected.padding_len
+            assert col_prop.null_count == expected.null_count
+            assert col_prop.str_len_histogram == expected.str_len_histogram
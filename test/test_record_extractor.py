@@ -0,0 +1,91 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from dataproperty import *
+
+from helper import extract_column_property_list
+from helper import assert_column_property_list_equal
+
+
+TEST_RECORD_LIST = [
+    OrderedDict([("i", 1), ("f", 1.1)]),
+    OrderedDict([("f", 2.25), ("i", 2), ("s", "aa")]),
+    OrderedDict([("i", -3)]),
+    OrderedDict([("s", "2017-01-01 00:00:00"), ("f", None)]),
+]
+
+
+class Test_RecordPropertyExtractor_extract_column_property_list:
+
+    @pytest.mark.parametrize(["header_list", "value", "expected"], [
+        [
+            [], TEST_RECORD_LIST,
+            extract_column_property_list(
+                ["i", "f", "s"],
+                [
+                    [1, 1.1, None],
+                    [2, 2.25, "aa"],
+                    [-3, None, None],
+                    [None, None, "2017-01-01 00:00:00"],
+                ]),
+        ],
+        [
+            ["s", "i", "x"], TEST_RECORD_LIST,
+            extract_column_property_list(
+                ["s", "i", "x"],
+                [
+                    [None, 1, None],
+                    ["aa", 2, None],
+                    [None, -3, None],
+                    ["2017-01-01 00:00:00", None, None],
+                ]),
+        ],
+        [[], iter(TEST_RECORD_LIST[:1]), extract_column_property_list(
+            ["i", "f"], [[1, 1.1]])],
+        [[], [], []],
+    ])
+    def test_normal(self, header_list, value, expected):
+        prop_extractor = RecordPropertyExtractor()
+        prop_extractor.header_list = header_list
+        prop_extractor.record_list = value
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(), expected)
+
+    def test_normal_header_only(self):
+        prop_extractor = RecordPropertyExtractor()
+        prop_extractor.header_list = ["abc"]
+
+        column_prop_list = prop_extractor.extract_column_property_list()
+        assert len(column_prop_list) == 1
+        assert column_prop_list[0].count == 0
+        assert column_prop_list[0].padding_len == 3
+
+    @pytest.mark.parametrize(["header_list"], [
+        [[]],
+        [["s", "i", "x"]],
+    ])
+    def test_normal_width_only(self, header_list):
+        prop_extractor = RecordPropertyExtractor()
+        prop_extractor.header_list = header_list
+        prop_extractor.record_list = TEST_RECORD_LIST
+        expected_list = prop_extractor.extract_column_property_list()
+
+        prop_extractor.is_width_only = True
+        col_prop_list = prop_extractor.extract_column_property_list()
+
+        assert len(col_prop_list) == len(expected_list)
+        for col_prop, expected in zip(col_prop_list, expected_list):
+            assert col_prop.typecode == expected.typecode
+            assert col_prop.padding_len == expected.padding_len
+            assert col_prop.null_count == expected.null_count
+            assert col_prop.str_len_histogram == expected.str_len_histogram
+            # value statistics are not updated
+            assert col_prop.moment.count == 0
@@ -0,0 +1,165 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import copy
+import datetime
+import pickle
+
+import pytest
+import pytz
+import six
+
+from dataproperty import *
+from dataproperty._serialize import Reader
+from dataproperty._serialize import Writer
+
+
+nan = float("nan")
+
+TEST_DATA_MATRIX = [
+    [1, 1.1, "aa", datetime.datetime(2017, 1, 1), None],
+    [-2, 2.2, "bbb", datetime.datetime(2017, 1, 2), "abc"],
+    [six.MAXSIZE * 4, -3.33, "cccc", datetime.datetime(2017, 1, 3), 1],
+]
+
+
+def extract_column_property_list(is_removable, distinct_precision):
+    prop_extractor = PropertyExtractor()
+    prop_extractor.header_list = ["a", "b", "c", "d", "e"]
+    prop_extractor.data_matrix = TEST_DATA_MATRIX
+    prop_extractor.is_removable = is_removable
+    prop_extractor.distinct_precision = distinct_precision
+
+    return prop_extractor.extract_column_property_list()
+
+
+def assert_column_property_equal(lhs, rhs):
+    assert str(lhs) == str(rhs)
+    assert lhs.is_removable == rhs.is_removable
+    assert lhs.typecode_count_table == rhs.typecode_count_table
+    assert lhs.str_len_histogram == rhs.str_len_histogram
+    assert str(lhs.moment) == str(rhs.moment)
+    assert lhs.minmax_value == rhs.minmax_value
+    assert lhs.storage_dtype == rhs.storage_dtype
+    assert str(lhs.approx_distinct) == str(rhs.approx_distinct)
+
+
+class Test_Writer_Reader:
+
+    @pytest.mark.parametrize(["value"], [
+        [None], [True], [False],
+        [0], [1], [-1], [127], [128], [-six.MAXSIZE], [six.MAXSIZE ** 3],
+        [0.0], [-1.5], [float("inf")],
+        [""], ["abc"], [u"あ"], [b"\x00\xff"],
+        [datetime.datetime(2017, 1, 2, 3, 4, 5, 6)],
+        [datetime.datetime(2017, 1, 2, tzinfo=pytz.utc)],
+        [datetime.date(2017, 1, 2)],
+    ])
+    def test_normal(self, value):
+        writer = Writer()
+        writer.write_value(value)
+        writer.write_value(value)
+
+        reader = Reader(writer.to_bytes())
+        assert reader.read_value() == value
+        assert reader.read_value() == value
+
+    def test_normal_nan(self):
+        writer = Writer()
+        writer.write_value(nan)
+
+        assert is_nan(Reader(writer.to_bytes()).read_value())
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            Reader(b"?").read_value()
+
+
+class Test_pickle:
+
+    @pytest.mark.parametrize(["value"], [
+        [MinMaxContainer([1, 3])],
+        [MinMaxContainer()],
+        [MultisetMinMaxContainer([1, 1, 3])],
+        [MomentContainer([1, 2, 3.5])],
+    ])
+    def test_normal_container(self, value):
+        for restored in [
+                pickle.loads(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)),
+                copy.deepcopy(value)]:
+            assert type(restored) == type(value)
+            assert str(restored) == str(value)
+
+        if isinstance(value, MultisetMinMaxContainer):
+            assert restored.count_table == value.count_table
+
+    def test_normal_sketch(self):
+        sketch = HyperLogLog(8)
+        for value in range(100):
+            sketch.add(value)
+
+        restored = pickle.loads(pickle.dumps(sketch, pickle.HIGHEST_PROTOCOL))
+
+        assert restored.register_list == sketch.register_list
+
+    @pytest.mark.parametrize(["value"], [
+        [1], [-1.25], ["abc"], [None], [nan],
+        [datetime.datetime(2017, 1, 1)],
+    ])
+    def test_normal_data_property(self, value):
+        dataprop = DataProperty(value)
+        restored = pickle.loads(
+            pickle.dumps(dataprop, pickle.HIGHEST_PROTOCOL))
+
+        assert str(restored) == str(dataprop)
+        assert restored.align is dataprop.align
+        assert restored.typecode == dataprop.typecode
+
+    @pytest.mark.parametrize(["is_removable", "distinct_precision"], [
+        [False, None],
+        [True, None],
+        [False, 8],
+    ])
+    def test_normal_column_property(self, is_removable, distinct_precision):
+        column_prop_list = extract_column_property_list(
+            is_removable, distinct_precision)
+        restored_list = pickle.loads(
+            pickle.dumps(column_prop_list, pickle.HIGHEST_PROTOCOL))
+
+        for restored, column_prop in zip(restored_list, column_prop_list):
+            assert_column_property_equal(restored, column_prop)
+
+
+class Test_dumps_loads_column_property_list:
+
+    @pytest.mark.parametrize(["is_removable", "distinct_precision"], [
+        [False, None],
+        [True, None],
+        [False, 8],
+    ])
+    def test_normal(self, is_removable, distinct_precision):
+        column_prop_list = extract_column_property_list(
+            is_removable, distinct_precision)
+        data = dumps_column_property_list(column_prop_list)
+        restored_list = loads_column_property_list(data)
+
+        assert len(restored_list) == len(column_prop_list)
+        for restored, column_prop in zip(restored_list, column_prop_list):
+            assert_column_property_equal(restored, column_prop)
+
+        restored_list[1].update_body(DataProperty(100.125))
+        assert restored_list[1].minmax_value.max_value == 100.125
+
+    def test_normal_empty(self):
+        assert loads_column_property_list(dumps_column_property_list([])) == []
+
+    @pytest.mark.parametrize(["data"], [
+        [b"\x04XXXX\x01\x00"],
+        [b"\x04DPCL\x63\x00"],
+    ])
+    def test_exception(self, data):
+        with pytest.raises(ValueError):
+            loads_column_property_list(data)
@@ -0,0 +1,84 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+from dataproperty import *
+from dataproperty._sketch import _get_bit_length
+import pytest
+from six.moves import range
+
+
+class Test_get_bit_length:
+
+    @pytest.mark.parametrize(["value", "expected"], [
+        [0, 0],
+        [1, 1],
+        [255, 8],
+        [256, 9],
+        [2 ** 64 - 1, 64],
+    ])
+    def test_normal(self, value, expected):
+        assert _get_bit_length(value) == expected
+
+
+class Test_HyperLogLog_approx_distinct:
+
+    @pytest.mark.parametrize(["value_list", "expected"], [
+        [[], 0],
+        [[1, 1, 1], 1],
+        [["a", "b", "a", 1], 3],
+        [[i % 100 for i in range(1000)], 100],
+    ])
+    def test_normal_small(self, value_list, expected):
+        sketch = HyperLogLog()
+        for value in value_list:
+            sketch.add(value)
+
+        assert sketch.approx_distinct() == expected
+
+    @pytest.mark.parametrize(["precision", "distinct_count"], [
+        [10, 20000],
+        [12, 50000],
+    ])
+    def test_normal_large(self, precision, distinct_count):
+        sketch = HyperLogLog(precision)
+        for value in range(distinct_count):
+            sketch.add(value)
+
+        error_rate = 1.04 / (2 ** precision) ** 0.5
+        assert sketch.approx_distinct() == pytest.approx(
+            distinct_count, rel=error_rate * 4)
+        assert len(sketch.register_list) == 2 ** precision
+
+    @pytest.mark.parametrize(["precision"], [
+        [HyperLogLog.MIN_PRECISION - 1],
+        [HyperLogLog.MAX_PRECISION + 1],
+    ])
+    def test_exception(self, precision):
+        with pytest.raises(ValueError):
+            HyperLogLog(precision)
+
+
+class Test_HyperLogLog_merge:
+
+    def test_normal(self):
+        lhs = HyperLogLog()
+        rhs = HyperLogLog()
+        expected = HyperLogLog()
+
+        for value in range(0, 3000):
+            lhs.add(value)
+            expected.add(value)
+        for value in range(2000, 5000):
+            rhs.add(value)
+            expected.add(value)
+
+        lhs.merge(rhs)
+
+        assert lhs.register_list == expected.register_list
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(12))
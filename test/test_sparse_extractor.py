@@ -0,0 +1,133 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import pytest
+
+from dataproperty import *
+
+from helper import extract_column_property_list
+from helper import assert_column_property_list_equal
+
+
+TEST_DATA_MATRIX = [
+    [1, None, None, None],
+    [None, None, "aa", None],
+    [None, -2.25, None, None],
+    [None, None, None, None],
+    [3, None, "2017-01-01 00:00:00", None],
+]
+TEST_CELL_TABLE = {
+    (0, 0): 1,
+    (1, 2): "aa",
+    (2, 1): -2.25,
+    (4, 0): 3,
+    (4, 2): "2017-01-01 00:00:00",
+}
+TEST_COLUMN_LIST = [
+    ([0, 4], [1, 3]),
+    ([2], [-2.25]),
+    ([1, 4], ["aa", "2017-01-01 00:00:00"]),
+    ([], []),
+]
+
+
+class Test_SparsePropertyExtractor_extract_column_property_list:
+
+    @pytest.mark.parametrize(
+        ["header_list", "value", "row_count", "expected"], [
+            [
+                [], TEST_CELL_TABLE, None,
+                extract_column_property_list([], [
+                    data_list[:3] for data_list in TEST_DATA_MATRIX]),
+            ],
+            [
+                ["a", "b", "c", "d"], TEST_CELL_TABLE, None,
+                extract_column_property_list(
+                    ["a", "b", "c", "d"], TEST_DATA_MATRIX),
+            ],
+            [
+                ["a", "b", "c", "d"], TEST_COLUMN_LIST, None,
+                extract_column_property_list(
+                    ["a", "b", "c", "d"], TEST_DATA_MATRIX),
+            ],
+            [
+                [], TEST_COLUMN_LIST, 7,
+                extract_column_property_list(
+                    [], TEST_DATA_MATRIX + [[None] * 4] * 2),
+            ],
+            [
+                [], {(0, 0): None, (1, 1): "a"}, None,
+                extract_column_property_list([], [[None, None], [None, "a"]]),
+            ],
+            [["a"], {}, 2, extract_column_property_list(["a"], [[None]] * 2)],
+            [
+                ["a"], TEST_COLUMN_LIST, None,
+                extract_column_property_list(["a"], TEST_DATA_MATRIX),
+            ],
+            [[], {}, None, []],
+        ])
+    def test_normal(self, header_list, value, row_count, expected):
+        prop_extractor = SparsePropertyExtractor()
+        prop_extractor.header_list = header_list
+        prop_extractor.sparse_matrix = value
+        prop_extractor.row_count = row_count
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(), expected)
+
+    @pytest.mark.parametrize(["none_value"], [
+        [None],
+        ["null"],
+    ])
+    def test_normal_none_value(self, none_value):
+        prop_extractor = SparsePropertyExtractor()
+        prop_extractor.sparse_matrix = TEST_CELL_TABLE
+        prop_extractor.none_value = none_value
+        column_prop_list = prop_extractor.extract_column_property_list()
+
+        prop_extractor = PropertyExtractor()
+        prop_extractor.data_matrix = [
+            data_list[:3] for data_list in TEST_DATA_MATRIX]
+        prop_extractor.none_value = none_value
+
+        assert_column_property_list_equal(
+            column_prop_list, prop_extractor.extract_column_property_list())
+
+    def test_normal_width_only(self):
+        prop_extractor = SparsePropertyExtractor()
+        prop_extractor.sparse_matrix = TEST_COLUMN_LIST
+        prop_extractor.is_width_only = True
+        expected_list = extract_column_property_list([], TEST_DATA_MATRIX)
+
+        for col_prop, expected in zip(
+                prop_extractor.extract_column_property_list(), expected_list):
+            assert col_prop.typecode == expected.typecode
+            assert col_prop.padding_len == expected.padding_len
+            assert col_prop.null_count == expected.null_count
+
+    def test_exception(self):
+        prop_extractor = SparsePropertyExtractor()
+        prop_extractor.sparse_matrix = TEST_CELL_TABLE
+        prop_extractor.row_count = 4
+
+        with pytest.raises(ValueError):
+            prop_extractor.extract_column_property_list()
+
+
+class Test_SparsePropertyExtractor_extract_data_property_matrix:
+
+    @pytest.mark.parametrize(["value"], [
+        [TEST_CELL_TABLE],
+        [TEST_COLUMN_LIST],
+    ])
+    def test_normal(self, value):
+        prop_extractor = SparsePropertyExtractor()
+        prop_extractor.sparse_matrix = value
+        prop_table = prop_extractor.extract_data_property_matrix()
+
+        assert sorted(prop_table) == sorted(TEST_CELL_TABLE)
+        for key, dataprop in prop_table.items():
+            assert str(dataprop) == str(DataProperty(TEST_CELL_TABLE[key]))
@@ -0,0 +1,171 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import sqlite3
+
+import pytest
+
+from dataproperty import *
+from dataproperty._sqlite_extractor import get_sqlite_affinity
+
+from helper import extract_column_property_list
+from helper import assert_column_property_list_equal
+
+
+TEST_DATA_MATRIX = [
+    [1, 1.1, "aa", "1"],
+    [2, 2.25, "bbb", "2017-01-01 00:00:00"],
+    [-3, None, "aa", "1"],
+    [None, -0.5, "1.5", "1"],
+    [2, 1, "", None],
+    [2, 1.0, "bbb", 12],
+]
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute(
+        "CREATE TABLE test (i INTEGER, f REAL, s TEXT, a)")
+    connection.executemany(
+        "INSERT INTO test VALUES (?, ?, ?, ?)", TEST_DATA_MATRIX)
+
+    return connection
+
+
+def fetch_data_matrix(connection, query="SELECT * FROM test", parameters=()):
+    return [list(row) for row in connection.execute(query, parameters)]
+
+
+class Test_get_sqlite_affinity:
+
+    @pytest.mark.parametrize(["value", "expected"], [
+        ["INTEGER", "INTEGER"],
+        ["BIGINT", "INTEGER"],
+        ["VARCHAR(16)", "TEXT"],
+        ["text", "TEXT"],
+        ["BLOB", "BLOB"],
+        ["", "BLOB"],
+        [None, "BLOB"],
+        ["DOUBLE PRECISION", "REAL"],
+        ["DECIMAL(10,5)", "NUMERIC"],
+        ["DATETIME", "NUMERIC"],
+    ])
+    def test_normal(self, value, expected):
+        assert get_sqlite_affinity(value) == expected
+
+
+class Test_SqlitePropertyExtractor_extract_column_property_list:
+
+    @pytest.mark.parametrize(["is_aggregate_pushdown", "batch_size"], [
+        [False, 1],
+        [False, 1024],
+        [True, 1],
+        [True, 1024],
+    ])
+    def test_normal(self, connection, is_aggregate_pushdown, batch_size):
+        prop_extractor = SqlitePropertyExtractor()
+        prop_extractor.connection = connection
+        prop_extractor.table_name = "test"
+        prop_extractor.batch_size = batch_size
+        prop_extractor.is_aggregate_pushdown = is_aggregate_pushdown
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(),
+            extract_column_property_list(
+                ["i", "f", "s", "a"], fetch_data_matrix(connection)))
+
+    @pytest.mark.parametrize(["is_aggregate_pushdown"], [
+        [False],
+        [True],
+    ])
+    def test_normal_query(self, connection, is_aggregate_pushdown):
+        prop_extractor = SqlitePropertyExtractor()
+        prop_extractor.connection = connection
+        prop_extractor.query = "SELECT i, s FROM test WHERE i > ?"
+        prop_extractor.query_parameters = (1, )
+        prop_extractor.header_list = ["x", "y"]
+        prop_extractor.is_aggregate_pushdown = is_aggregate_pushdown
+
+        assert_column_property_list_equal(
+            prop_extractor.extract_column_property_list(),
+            extract_column_property_list(
+                ["x", "y"],
+                fetch_data_matrix(
+                    connection, "SELECT i, s FROM test WHERE i > ?", (1, ))))
+
+    @pytest.mark.parametrize(["is_aggregate_pushdown"], [
+        [False],
+        [True],
+    ])
+    def test_normal_width_only(self, connection, is_aggregate_pushdown):
+        prop_extractor = SqlitePropertyExtractor()
+        prop_extractor.connection = connection
+        prop_extractor.table_name = "test"
+        prop_extractor.is_aggregate_pushdown = is_aggregate_pushdown
+        prop_extractor.is_width_only = True
+        expected_list = extract_column_property_list(
+            ["i", "f", "s", "a"], fetch_data_matrix(connection))
+
+        col_prop_list = prop_extractor.extract_column_property_list()
+
+        assert len(col_prop_list) == len(expected_list)
+        for col_prop, expected in zip(col_prop_list, expected_list):
+            assert col_prop.typecode == expected.typecode
+            assert col_prop.padding_len == expected.padding_len
+            assert col_prop.null_count == expected.null_count
+            assert col_prop.str_len_histogram == expected.str_len_histogram
+            # value statistics are not updated
+            assert col_prop.moment.count == 0
+
+    @pytest.mark.parametrize(["is_aggregate_pushdown"], [
+        [False],
+        [True],
+    ])
+    def test_normal_declared_type(self, connection, is_aggregate_pushdown):
+        # values that do not match the declared types
+        connection.executemany("INSERT INTO test VALUES (?, ?, ?, ?)", [
+            ["x", "2017-01-01 00:00:00", 123, 4],
+            [1.5, "-1", "123", None],
+        ])
+
+        prop_extractor = SqlitePropertyExtractor()
+        prop_extractor.connection = connection
+        prop_extractor.table_name = "test"
+        prop_extractor.is_declared_type = True
+        prop_extractor.is_aggregate_pushdown = is_aggregate_pushdown
+
+        column_prop_list = prop_extractor.extract_column_property_list()
+
+        # the results are the same as without the declared types
+        assert_column_property_list_equal(
+            column_prop_list,
+            extract_column_property_list(
+                ["i", "f", "s", "a"], fetch_data_matrix(connection)))
+        assert column_prop_list[2].typecode_count_table[Typecode.INT] == 2
+
+    def test_null(self, connection):
+        connection.execute("CREATE TABLE empty (a INTEGER)")
+
+        prop_extractor = SqlitePropertyExtractor()
+        prop_extractor.connection = connection
+        prop_extractor.table_name = "empty"
+
+        column_prop_list = prop_extractor.extract_column_property_list()
+        assert len(column_prop_list) == 1
+        assert column_prop_list[0].count == 0
+
+    def test_exception(self, connection):
+        prop_extractor = SqlitePropertyExtractor()
+        prop_extractor.connection = connection
+
+        with pytest.raises(ValueError):
+            prop_extractor.extract_column_property_list()
+
+        prop_extractor.table_name = "test"
+        prop_extractor.cache = ColumnPropertyCache("unused")
+        with pytest.raises(ValueError):
+            prop_extractor.extract_column_property_list()
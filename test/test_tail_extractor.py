@@ -0,0 +1,140 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import os
+
+import pytest
+
+from dataproperty import *
+from dataproperty._tail_extractor import find_last_record_end
+
+from helper import extract_column_property_list
+from helper import assert_column_property_list_equal
+
+
+def append(path, text):
+    with open(path, "ab") as f:
+        f.write(text.encode("utf-8"))
+
+
+class Test_find_last_record_end:
+
+    @pytest.mark.parametrize(["value", "expected"], [
+        [b"", 0],
+        [b"a,b", 0],
+        [b"a,b\n", 4],
+        [b"a,b\nc", 4],
+        [b'a,b\n"c\nd', 4],
+        [b'a,b\n"c\nd"\n', 10],
+        [b'a,"b\n""c""\n', 0],
+        [b'a,"b\n""c"""\n', 12],
+        [b'1,5"inch\n2,b\n', 13],
+        [b'1,5"inch\n2,"b\n', 9],
+    ])
+    def test_normal(self, value, expected):
+        assert find_last_record_end(value, b'"') == expected
+
+
+class Test_TailPropertyExtractor_poll:
+
+    def test_normal(self, tmpdir):
+        path = str(tmpdir.join("test.log"))
+        append(path, "i,s\n1,aa\n2,b")
+
+        prop_extractor = TailPropertyExtractor()
+        prop_extractor.source_path = path
+
+        assert_column_property_list_equal(
+            prop_extractor.poll(),
+            extract_column_property_list(["i", "s"], [["1", "aa"]]))
+        assert prop_extractor.file_header_list == ["i", "s"]
+        assert prop_extractor.row_count == 1
+
+        # complete the partial line and a quoted multi-line record
+        append(path, 'bb\n3,"c\n')
+        prop_extractor.poll()
+        assert prop_extractor.row_count == 2
+
+        append(path, 'cc"\n')
+        assert_column_property_list_equal(
+            prop_extractor.poll(),
+            extract_column_property_list(
+                ["i", "s"], [["1", "aa"], ["2", "bbb"], ["3", "c\ncc"]]))
+        assert prop_extractor.offset == os.path.getsize(path)
+
+        # no change
+        prop_extractor.poll()
+        assert prop_extractor.row_count == 3
+
+    def test_normal_unquoted_quote(self, tmpdir):
+        path = str(tmpdir.join("test.log"))
+        append(path, 'i,s\n1,5"inch\n')
+
+        prop_extractor = TailPropertyExtractor()
+        prop_extractor.source_path = path
+        prop_extractor.poll()
+        assert prop_extractor.file_header_list == ["i", "s"]
+        assert prop_extractor.row_count == 1
+
+        append(path, '2,aa\n3,"b\nc"\n4,d\n')
+        assert_column_property_list_equal(
+            prop_extractor.poll(),
+            extract_column_property_list(
+                ["i", "s"],
+                [["1", '5"inch'], ["2", "aa"], ["3", "b\nc"], ["4", "d"]]))
+
+    def test_normal_truncate(self, tmpdir):
+        path = str(tmpdir.join("test.log"))
+        append(path, "i,s\n1,aa\n2,bbb\n")
+
+        prop_extractor = TailPropertyExtractor()
+        prop_extractor.source_path = path
+        prop_extractor.poll()
+
+        with open(path, "wb") as f:
+            f.write(b"x\n1.5\n")
+
+        assert_column_property_list_equal(
+            prop_extractor.poll(),
+            extract_column_property_list(["x"], [["1.5"]]))
+        assert prop_extractor.file_header_list == ["x"]
+
+    def test_normal_truncate_grown(self, tmpdir):
+        path = str(tmpdir.join("test.log"))
+        append(path, "i,s\n1,aa\n")
+
+        prop_extractor = TailPropertyExtractor()
+        prop_extractor.source_path = path
+        prop_extractor.poll()
+
+        # truncated in place, and grown beyond the previous offset
+        with open(path, "wb") as f:
+            f.write(b"x\n1.5\n2.5\n3.5\n")
+
+        assert_column_property_list_equal(
+            prop_extractor.poll(),
+            extract_column_property_list(
+                ["x"], [["1.5"], ["2.5"], ["3.5"]]))
+        assert prop_extractor.file_header_list == ["x"]
+        assert prop_extractor.offset == os.path.getsize(path)
+
+    def test_normal_rotate(self, tmpdir):
+        path = str(tmpdir.join("test.log"))
+        append(path, "1,aa\n")
+
+        prop_extractor = TailPropertyExtractor()
+        prop_extractor.source_path = path
+        prop_extractor.header_list = ["i", "s"]
+        prop_extractor.poll()
+
+        os.rename(path, path + ".1")
+        assert prop_extractor.poll() == prop_extractor.column_property_list
+
+        append(path, "1,aa\n2,bbbb\n3,c\n")
+        assert_column_property_list_equal(
+            prop_extractor.poll(),
+            extract_column_property_list(
+                ["i", "s"], [["1", "aa"], ["2", "bbbb"], ["3", "c"]]))
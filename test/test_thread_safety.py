@@ -0,0 +1,194 @@
+# encoding: utf-8
+
+"""
+.. codeauthor:: Tsuyoshi Hombashi <gogogo.vm@gmail.com>
+"""
+
+import datetime
+import random
+import sys
+import threading
+
+import pytest
+from six.moves import range
+
+from dataproperty import *
+from dataproperty.converter import DateTimeConverter
+
+
+THREAD_COUNT = 8
+
+random.seed(0)
+TEST_HEADER_LIST = ["i", "f", "s", "dt", "mix"]
+TEST_DATA_MATRIX = [
+    [
+        i,
+        random.uniform(-1000, 1000),
+        "s" * (i % 13),
+        datetime.datetime(2017, 1, 1 + i % 28),
+        random.choice([i, "%.2f" % (i / 7.0), None, "abc", "2017-01-01"]),
+    ]
+    for i in range(100)
+]
+
+
+def make_extractor(**kwargs):
+    prop_extractor = PropertyExtractor()
+    prop_extractor.header_list = TEST_HEADER_LIST
+    prop_extractor.data_matrix = TEST_DATA_MATRIX
+    for key, value in kwargs.items():
+        setattr(prop_extractor, key, value)
+
+    return prop_extractor
+
+
+def to_comparable(column_prop_list):
+    return [
+        (
+            str(column_prop),
+            column_prop.typecode_count_table,
+            column_prop.str_len_histogram,
+            column_prop.minmax_value,
+            column_prop.moment.count,
+        )
+        for column_prop in column_prop_list
+    ]
+
+
+def run_concurrently(func, thread_count=THREAD_COUNT):
+    result_list = [None] * thread_count
+    error_list = []
+    # threading.Barrier is not available on Python 2
+    start_event = threading.Event()
+
+    def run(idx):
+        try:
+            start_event.wait()
+            result_list[idx] = func(idx)
+        except Exception as e:
+            error_list.append(e)
+
+    thread_list = [
+        threading.Thread(target=run, args=(idx,))
+        for idx in range(thread_count)
+    ]
+    for thread in thread_list:
+        thread.start()
+    start_event.set()
+    for thread in thread_list:
+        thread.join()
+
+    assert error_list == []
+
+    return result_list
+
+
+@pytest.fixture(scope="module")
+def expected():
+    return to_comparable(make_extractor().extract_column_property_list())
+
+
+class Test_PropertyExtractor_concurrent:
+
+    def test_normal_shared_extractor(self, expected):
+        prop_extractor = make_extractor()
+
+        for result in run_concurrently(
+                lambda _idx: prop_extractor.extract_column_property_list()):
+            assert to_comparable(result) == expected
+
+    def test_normal_separate_extractor(self, expected):
+        def extract(idx):
+            return make_extractor(
+                chunk_size=idx + 1).extract_column_property_list()
+
+        for result in run_concurrently(extract):
+            assert to_comparable(result) == expected
+
+    @pytest.mark.parametrize(["shard_type", "chunk_size"], [
+        [ShardType.ROW, 7],
+        [ShardType.ROW, None],
+        [ShardType.COLUMN, 1],
+    ])
+    def test_normal_thread_executor(self, expected, shard_type, chunk_size):
+        prop_extractor = make_extractor(
+            executor_type=ExecutorType.THREAD, max_workers=4,
+            shard_type=shard_type, chunk_size=chunk_size)
+
+        for result in run_concurrently(
+                lambda _idx: prop_extractor.extract_column_property_list(),
+                thread_count=4):
+            assert to_comparable(result) == expected
+
+    def test_normal_align_getter(self, expected):
+        typecode_align_table = {
+            Typecode.STRING: Align.LEFT,
+            Typecode.INT: Align.RIGHT,
+            Typecode.FLOAT: Align.RIGHT,
+        }
+
+        def extract(idx):
+            if idx % 2 == 0:
+                for _i in range(100):
+                    align_getter.typecode_align_table = typecode_align_table
+                return None
+
+            return make_extractor().extract_column_property_list()
+
+        for result in run_concurrently(extract):
+            if result is not None:
+                assert to_comparable(result) == expected
+
+
+class Test_IncrementalPropertyExtractor_concurrent:
+
+    def test_normal(self, expected):
+        incremental_extractor = IncrementalPropertyExtractor()
+        incremental_extractor.header_list = TEST_HEADER_LIST
+        incremental_extractor.append_rows(TEST_DATA_MATRIX[:1])
+
+        def append(idx):
+            incremental_extractor.append_rows(
+                TEST_DATA_MATRIX[1:][idx::THREAD_COUNT])
+
+        run_concurrently(append)
+
+        assert incremental_extractor.row_count == len(TEST_DATA_MATRIX)
+        for (lhs, rhs) in zip(
+                to_comparable(incremental_extractor.column_property_list),
+                expected):
+            assert lhs[:4] == rhs[:4]
+
+
+class Test_DateTimeConverter_concurrent:
+
+    def test_normal_cache_overflow(self, monkeypatch):
+        # the parse cache is cleared by a thread while others read it
+        monkeypatch.setattr(
+            DateTimeConverter, "_DateTimeConverter__PARSE_CACHE_SIZE", 2)
+        DateTimeConverter.clear_cache()
+        value_list = [
+            "2017-01-%02d 00:00:%02d" % (day, sec)
+            for day in range(1, 29) for sec in range(0, 60, 15)
+        ]
+        expected = sorted(
+            DateTimeConverter(value).convert() for value in value_list)
+
+        def convert(idx):
+            return [
+                DateTimeConverter(value).convert()
+                for value in value_list[idx:] + value_list[:idx]
+            ]
+
+        switch_interval = getattr(sys, "getswitchinterval", lambda: None)()
+        if switch_interval is not None:
+            # switch threads often to interleave the cache accesses
+            sys.setswitchinterval(1e-6)
+
+        try:
+            for result_list in run_concurrently(convert):
+                assert sorted(result_list) == expected
+        finally:
+            if switch_interval is not None:
+                sys.setswitchinterval(switch_interval)
+            DateTimeConverter.clear_cache()